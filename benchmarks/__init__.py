@@ -0,0 +1 @@
+"""Benchmarks for the Transfermarkt MCP server."""
@@ -0,0 +1,104 @@
+"""
+Throughput of concurrent tool calls: blocking client path vs async path.
+
+Starts a local stub API with a fixed per-request latency and drives
+``get_player_profile`` through an in-memory FastMCP client at several
+concurrency levels. The "sync" server registers the tool the way it was
+written before the async client existed (a plain function calling
+``client.get``); the "async" server is the real ``create_mcp_server()``.
+Both share the global client, built with the response cache disabled so
+every call at every level reaches the stub.
+
+Usage:
+    python -m benchmarks.bench_async_client [--latency 0.05] [--calls 200]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from fastmcp import Client, FastMCP
+
+from benchmarks.stub_api import StubAPI
+
+
+def create_sync_server() -> FastMCP:
+    """Build a server exposing the blocking, pre-async tool implementation."""
+    from transfermarkt_mcp.client import client
+
+    mcp = FastMCP(name="Transfermarkt MCP Server (sync)")
+
+    def get_player_profile(player_id: str) -> Dict[str, Any]:
+        return client.get(f"players/{player_id}/profile")
+
+    mcp.tool()(get_player_profile)
+    return mcp
+
+
+async def run_calls(server: FastMCP, concurrency: int, calls: int) -> float:
+    """Issue ``calls`` tool calls with ``concurrency`` in flight; return calls/s."""
+    queue: "asyncio.Queue[int]" = asyncio.Queue()
+    for i in range(calls):
+        queue.put_nowait(i)
+
+    async with Client(server) as mcp_client:
+
+        async def worker() -> None:
+            while not queue.empty():
+                i = queue.get_nowait()
+                await mcp_client.call_tool("get_player_profile", {"player_id": str(i)})
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return calls / (time.perf_counter() - start)
+
+
+async def run_levels(
+    servers: Dict[str, FastMCP], levels: List[int], calls: int
+) -> List[Dict[str, float]]:
+    """Measure every server at every concurrency level on one event loop."""
+    from transfermarkt_mcp.client import client
+
+    try:
+        return [
+            {
+                name: await run_calls(server, concurrency, calls)
+                for name, server in servers.items()
+            }
+            for concurrency in levels
+        ]
+    finally:
+        await client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    from transfermarkt_mcp.config import config
+
+    # The global client is built on first access, so it comes up uncached
+    with patch.object(config, "cache_enabled", False):
+        from transfermarkt_mcp.client import client
+    from transfermarkt_mcp.server import create_mcp_server
+
+    with StubAPI(latency=args.latency) as stub:
+        client.base_url = stub.base_url
+        servers = {"sync": create_sync_server(), "async": create_mcp_server()}
+        # One event loop for every level: the client's async session is
+        # bound to the loop that opened it
+        levels = asyncio.run(run_levels(servers, args.concurrency, args.calls))
+
+    print(f"stub latency {args.latency * 1000:.0f} ms, {args.calls} calls")
+    print(f"{'concurrency':>11} {'sync calls/s':>13} {'async calls/s':>14}")
+    for concurrency, results in zip(args.concurrency, levels):
+        print(f"{concurrency:>11} {results['sync']:>13.1f} {results['async']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+TCP handshakes paid by the client under concurrency, per pool configuration.
+
+Starts a local stub API that counts accepted connections and issues the
+same number of uncached requests through each client path with a fixed
+number of workers. "before" is the pool the client used to create
+(urllib3's default of 10 connections per host and httpx's defaults);
+"after" is the pool configured from the environment (HTTP_POOL_MAXSIZE,
+HTTP_MAX_KEEPALIVE, ...). With more workers than pooled connections the
+sync client discards connections after use and reconnects, which shows up
+as extra handshakes; "no-ka" (HTTP_KEEPALIVE=false) pays one handshake
+per request.
+
+Usage:
+    python -m benchmarks.bench_connection_pool [--workers 32] [--requests 1000]
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+from unittest.mock import patch
+
+import httpx
+
+from benchmarks.stub_api import StubAPI
+
+# Settings reproducing the client's pool before it was configurable
+BEFORE = {"pool_connections": 10, "pool_maxsize": 10}
+
+
+def make_client(base_url: str, settings: Dict[str, object]):
+    """Build an uncached client with ``settings`` applied to the config."""
+    from transfermarkt_mcp.client import TransfermarktClient
+    from transfermarkt_mcp.config import config
+
+    with patch.multiple(config, cache_enabled=False, **settings):
+        client = TransfermarktClient()
+    client.base_url = base_url
+    if settings is BEFORE:
+        # The async client used httpx's own default limits
+        client._create_async_session = httpx.AsyncClient
+    return client
+
+
+def run_sync(stub: StubAPI, settings, workers: int, requests: int) -> Tuple[int, float]:
+    """Return (handshakes, requests/s) for the blocking path."""
+    client = make_client(stub.base_url, settings)
+    start_connections = stub.connections
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda i: client.get(f"players/{i}/profile"), range(requests)))
+    elapsed = time.perf_counter() - start
+    client.close()
+    return stub.connections - start_connections, requests / elapsed
+
+
+def run_async(
+    stub: StubAPI, settings, workers: int, requests: int
+) -> Tuple[int, float]:
+    """Return (handshakes, requests/s) for the async path."""
+    client = make_client(stub.base_url, settings)
+    start_connections = stub.connections
+
+    async def drive() -> float:
+        calls = [(f"players/{i}/profile", None) for i in range(requests)]
+        start = time.perf_counter()
+        await client.aget_many(calls, concurrency=workers)
+        elapsed = time.perf_counter() - start
+        await client.aclose()
+        return elapsed
+
+    elapsed = asyncio.run(drive())
+    return stub.connections - start_connections, requests / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    after: Dict[str, object] = {}
+    with StubAPI(latency=args.latency) as stub:
+        print(
+            f"stub latency {args.latency * 1000:.0f} ms, "
+            f"{args.requests} requests, {args.workers} workers"
+        )
+        print(f"{'path':>6} {'pool':>7} {'handshakes':>11} {'requests/s':>11}")
+        for path, run in (("sync", run_sync), ("async", run_async)):
+            for label, settings in (
+                ("before", BEFORE),
+                ("after", after),
+                ("no-ka", {"keepalive": False}),
+            ):
+                handshakes, rate = run(stub, settings, args.workers, args.requests)
+                print(f"{path:>6} {label:>7} {handshakes:>11} {rate:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+JSON decode/encode cost of upstream responses and tool results.
+
+Payloads mirror the shapes of the test fixtures (a club squad, a player's
+season stats, club search results) scaled up to realistic and large
+sizes. For each available backend it times decoding a response body and
+encoding a tool result, then compares producing a tool result's text the
+way FastMCP does by default (indented pydantic JSON of the dict) with the
+pass-through of the response bytes.
+
+Usage:
+    python -m benchmarks.bench_json [--sizes 25 250 2500] [--repeat 20]
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any, Callable, Dict, List
+
+from fastmcp.tools.tool import default_serializer
+
+from transfermarkt_mcp import jsonlib
+
+
+def squad_payload(size: int) -> Dict[str, Any]:
+    """A ``clubs/{id}/players`` response with ``size`` players."""
+    return {
+        "id": "27",
+        "updatedAt": "2024-01-01T00:00:00",
+        "players": [
+            {
+                "id": str(8198 + i),
+                "name": f"Robert Lewandowski {i}",
+                "position": "Centre-Forward",
+                "dateOfBirth": "1988-08-21",
+                "age": 35,
+                "nationality": ["Poland"],
+                "height": 185,
+                "foot": "right",
+                "joinedOn": "2022-07-19",
+                "contract": "2026-06-30",
+                "marketValue": 15000000 + i,
+                "status": "Team captain",
+            }
+            for i in range(size)
+        ],
+    }
+
+
+def stats_payload(size: int) -> Dict[str, Any]:
+    """A ``players/{id}/stats`` response with ``size`` competition rows."""
+    return {
+        "id": "8198",
+        "updatedAt": "2024-01-01T00:00:00",
+        "stats": [
+            {
+                "competitionId": "ES1",
+                "competitionName": "LaLiga",
+                "seasonId": str(2000 + i % 25),
+                "clubId": "131",
+                "appearances": "34",
+                "goals": "19",
+                "assists": "8",
+                "yellowCards": "3",
+                "minutesPlayed": "2.880'",
+            }
+            for i in range(size)
+        ],
+    }
+
+
+def search_payload(size: int) -> Dict[str, Any]:
+    """A ``clubs/search`` response with ``size`` results."""
+    return {
+        "query": "Galatasaray",
+        "pageNumber": 1,
+        "lastPageNumber": 20,
+        "results": [
+            {
+                "id": str(114 + i),
+                "name": "Fenerbahçe" if i % 2 else "Galatasaray",
+                "country": "Turkey",
+                "marketValue": "€125.00m",
+            }
+            for i in range(size)
+        ],
+    }
+
+
+PAYLOADS: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "squad": squad_payload,
+    "stats": stats_payload,
+    "search": search_payload,
+}
+
+
+def per_call_us(fn: Callable[[], Any], repeat: int) -> float:
+    """Best-of-3 microseconds per call of ``fn``."""
+    return min(timeit.repeat(fn, number=repeat, repeat=3)) / repeat * 1e6
+
+
+def available_backends() -> List[str]:
+    names = []
+    for name in jsonlib.BACKENDS:
+        try:
+            jsonlib._load_backend(name)
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 250, 2500])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    backends = {name: jsonlib._load_backend(name) for name in available_backends()}
+    print(f"backends: {', '.join(backends)} (selected: {jsonlib.BACKEND})")
+    print(
+        f"{'payload':>8} {'KiB':>7} {'backend':>8} {'decode us':>10} {'encode us':>10}"
+    )
+    for name, build in PAYLOADS.items():
+        for size in args.sizes:
+            body = json.dumps(build(size)).encode()
+            for backend, (loads, dumps) in backends.items():
+                value = loads(body)
+                decode = per_call_us(lambda: loads(body), args.repeat)
+                encode = per_call_us(lambda: dumps(value), args.repeat)
+                print(
+                    f"{name:>8} {len(body) / 1024:>7.1f} {backend:>8} "
+                    f"{decode:>10.1f} {encode:>10.1f}"
+                )
+
+    print()
+    print("tool result text, microseconds per result")
+    print(
+        f"{'payload':>8} {'KiB':>7} {'fastmcp':>9} {'fast dict':>10} {'raw bytes':>10}"
+    )
+    for name, build in PAYLOADS.items():
+        for size in args.sizes:
+            body = json.dumps(build(size)).encode()
+            value = jsonlib.loads(body)
+            raw = jsonlib.decode_body(body, keep_raw=True)
+            default = per_call_us(lambda: default_serializer(value), args.repeat)
+            fast = per_call_us(
+                lambda: jsonlib.serialize_tool_result(value), args.repeat
+            )
+            passthrough = per_call_us(
+                lambda: jsonlib.serialize_tool_result(raw), args.repeat
+            )
+            print(
+                f"{name:>8} {len(body) / 1024:>7.1f} {default:>9.1f} "
+                f"{fast:>10.1f} {passthrough:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Memory held by cached squads as plain dicts versus typed models.
+
+Fills a ResponseCache with ``--squads`` club squads of ``--players``
+players each (the payload of ``bench_json``), once storing the decoded
+dicts and once storing the slots models, and reports the traced
+allocation per entry along with the cost of building a model and of
+rebuilding the dict on a cache hit.
+
+Usage:
+    python -m benchmarks.bench_models [--squads 500] [--players 30]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import List
+
+from benchmarks.bench_json import per_call_us, squad_payload
+from transfermarkt_mcp import jsonlib
+from transfermarkt_mcp.cache import ResponseCache
+from transfermarkt_mcp.models import ClubSquad
+
+
+def filled_cache_bytes(bodies: List[bytes], models: bool) -> int:
+    """Traced bytes of a cache holding every decoded body."""
+    gc.collect()
+    tracemalloc.start()
+    cache = ResponseCache(max_entries=len(bodies), models=models)
+    for i, body in enumerate(bodies):
+        key = f"clubs/{i}/players"
+        cache.set(key, key, jsonlib.loads(body), size=len(body))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cache
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--squads", type=int, default=500)
+    parser.add_argument("--players", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    bodies = [
+        json.dumps(dict(squad_payload(args.players), id=str(i))).encode()
+        for i in range(args.squads)
+    ]
+    dicts = filled_cache_bytes(bodies, models=False)
+    typed = filled_cache_bytes(bodies, models=True)
+    print(f"{args.squads} squads x {args.players} players")
+    print(f"{'storage':>8} {'MiB':>8} {'KiB/entry':>10}")
+    for name, size in (("dict", dicts), ("model", typed)):
+        print(f"{name:>8} {size / 2**20:>8.2f} {size / args.squads / 1024:>10.2f}")
+    print(f"model storage saves {1 - typed / dicts:.0%}")
+
+    value = jsonlib.loads(bodies[0])
+    squad = ClubSquad.from_dict(value)
+    build = per_call_us(lambda: ClubSquad.from_dict(value), args.repeat)
+    expand = per_call_us(squad.to_dict, args.repeat)
+    print(f"from_dict {build:.1f} us, to_dict {expand:.1f} us per squad")
+
+
+if __name__ == "__main__":
+    main()
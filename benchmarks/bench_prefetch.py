@@ -0,0 +1,70 @@
+"""
+Latency of a typical tool chain with and without speculative prefetching.
+
+Each chain searches for a player, then - after a pause standing in for
+the agent's turn - asks for the top result's profile, market value and
+transfers, one call per turn. Prints the mean time spent waiting on
+each step against a stub API with a fixed latency.
+
+Usage:
+    python -m benchmarks.bench_prefetch [--latency 0.1] [--think 0.2] [--chains 5]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+from benchmarks.stub_api import StubAPI
+from transfermarkt_mcp.client import TransfermarktClient
+from transfermarkt_mcp.prefetch import Prefetcher
+
+STEPS = ["search", "profile", "market_value", "transfers"]
+
+
+async def run_chains(
+    base_url: str, chains: int, think: float, prefetch: bool
+) -> Dict[str, float]:
+    """Mean seconds per step over ``chains`` chains with distinct names."""
+    client = TransfermarktClient()
+    client.base_url = base_url
+    if prefetch:
+        client.add_observer(Prefetcher(client, budget=600, concurrency=4).observe)
+
+    waits: Dict[str, List[float]] = {step: [] for step in STEPS}
+    for chain in range(chains):
+        started = time.perf_counter()
+        found = await client.aget(f"players/search/player{chain}")
+        waits["search"].append(time.perf_counter() - started)
+        player_id = found["results"][0]["id"]
+        for step in STEPS[1:]:
+            await asyncio.sleep(think)
+            started = time.perf_counter()
+            await client.aget(f"players/{player_id}/{step}")
+            waits[step].append(time.perf_counter() - started)
+        client.cache.clear()
+    await client.aclose()
+    return {step: sum(times) / len(times) for step, times in waits.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--think", type=float, default=0.2)
+    parser.add_argument("--chains", type=int, default=5)
+    args = parser.parse_args()
+
+    with StubAPI(latency=args.latency) as stub:
+        print(
+            f"stub latency {args.latency * 1000:.0f} ms, "
+            f"think time {args.think * 1000:.0f} ms"
+        )
+        print(f"{'step':>13} {'no prefetch ms':>15} {'prefetch ms':>12}")
+        cold = asyncio.run(run_chains(stub.base_url, args.chains, args.think, False))
+        warm = asyncio.run(run_chains(stub.base_url, args.chains, args.think, True))
+        for step in STEPS:
+            print(f"{step:>13} {cold[step] * 1000:>15.1f} {warm[step] * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
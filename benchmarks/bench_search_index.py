@@ -0,0 +1,84 @@
+"""
+Name lookup latency of the local search index.
+
+Indexes ``--names`` synthetic player names (first name plus surname, some
+accented) and times exact, surname-only and misspelt lookups against
+them, for comparison with an upstream search round trip.
+
+Usage:
+    python -m benchmarks.bench_search_index [--names 50000] [--repeat 200]
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.bench_json import per_call_us
+from transfermarkt_mcp.search_index import SearchIndex
+
+FIRST = [
+    "Robert",
+    "Lionel",
+    "Martin",
+    "Thomas",
+    "Kylian",
+    "Çağlar",
+    "José",
+    "Luka",
+    "Erling",
+    "Harry",
+    "Mohamed",
+    "Virgil",
+    "Kevin",
+    "Joshua",
+    "Jude",
+    "Pedri",
+    "Bruno",
+    "Rúben",
+    "Jan",
+    "Søren",
+    "Ivan",
+    "Mateo",
+    "Ousmane",
+    "Hakan",
+]
+CONSONANTS = "bcdfghjklmnprstvwzšçñ"
+VOWELS = "aeiouyäöüé"
+
+
+def surname(rng: random.Random) -> str:
+    syllables = rng.randint(2, 4)
+    return "".join(
+        rng.choice(CONSONANTS) + rng.choice(VOWELS) for _ in range(syllables)
+    ).title()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--names", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [f"{rng.choice(FIRST)} {surname(rng)}" for _ in range(args.names)]
+    index = SearchIndex(max_entries=args.names)
+    started = time.perf_counter()
+    for i, name in enumerate(names):
+        index.add("player", str(i), name)
+    build = time.perf_counter() - started
+    print(f"indexed {len(index)} names in {build:.2f} s")
+
+    target = names[len(names) // 2]
+    queries = {
+        "exact": target,
+        "surname": target.split()[-1],
+        "typo": target[:-2] + target[-1] + target[-2],
+    }
+    for label, query in queries.items():
+        us = per_call_us(lambda: index.lookup("player", query), args.repeat)
+        top = index.lookup("player", query, limit=1)
+        print(f"{label:>8} {query!r:>28} {us:>9.1f} us  top: {top[0]['name']!r}")
+
+
+if __name__ == "__main__":
+    main()
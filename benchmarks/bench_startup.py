@@ -0,0 +1,191 @@
+"""
+Startup time of the server process, from python -X importtime.
+
+Runs fresh interpreters that import the entry point and, for the server
+stage, create the server and list its tool schemas, as each stdio session
+does before its first call. Prints the median time to each stage, the
+time spent in this package's own modules and server setup, and the
+dependencies that dominate the import. Exits with status 1 if the
+package's own startup cost exceeds ``--budget-ms``, a module that should
+load on first call (``--deferred``) was imported at startup, or creating
+the server built the client; the import stage, which also builds the
+client as the snapshot commands do, must not load fastmcp either.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 5] [--budget-ms 200]
+        [--deferred requests urllib3 numpy] [--top 8]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Sequence
+
+PACKAGE = "transfermarkt_mcp"
+
+# The package's own startup measured 60-130 ms across runs on one core;
+# the budget leaves room for that spread and fails on a real regression
+DEFAULT_BUDGET_MS = 200.0
+
+# Marks the end of the timed imports on the probe's stderr
+UNTIMED = "-- untimed --"
+
+# Also deferred in the import stage: only the server needs fastmcp
+IMPORT_DEFERRED = ["fastmcp"]
+
+# Prints the in-process timings, which deferred modules got loaded and
+# whether setup built the client
+PROBE = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+import transfermarkt_mcp.main as main
+imported = time.perf_counter()
+tools = asyncio.run(main.mcp.get_tools()) if {server} else {{}}
+ready = time.perf_counter()
+client_module = sys.modules.get("transfermarkt_mcp.client")
+built = client_module is not None and client_module._client is not None
+if not {server}:
+    # What the snapshot commands use, untimed: they should not need fastmcp
+    print({untimed!r}, file=sys.stderr, flush=True)
+    import transfermarkt_mcp.metrics
+    from transfermarkt_mcp.client import client
+    client.cache
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "setup_ms": (ready - imported) * 1000,
+    "tools": len(tools),
+    "client_built": built,
+    "loaded": [name for name in {deferred!r} if name in sys.modules],
+}}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """The ``-X importtime`` entries: module, depth, self and cumulative us."""
+    entries = []
+    for line in stderr.splitlines():
+        if line == UNTIMED:
+            break
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        entries.append(
+            {
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+            }
+        )
+    return entries
+
+
+def run_once(server: bool, deferred: Sequence[str]) -> Dict[str, Any]:
+    """Start one interpreter and collect its timings."""
+    code = PROBE.format(server=server, deferred=list(deferred), untimed=UNTIMED)
+    started = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = json.loads(process.stdout.strip().splitlines()[-1])
+    result["process_ms"] = (time.perf_counter() - started) * 1000
+    result["dependencies"] = dependencies(parse_importtime(process.stderr))
+    result["own_ms"] = (
+        result["import_ms"] + result["setup_ms"] - sum(result["dependencies"].values())
+    )
+    return result
+
+
+def dependencies(entries: List[Dict[str, Any]]) -> Dict[str, float]:
+    """
+    Cumulative import ms per top-level package, counting the modules this
+    package imports directly, at module level or from a function (depth
+    0, once the package has started loading); what they import in turn is
+    part of their time.
+    """
+    first = next(
+        (i for i, entry in enumerate(entries) if entry["module"].startswith(PACKAGE)),
+        len(entries),
+    )
+    totals: Dict[str, float] = defaultdict(float)
+    # Children are listed before their parent, so walk backwards
+    parents: Dict[int, str] = {}
+    for i in range(len(entries) - 1, -1, -1):
+        module, depth = entries[i]["module"], entries[i]["depth"]
+        parents[depth] = module
+        if module.startswith(PACKAGE):
+            continue
+        if (depth == 0 and i > first) or (
+            depth > 0 and parents[depth - 1].startswith(PACKAGE)
+        ):
+            totals[module.split(".")[0]] += entries[i]["cumulative_us"] / 1000
+    return dict(totals)
+
+
+def median_of(runs: List[Dict[str, Any]], key: str) -> float:
+    return statistics.median(run[key] for run in runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument(
+        "--deferred", nargs="*", default=["requests", "urllib3", "numpy"]
+    )
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    failures = []
+    print(
+        f"{'stage':>8} {'process ms':>11} {'import ms':>10} {'setup ms':>9} "
+        f"{'own ms':>8} {'tools':>6}"
+    )
+    for stage, server in (("import", False), ("server", True)):
+        deferred = args.deferred + ([] if server else IMPORT_DEFERRED)
+        runs = [run_once(server, deferred) for _ in range(args.runs)]
+        own_ms = median_of(runs, "own_ms")
+        print(
+            f"{stage:>8} {median_of(runs, 'process_ms'):>11.1f} "
+            f"{median_of(runs, 'import_ms'):>10.1f} "
+            f"{median_of(runs, 'setup_ms'):>9.1f} {own_ms:>8.1f} "
+            f"{runs[0]['tools']:>6}"
+        )
+        loaded = sorted({name for run in runs for name in run["loaded"]})
+        if loaded:
+            failures.append(f"{stage}: imported {', '.join(loaded)} at startup")
+        if stage == "server":
+            if any(run["client_built"] for run in runs):
+                failures.append(f"{stage}: built the client during setup")
+            if own_ms > args.budget_ms:
+                failures.append(
+                    f"{stage}: own startup {own_ms:.1f} ms exceeds the "
+                    f"{args.budget_ms:g} ms budget"
+                )
+            packages = defaultdict(list)
+            for run in runs:
+                for package, ms in run["dependencies"].items():
+                    packages[package].append(ms)
+            slowest = sorted(
+                packages.items(), key=lambda item: -statistics.median(item[1])
+            )
+            print("slowest imports:")
+            for package, times in slowest[: args.top]:
+                print(f"{package:>28} {statistics.median(times):>8.1f} ms")
+
+    for failure in failures:
+        print(f"FAILED {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"within the {args.budget_ms:g} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+Latency, throughput and memory of every MCP tool against a stub API.
+
+Starts a stub API in a child process with the given latency, jitter,
+error rate and payload size, then drives each tool through an in-memory
+FastMCP client at several concurrency levels. Every call uses fresh IDs,
+so it goes upstream rather than to the cache. Prints p50/p95/p99 latency,
+throughput and the share of calls returning an error per tool and
+concurrency, plus the memory one call allocates. ``--save`` writes the
+results as JSON; ``--baseline`` compares against a saved run and exits
+with status 1 if any tool regressed by more than ``--tolerance``.
+
+Usage:
+    python -m benchmarks.bench_tools [--latency 0.02] [--jitter 0.01]
+        [--error-rate 0] [--payload-scale 1] [--calls 50]
+        [--concurrency 1 8 32] [--tools search_players get_club_squad_details]
+        [--save run.json] [--baseline run.json --tolerance 0.25]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List
+
+from fastmcp import Client
+
+from benchmarks.stub_api import StubAPIProcess
+
+# Arguments of a tool's n-th call; n is unique across the whole run
+WORKLOAD: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "search_players": lambda n: {"player_name": f"player{n}"},
+    "search_clubs": lambda n: {"club_name": f"club{n}"},
+    "search_competitions": lambda n: {"competition_name": f"league{n}"},
+    "get_player_by_id": lambda n: {"player_id": str(n)},
+    "get_player_profile": lambda n: {"player_id": str(n)},
+    "get_player_market_value": lambda n: {"player_id": str(n)},
+    "get_player_transfers": lambda n: {"player_id": str(n)},
+    "get_player_jersey_numbers": lambda n: {"player_id": str(n)},
+    "get_player_stats": lambda n: {"player_id": str(n)},
+    "get_player_injuries": lambda n: {"player_id": str(n)},
+    "get_player_achievements": lambda n: {"player_id": str(n)},
+    "get_players_batch": lambda n: {"player_ids": [f"{n}x{i}" for i in range(10)]},
+    "get_club_profile": lambda n: {"club_id": str(n)},
+    "get_club_players": lambda n: {"club_id": str(n)},
+    "get_club_squad_details": lambda n: {"club_id": str(n)},
+    "get_competition_clubs": lambda n: {"competition_id": f"C{n}"},
+    "get_competition_details": lambda n: {"competition_id": f"C{n}"},
+    "crawl_competition": lambda n: {"competition_id": f"C{n}"},
+    "analyze_market_values": lambda n: {
+        "player_ids": [f"{n}x{i}" for i in range(10)],
+        "ages": [21, 25],
+    },
+    "get_club_squad_stats": lambda n: {"club_id": str(n)},
+    "resolve_name": lambda n: {"name": f"Player {n}"},
+    "query_transfer_network": lambda n: {"query": "neighbors", "club_id": str(n)},
+}
+
+# Result fields compared against a baseline, and whether higher is better
+METRICS = {"p95_ms": False, "calls_per_s": True, "alloc_kb": False}
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def is_error(result: Any) -> bool:
+    content = result.structured_content
+    return result.is_error or (isinstance(content, dict) and "error" in content)
+
+
+async def run_tool(
+    mcp_client: Client, tool: str, concurrency: int, calls: int, ids: Iterator[int]
+) -> Dict[str, Any]:
+    """Issue ``calls`` calls of ``tool`` with ``concurrency`` in flight."""
+    remaining = iter(range(calls))
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            arguments = WORKLOAD[tool](next(ids))
+            started = time.perf_counter()
+            try:
+                result = await mcp_client.call_tool(
+                    tool, arguments, raise_on_error=False
+                )
+                errors += is_error(result)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "tool": tool,
+        "concurrency": concurrency,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "calls_per_s": calls / elapsed,
+        "errors": errors / calls,
+    }
+
+
+async def allocated_kb(mcp_client: Client, tool: str, ids: Iterator[int]) -> float:
+    """Peak memory allocated in this process by one call of ``tool``."""
+    # A first call pays for lazy imports and first-use setup
+    await mcp_client.call_tool(tool, WORKLOAD[tool](next(ids)), raise_on_error=False)
+    tracemalloc.start()
+    try:
+        await mcp_client.call_tool(
+            tool, WORKLOAD[tool](next(ids)), raise_on_error=False
+        )
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+async def run_suite(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from transfermarkt_mcp.client import client
+    from transfermarkt_mcp.server import create_mcp_server
+
+    server = create_mcp_server()
+    ids = itertools.count(1)
+    rows = []
+    async with Client(server) as mcp_client:
+        registered = [tool.name for tool in await mcp_client.list_tools()]
+        missing = [tool for tool in registered if tool not in WORKLOAD]
+        if missing:
+            print(f"no workload for: {', '.join(missing)}", file=sys.stderr)
+        tools = [tool for tool in args.tools or registered if tool in WORKLOAD]
+
+        for tool in tools:
+            alloc = await allocated_kb(mcp_client, tool, ids)
+            for concurrency in args.concurrency:
+                if client.cache is not None:
+                    client.cache.clear()
+                row = await run_tool(mcp_client, tool, concurrency, args.calls, ids)
+                row["alloc_kb"] = alloc
+                rows.append(row)
+                print(
+                    f"{tool:>26} {concurrency:>5} {row['p50_ms']:>8.1f} "
+                    f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} "
+                    f"{row['calls_per_s']:>9.1f} {row['errors']:>7.1%} {alloc:>9.0f}"
+                )
+    await client.aclose()
+    return rows
+
+
+def regressions(
+    rows: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float
+) -> List[str]:
+    """Describe every metric worse than ``baseline`` by more than ``tolerance``."""
+    before = {(row["tool"], row["concurrency"]): row for row in baseline}
+    found = []
+    for row in rows:
+        old = before.get((row["tool"], row["concurrency"]))
+        if old is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if not old[metric]:
+                continue
+            change = row[metric] / old[metric] - 1
+            if (-change if higher_is_better else change) > tolerance:
+                found.append(
+                    f"{row['tool']} at concurrency {row['concurrency']}: {metric} "
+                    f"{old[metric]:.1f} -> {row[metric]:.1f} ({change:+.0%})"
+                )
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--payload-scale", type=float, default=1.0)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--tools", nargs="+")
+    parser.add_argument("--save", metavar="PATH")
+    parser.add_argument("--baseline", metavar="PATH")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    from transfermarkt_mcp.client import client
+
+    # Per-call INFO logs would dominate both the output and the timings
+    logging.getLogger().setLevel(logging.WARNING)
+    stub = StubAPIProcess(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        payload_scale=args.payload_scale,
+    )
+    with stub:
+        client.base_url = stub.base_url
+        print(
+            f"stub latency {args.latency * 1000:.0f} ms + jitter "
+            f"{args.jitter * 1000:.0f} ms, error rate {args.error_rate:.0%}, "
+            f"payload scale {args.payload_scale:g}, {args.calls} calls"
+        )
+        print(
+            f"{'tool':>26} {'conc':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'calls/s':>9} {'errors':>7} {'alloc KB':>9}"
+        )
+        rows = asyncio.run(run_suite(args))
+
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{stub.requests} upstream requests, peak RSS {max_rss_mb:.0f} MB")
+
+    if args.save:
+        settings = {
+            key: getattr(args, key)
+            for key in ("latency", "jitter", "error_rate", "payload_scale", "calls")
+        }
+        with open(args.save, "w") as out:
+            json.dump({"settings": settings, "results": rows}, out, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as source:
+            baseline = json.load(source)["results"]
+        found = regressions(rows, baseline, args.tolerance)
+        for line in found:
+            print(f"REGRESSION {line}")
+        if found:
+            sys.exit(1)
+        print(f"no regressions beyond {args.tolerance:.0%} of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Query latency of the local transfer graph.
+
+Adds ``--players`` synthetic transfer histories (a few moves each between
+``--clubs`` clubs, with the bigger clubs trading more) and times the
+neighbor, path and flow queries, for comparison with refetching the
+histories behind them.
+
+Usage:
+    python -m benchmarks.bench_transfer_graph [--players 50000] [--clubs 2000]
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.bench_json import per_call_us
+from transfermarkt_mcp.transfer_graph import TransferGraph
+
+
+def pick_club(rng: random.Random, clubs: int) -> int:
+    # Low IDs are the big clubs: club 0 sees a few percent of all moves
+    return int(clubs * rng.random() ** 2)
+
+
+def history(rng: random.Random, clubs: int) -> list:
+    moves = []
+    club = pick_club(rng, clubs)
+    for year in range(2010, 2010 + rng.randint(1, 6)):
+        target = pick_club(rng, clubs)
+        if target == club:
+            continue
+        moves.append(
+            {
+                "date": f"{year}-07-01",
+                "clubFrom": {"id": str(club), "name": f"Club {club}"},
+                "clubTo": {"id": str(target), "name": f"Club {target}"},
+                "fee": f"€{rng.randint(1, 80)}.00m",
+            }
+        )
+        club = target
+    return moves
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=50000)
+    parser.add_argument("--clubs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    graph = TransferGraph(max_players=args.players)
+    started = time.perf_counter()
+    for player_id in range(args.players):
+        graph.add_history(str(player_id), history(rng, args.clubs))
+    build = time.perf_counter() - started
+    stats = graph.stats()
+    print(
+        f"added {stats['transfers']} transfers between {stats['clubs']} clubs "
+        f"in {build:.2f} s"
+    )
+
+    # A busy club and a rarely seen one
+    queries = {
+        "neighbors": lambda: graph.neighbors("1"),
+        "flow": lambda: graph.flow("1", since="2012-01-01"),
+        "flow pair": lambda: graph.flow("1", "2"),
+        "path": lambda: graph.path("1", str(args.clubs - 1), max_hops=4),
+        "path undirected": lambda: graph.path(
+            str(args.clubs - 1), str(args.clubs - 2), max_hops=4, directed=False
+        ),
+    }
+    for label, query in queries.items():
+        us = per_call_us(query, args.repeat)
+        print(f"{label:>16} {us:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
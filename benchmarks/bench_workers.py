@@ -0,0 +1,265 @@
+"""
+Throughput of the multi-worker HTTP server as workers are added.
+
+Starts a stub API and, for each ``--workers`` count, the server with
+``--transport http --workers N`` (stateless HTTP, a shared SQLite cache and
+a shared rate limit), then drives it from ``--clients`` load generator
+processes, each keeping ``--concurrency`` tool calls in flight for
+``--duration`` seconds. Calls cycle through ``--ids`` distinct arguments, so
+after a warm-up pass they are cache hits and measure the server's own CPU
+work. Prints throughput, p50/p95 latency, the error share, and the speedup
+and scaling efficiency relative to the first worker count. Scaling is
+bounded by the cores left over by the load generators: with fewer cores
+than workers + clients the speedup stays near 1 and the run only checks
+that each worker count serves calls without errors.
+
+Usage:
+    python -m benchmarks.bench_workers [--workers 1 2 4] [--clients 4]
+        [--concurrency 16] [--duration 10] [--ids 200]
+        [--tool get_player_profile]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+import httpx
+
+from benchmarks.bench_tools import WORKLOAD, percentile
+from benchmarks.stub_api import StubAPIProcess
+
+HEADERS = {
+    "Accept": "application/json, text/event-stream",
+    "Content-Type": "application/json",
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def tool_call(tool: str, n: int) -> Dict[str, Any]:
+    """A JSON-RPC tools/call request; stateless HTTP needs no session."""
+    return {
+        "jsonrpc": "2.0",
+        "id": n,
+        "method": "tools/call",
+        "params": {"name": tool, "arguments": WORKLOAD[tool](n)},
+    }
+
+
+def succeeded(response: httpx.Response) -> bool:
+    """True for a tool result that is not an error, in JSON or SSE framing."""
+    if response.status_code != 200:
+        return False
+    body = response.text
+    if "text/event-stream" in response.headers.get("content-type", ""):
+        body = next(
+            (line[5:] for line in body.splitlines() if line.startswith("data:")),
+            "{}",
+        )
+    result = json.loads(body).get("result")
+    content = (result or {}).get("structuredContent")
+    return (
+        bool(result)
+        and not result.get("isError")
+        and not (isinstance(content, dict) and "error" in content)
+    )
+
+
+async def drive(
+    url: str, tool: str, ids: List[int], concurrency: int, duration: float
+) -> Tuple[List[float], int]:
+    """Send calls for ``duration`` seconds; returns latencies and errors."""
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30) as http:
+
+        async def worker(offset: int) -> None:
+            nonlocal errors
+            i = offset
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await http.post(
+                        url, json=tool_call(tool, ids[i % len(ids)]), headers=HEADERS
+                    )
+                    errors += not succeeded(response)
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+                i += concurrency
+
+        await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+    return latencies, errors
+
+
+def generator(conn: Any, *args: Any) -> None:
+    """Load generator process body: drive, then send back the results."""
+    conn.send(asyncio.run(drive(*args)))
+
+
+def warm_up(url: str, tool: str, ids: List[int]) -> None:
+    """Call once per argument so the measured calls are cache hits."""
+
+    async def run() -> None:
+        async with httpx.AsyncClient(timeout=60) as http:
+            for start in range(0, len(ids), 16):
+                await asyncio.gather(
+                    *(
+                        http.post(url, json=tool_call(tool, n), headers=HEADERS)
+                        for n in ids[start : start + 16]
+                    )
+                )
+
+    asyncio.run(run())
+
+
+def start_server(workers: int, port: int, env: Dict[str, str]) -> subprocess.Popen:
+    """Start the server and wait until it answers."""
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "transfermarkt_mcp.main",
+            "--transport",
+            "http",
+            "--workers",
+            str(workers),
+            "--port",
+            str(port),
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/metrics").status_code == 200:
+                return server
+        except httpx.HTTPError:
+            pass
+        if server.poll() is not None:
+            break
+        time.sleep(0.2)
+    server.kill()
+    raise RuntimeError(f"server with {workers} workers did not start")
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    server.terminate()
+    try:
+        server.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+def run_workers(
+    args: argparse.Namespace, workers: int, env: Dict[str, str]
+) -> Dict[str, Any]:
+    """Measure one worker count from ``args.clients`` generator processes."""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/mcp/"
+    ids = list(range(1, args.ids + 1))
+    server = start_server(workers, port, env)
+    try:
+        warm_up(url, args.tool, ids)
+        pipes, processes = [], []
+        for _ in range(args.clients):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=generator,
+                args=(child, url, args.tool, ids, args.concurrency, args.duration),
+            )
+            process.start()
+            pipes.append(parent)
+            processes.append(process)
+        latencies: List[float] = []
+        errors = 0
+        for pipe, process in zip(pipes, processes):
+            run_latencies, run_errors = pipe.recv()
+            latencies.extend(run_latencies)
+            errors += run_errors
+            process.join()
+    finally:
+        stop_server(server)
+
+    latencies.sort()
+    return {
+        "workers": workers,
+        "calls_per_s": len(latencies) / args.duration,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "errors": errors / max(1, len(latencies)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--ids", type=int, default=200)
+    parser.add_argument("--tool", default="get_player_profile", choices=WORKLOAD)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    if max(args.workers) + args.clients > cores:
+        print(
+            f"note: {cores} cores for up to {max(args.workers)} workers and "
+            f"{args.clients} load generators; scaling will flatten early",
+            file=sys.stderr,
+        )
+
+    with (
+        tempfile.TemporaryDirectory() as directory,
+        StubAPIProcess(latency=args.latency) as stub,
+    ):
+        env = dict(
+            os.environ,
+            TRANSFERMARKT_API_BASE_URL=stub.base_url,
+            CACHE_PATH=os.path.join(directory, "cache.sqlite3"),
+            RATE_LIMIT_PATH=os.path.join(directory, "ratelimit.sqlite3"),
+            METRICS_ENABLED="true",
+            # Multi-worker mode turns this on; one worker needs it for a fair
+            # comparison, since the requests carry no session
+            HTTP_STATELESS="true",
+            LOG_LEVEL="WARNING",
+        )
+        print(
+            f"{'workers':>7} {'calls/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+            f"{'errors':>7} {'speedup':>8} {'efficiency':>10}"
+        )
+        base = None
+        for workers in args.workers:
+            row = run_workers(args, workers, env)
+            if base is None:
+                base = row
+            speedup = row["calls_per_s"] / base["calls_per_s"]
+            efficiency = speedup / (workers / base["workers"])
+            print(
+                f"{workers:>7} {row['calls_per_s']:>9.1f} {row['p50_ms']:>8.1f} "
+                f"{row['p95_ms']:>8.1f} {row['errors']:>7.1%} {speedup:>7.2f}x "
+                f"{efficiency:>10.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
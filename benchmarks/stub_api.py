@@ -0,0 +1,345 @@
+"""Local stub of the Transfermarkt API used by the benchmarks."""
+
+import json
+import multiprocessing
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+
+# List lengths of each canned response at a payload scale of 1
+LIST_SIZES = {
+    "search": 10,
+    "squad": 25,
+    "league": 20,
+    "market_value": 20,
+    "transfers": 8,
+    "stats": 12,
+    "injuries": 5,
+    "achievements": 6,
+    "jersey_numbers": 6,
+}
+
+POSITIONS = ["Goalkeeper", "Centre-Back", "Central Midfield", "Centre-Forward"]
+
+
+def _money(value: float) -> str:
+    return f"€{value / 1e6:.2f}m"
+
+
+def _season(start: int) -> str:
+    return f"{start % 100:02d}/{(start + 1) % 100:02d}"
+
+
+def _club(rng: random.Random) -> Dict[str, Any]:
+    club_id = rng.randint(1, 5000)
+    return {"id": str(club_id), "name": f"Club {club_id}"}
+
+
+def _player_facet(
+    player_id: str, facet: str, size: int, rng: random.Random
+) -> Dict[str, Any]:
+    """A player's market value, transfers, stats, injuries or other facet."""
+    if facet == "market_value":
+        value = rng.uniform(0.2, 2) * 1e6
+        history = []
+        for i in range(size):
+            value *= rng.uniform(0.8, 1.5)
+            history.append(
+                {
+                    "date": f"{2005 + i // 2}-{1 + 6 * (i % 2):02d}-01",
+                    "age": 17 + i // 2,
+                    "value": _money(value),
+                    "clubName": _club(rng)["name"],
+                }
+            )
+        return {
+            "id": player_id,
+            "marketValue": history[-1]["value"] if history else None,
+            "marketValueHistory": history,
+        }
+    if facet == "transfers":
+        clubs = [_club(rng) for _ in range(size + 1)]
+        return {
+            "id": player_id,
+            "transfers": [
+                {
+                    "id": f"{player_id}-{i}",
+                    "clubFrom": clubs[i],
+                    "clubTo": clubs[i + 1],
+                    "date": f"{2024 - i}-07-01",
+                    "season": _season(2024 - i),
+                    "marketValue": _money(rng.uniform(1, 80) * 1e6),
+                    "fee": rng.choice(
+                        [
+                            "free transfer",
+                            "loan transfer",
+                            _money(rng.uniform(1, 80) * 1e6),
+                        ]
+                    ),
+                }
+                for i in range(size)
+            ],
+        }
+    if facet == "stats":
+        return {
+            "id": player_id,
+            "stats": [
+                {
+                    "competitionId": rng.choice(["GB1", "CL", "FAC"]),
+                    "clubId": str(rng.randint(1, 5000)),
+                    "seasonId": _season(2023 - i // 3),
+                    "appearances": rng.randint(1, 38),
+                    "goals": rng.randint(0, 30),
+                    "assists": rng.randint(0, 15),
+                    "yellowCards": rng.randint(0, 10),
+                    "minutesPlayed": f"{rng.randint(90, 3400):,}'".replace(",", "."),
+                }
+                for i in range(size)
+            ],
+        }
+    if facet == "injuries":
+        return {
+            "id": player_id,
+            "injuries": [
+                {
+                    "season": _season(2023 - i),
+                    "injury": rng.choice(["Hamstring injury", "Knock", "Flu"]),
+                    "days": rng.randint(3, 90),
+                    "gamesMissed": rng.randint(0, 12),
+                }
+                for i in range(size)
+            ],
+        }
+    if facet == "achievements":
+        return {
+            "id": player_id,
+            "achievements": [
+                {"title": f"Trophy {i}", "count": rng.randint(1, 5)}
+                for i in range(size)
+            ],
+        }
+    return {
+        "id": player_id,
+        "jerseyNumbers": [
+            {
+                "season": _season(2023 - i),
+                "club": _club(rng)["id"],
+                "jerseyNumber": rng.randint(1, 99),
+            }
+            for i in range(size)
+        ],
+    }
+
+
+def payload_for(path: str, scale: float = 1.0) -> Dict[str, Any]:
+    """
+    Return a representative response body for an API path; list lengths
+    are LIST_SIZES times ``scale``. Bodies are deterministic per path.
+    """
+    parts = path.split("?", 1)[0].strip("/").split("/")
+    rng = random.Random(zlib.crc32(path.encode()))
+
+    def size(kind: str) -> int:
+        return max(1, round(LIST_SIZES[kind] * scale))
+
+    if len(parts) > 2 and parts[1] == "search":
+        return {
+            "query": parts[2],
+            "pageNumber": 1,
+            "lastPageNumber": 1,
+            "results": [
+                {
+                    "id": str(8198 + i),
+                    "name": f"{parts[2]} {i}",
+                    "position": rng.choice(POSITIONS),
+                    "club": _club(rng),
+                    "age": rng.randint(17, 36),
+                    "country": "Germany",
+                    "marketValue": _money(rng.uniform(1, 100) * 1e6),
+                }
+                for i in range(size("search"))
+            ],
+        }
+    if parts[0] == "players" and len(parts) > 2 and parts[2] in LIST_SIZES:
+        return _player_facet(parts[1], parts[2], size(parts[2]), rng)
+    if parts[0] == "players" and len(parts) > 1:
+        return {
+            "id": parts[1],
+            "name": "Robert Lewandowski",
+            "position": "Centre-Forward",
+            "marketValue": 15000000,
+            "club": {"id": "131", "name": "FC Barcelona"},
+        }
+    if parts[0] == "clubs" and len(parts) > 2 and parts[2] == "players":
+        return {
+            "id": parts[1],
+            "players": [
+                {
+                    "id": str(1000 + i),
+                    "name": f"Player {i}",
+                    "position": rng.choice(POSITIONS),
+                    "age": rng.randint(17, 36),
+                    "marketValue": _money(rng.uniform(1, 100) * 1e6),
+                }
+                for i in range(size("squad"))
+            ],
+        }
+    if parts[0] == "competitions" and len(parts) > 2 and parts[2] == "clubs":
+        return {
+            "id": parts[1],
+            "name": f"League {parts[1]}",
+            "clubs": [
+                {"id": f"{parts[1]}-{i}", "name": f"Club {i}"}
+                for i in range(size("league"))
+            ],
+        }
+    return {"id": parts[-1], "name": "Stub", "results": []}
+
+
+class StubAPIHandler(BaseHTTPRequestHandler):
+    """Serve canned JSON after the server's latency, or an occasional error."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        server = self.server
+        time.sleep(server.delay())
+        with server.lock:
+            server.requests += 1
+            failed = server.rng.random() < server.error_rate
+        if failed:
+            status = 500
+            body = b'{"detail": "Stub error"}'
+        else:
+            status = 200
+            body = json.dumps(payload_for(self.path, server.payload_scale)).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class StubAPIServer(ThreadingHTTPServer):
+    """Threaded HTTP server with a deep accept backlog.
+
+    ``connections`` counts accepted TCP connections, i.e. the handshakes
+    clients paid for; ``requests`` counts requests served over them.
+    Each request waits ``latency`` plus exponentially distributed
+    ``jitter`` (its mean), giving the long tail real APIs have, and fails
+    with HTTP 500 at ``error_rate``.
+    """
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(
+        self,
+        address,
+        latency: float,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        payload_scale: float = 1.0,
+        seed: int = 0,
+    ) -> None:
+        super().__init__(address, StubAPIHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.payload_scale = payload_scale
+        self.rng = random.Random(seed)
+        self.connections = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def delay(self) -> float:
+        if not self.jitter:
+            return self.latency
+        with self.lock:
+            return self.latency + self.rng.expovariate(1 / self.jitter)
+
+    def get_request(self):
+        request = super().get_request()
+        with self.lock:
+            self.connections += 1
+        return request
+
+
+class StubAPI:
+    """Run a stub API server on a background thread."""
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        host: str = "127.0.0.1",
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        payload_scale: float = 1.0,
+        seed: int = 0,
+    ) -> None:
+        self.server = StubAPIServer(
+            (host, 0), latency, jitter, error_rate, payload_scale, seed
+        )
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def connections(self) -> int:
+        return self.server.connections
+
+    @property
+    def requests(self) -> int:
+        return self.server.requests
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubAPI":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _serve(conn: Any, options: Dict[str, Any]) -> None:
+    """Child process body of StubAPIProcess: serve until told to stop."""
+    with StubAPI(**options) as stub:
+        conn.send(stub.base_url)
+        conn.recv()
+        conn.send(stub.requests)
+
+
+class StubAPIProcess:
+    """
+    Run a stub API server in a child process, so its work competes with
+    neither the measured code's GIL nor its memory. Takes StubAPI's
+    arguments; ``requests`` is known once the process has stopped.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        self._conn, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_serve, args=(child, options), daemon=True
+        )
+        self.base_url = ""
+        self.requests = 0
+
+    def __enter__(self) -> "StubAPIProcess":
+        self.process.start()
+        self.base_url = self._conn.recv()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._conn.send("stop")
+        self.requests = self._conn.recv()
+        self.process.join()
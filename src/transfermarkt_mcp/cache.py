@@ -0,0 +1,388 @@
+"""TTL response caches for Transfermarkt API calls."""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from transfermarkt_mcp import jsonlib, models
+
+if TYPE_CHECKING:
+    from transfermarkt_mcp.disk_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+# Endpoint patterns are matched in order, so specific patterns come first.
+DEFAULT_TTLS: List[Tuple[str, float]] = [
+    ("*/search/*", 3600),
+    ("players/*/achievements", 86400),
+    ("players/*/jersey_numbers", 86400),
+    ("players/*/transfers", 21600),
+    ("players/*/profile", 21600),
+    ("players/*/market_value", 3600),
+    ("players/*/stats", 3600),
+    ("players/*/injuries", 3600),
+    ("clubs/*/profile", 86400),
+    ("clubs/*/players", 3600),
+    ("competitions/*/clubs", 86400),
+    ("competitions/*", 86400),
+]
+
+# Keys added to a response served from the cache after its TTL expired
+STALE_FIELDS = ("stale", "cacheAge", "upstreamError")
+
+
+def make_cache_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Build a stable cache key from an endpoint and its query parameters."""
+    key = endpoint.strip("/")
+    if params:
+        query = sorted((k, str(v)) for k, v in params.items() if v is not None)
+        if query:
+            key = f"{key}?{urlencode(query)}"
+    return key
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate the size of a response as its compact JSON length; a
+    response that keeps its raw body is counted twice, without encoding.
+    """
+    if isinstance(value, jsonlib.RawJSON):
+        return 2 * len(value.raw)
+    return len(jsonlib.dumps(value))
+
+
+@dataclass
+class CacheEntry:
+    """A cached response with its freshness metadata."""
+
+    value: Any
+    stored_at: float
+    ttl: float
+    size: int
+    validators: Optional[Dict[str, str]] = None
+
+    def is_fresh(self, now: float) -> bool:
+        return now - self.stored_at < self.ttl
+
+    def is_retained(self, now: float, stale_ttl: float) -> bool:
+        return now - self.stored_at < self.ttl + stale_ttl
+
+
+class TTLPolicy:
+    """Per-endpoint-pattern TTLs shared by the cache backends."""
+
+    def __init__(
+        self, ttls: Optional[List[Tuple[str, float]]] = None, default_ttl: float = 300
+    ) -> None:
+        self.ttls = list(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Return the TTL of the first pattern matching ``endpoint``."""
+        endpoint = endpoint.strip("/")
+        for pattern, ttl in self.ttls:
+            if fnmatchcase(endpoint, pattern):
+                return ttl
+        return self.default_ttl
+
+
+class ResponseCache(TTLPolicy):
+    """
+    Thread-safe LRU cache with per-endpoint-pattern TTLs.
+
+    Eviction keeps the cache within both ``max_entries`` and ``max_bytes``.
+    Expired entries are kept for a further ``stale_ttl`` seconds so they can
+    still be served stale through ``get_stale``. With ``models`` enabled,
+    responses of endpoints with a typed model are stored as that compact
+    model and rebuilt on every read; other cached values are shared between
+    callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[List[Tuple[str, float]]] = None,
+        default_ttl: float = 300,
+        max_entries: int = 2048,
+        max_bytes: int = 64 * 1024 * 1024,
+        stale_ttl: float = 0,
+        models: bool = False,
+    ) -> None:
+        super().__init__(ttls, default_ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl
+        self.models = models
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a fresh cached value, or None on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.is_fresh(now):
+                if entry is not None and not entry.is_retained(now, self.stale_ttl):
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return models.expand(entry.value)
+
+    def contains(self, key: str) -> bool:
+        """Return True if ``key`` is fresh, without counting a lookup."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.is_fresh(time.monotonic())
+
+    def get_stale(self, key: str, max_stale: float) -> Optional[Tuple[Any, float]]:
+        """
+        Return ``(value, age)`` for an entry expired at most ``max_stale``
+        seconds ago (or still fresh), or None.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.is_retained(
+                now, min(max_stale, self.stale_ttl)
+            ):
+                return None
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+        return models.expand(entry.value), now - entry.stored_at
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for ``key``, fresh or stale, without counting it."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.is_retained(now, self.stale_ttl):
+                return None
+        if isinstance(entry.value, models.Model):
+            return replace(entry, value=entry.value.to_dict())
+        return entry
+
+    def set(
+        self,
+        key: str,
+        endpoint: str,
+        value: Any,
+        size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        validators: Optional[Dict[str, str]] = None,
+        age: float = 0.0,
+    ) -> None:
+        """
+        Store ``value`` under ``key`` using the TTL policy for ``endpoint``,
+        with the ETag/Last-Modified ``validators`` it was served with.
+        ``age`` backdates a response fetched that many seconds ago.
+        """
+        ttl = self.ttl_for(endpoint) if ttl is None else ttl
+        if ttl <= 0:
+            return
+        size = estimate_size(value) if size is None else size
+        if size > self.max_bytes:
+            logger.debug(f"Not caching {key}: {size} bytes exceeds cache size")
+            return
+        if self.models:
+            compacted = models.compact(endpoint, value)
+            if compacted is not value and isinstance(value, jsonlib.RawJSON):
+                size //= 2  # the raw body is not kept
+            value = compacted
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CacheEntry(
+                value, time.monotonic() - age, ttl, size, validators
+            )
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.stale_hits = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "stale_hits": self.stale_hits,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+class TieredCache:
+    """
+    A per-process memory cache in front of a shared disk cache.
+
+    Disk hits are promoted into memory for the entry's remaining lifetime,
+    so each process pays the disk read once per entry. The ``a``-prefixed
+    methods are for the event loop: they check memory inline and run disk
+    tier calls in a worker thread.
+    """
+
+    def __init__(self, memory: ResponseCache, disk: "SQLiteCache") -> None:
+        self.memory = memory
+        self.disk = disk
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.memory.ttl_for(endpoint)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a fresh value from memory, falling back to disk."""
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+        found = self.disk.lookup(key)
+        if found is None:
+            return None
+        return self._promote(key, *found)
+
+    def _promote(
+        self,
+        key: str,
+        value: Any,
+        remaining_ttl: float,
+        endpoint: str,
+        validators: Optional[Dict[str, str]],
+    ) -> Any:
+        """Copy a disk hit into memory for the rest of its lifetime."""
+        self.memory.set(key, endpoint, value, ttl=remaining_ttl, validators=validators)
+        return value
+
+    def contains(self, key: str) -> bool:
+        """Return True if either tier holds a fresh ``key``."""
+        return self.memory.contains(key) or self.disk.contains(key)
+
+    def get_stale(self, key: str, max_stale: float) -> Optional[Tuple[Any, float]]:
+        """Return ``(value, age)`` of a recently expired entry from either tier."""
+        found = self.memory.get_stale(key, max_stale)
+        if found is not None:
+            return found
+        return self.disk.get_stale(key, max_stale)
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for ``key``, preferring one that has validators."""
+        entry = self.memory.get_entry(key)
+        if entry is not None and entry.validators:
+            return entry
+        return self.disk.get_entry(key) or entry
+
+    def set(
+        self,
+        key: str,
+        endpoint: str,
+        value: Any,
+        size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        validators: Optional[Dict[str, str]] = None,
+        age: float = 0.0,
+    ) -> None:
+        """Store ``value`` in both tiers."""
+        ttl = self.ttl_for(endpoint) if ttl is None else ttl
+        size = estimate_size(value) if size is None else size
+        for tier in (self.memory, self.disk):
+            tier.set(
+                key, endpoint, value, size=size, ttl=ttl, validators=validators, age=age
+            )
+
+    async def aget(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+        found = await asyncio.to_thread(self.disk.lookup, key)
+        if found is None:
+            return None
+        return self._promote(key, *found)
+
+    async def acontains(self, key: str) -> bool:
+        return self.memory.contains(key) or await asyncio.to_thread(
+            self.disk.contains, key
+        )
+
+    async def aget_stale(
+        self, key: str, max_stale: float
+    ) -> Optional[Tuple[Any, float]]:
+        found = self.memory.get_stale(key, max_stale)
+        if found is not None:
+            return found
+        return await asyncio.to_thread(self.disk.get_stale, key, max_stale)
+
+    async def aget_entry(self, key: str) -> Optional[CacheEntry]:
+        entry = self.memory.get_entry(key)
+        if entry is not None and entry.validators:
+            return entry
+        return await asyncio.to_thread(self.disk.get_entry, key) or entry
+
+    async def aset(
+        self,
+        key: str,
+        endpoint: str,
+        value: Any,
+        size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        validators: Optional[Dict[str, str]] = None,
+        age: float = 0.0,
+    ) -> None:
+        ttl = self.ttl_for(endpoint) if ttl is None else ttl
+        size = estimate_size(value) if size is None else size
+        self.memory.set(
+            key, endpoint, value, size=size, ttl=ttl, validators=validators, age=age
+        )
+        # The insert may also compact the database
+        await asyncio.to_thread(
+            self.disk.set,
+            key,
+            endpoint,
+            value,
+            size=size,
+            ttl=ttl,
+            validators=validators,
+            age=age,
+        )
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self.disk.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return combined counters plus the per-tier breakdown."""
+        memory = self.memory.stats()
+        disk = self.disk.stats()
+        hits = memory["hits"] + disk["hits"]
+        lookups = hits + disk["misses"]
+        return {
+            "hits": hits,
+            "misses": disk["misses"],
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "memory": memory,
+            "disk": disk,
+        }
@@ -1,78 +1,793 @@
 """HTTP client for Transfermarkt API interactions."""
 
-import requests
+import asyncio
+import httpx
 import logging
-from typing import Dict, Any, Optional
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import sqlite3
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Any,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+from transfermarkt_mcp import jsonlib, metrics
+from transfermarkt_mcp.cache import (
+    DEFAULT_TTLS,
+    CacheEntry,
+    ResponseCache,
+    TieredCache,
+    make_cache_key,
+)
 from transfermarkt_mcp.config import config
+from transfermarkt_mcp.ratelimit import (
+    AdaptiveConcurrency,
+    SharedTokenBucket,
+    TokenBucket,
+)
+from transfermarkt_mcp.singleflight import AsyncSingleFlight, SingleFlight
+
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
+# Retry policy shared by the sync and async request paths
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 1
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+RETRY_AFTER_STATUSES = (429, 503)
+
+
+def is_error(result: Any) -> bool:
+    """Return True if ``result`` is an error dictionary from the client."""
+    return isinstance(result, dict) and "error" in result
+
 
 class TransfermarktClient:
     """
     HTTP client for Transfermarkt API with retry logic
     and error handling.
+
+    ``get`` is the blocking path built on ``requests``; ``aget`` is the
+    asyncio-native path built on ``httpx`` and is what the MCP tools use.
+    Both return the decoded JSON body or an ``{"error": ...}`` dictionary,
+    and both read through the response cache when it is enabled.
+    Identical requests already in flight are coalesced into one upstream
+    call whose result is shared by every waiting caller.
+
+    Expired cache entries can still be served, marked ``"stale": true``
+    with their ``"cacheAge"`` in seconds: within
+    ``cache_stale_while_revalidate`` they are returned at once while a
+    background request refreshes them, and within ``cache_stale_if_error``
+    they replace an upstream error.
+
+    Observers registered with ``add_observer`` see every successful
+    response fetched from upstream, e.g. to index the names in it.
     """
 
     def __init__(self) -> None:
         self.base_url = config.base_url.rstrip("/")
-        self.timeout = config.request_timeout
-        self.session = self._create_session()
+        self.timeout = config.read_timeout
+        self.connect_timeout = config.connect_timeout
+        self.limits = httpx.Limits(
+            max_connections=config.pool_maxsize,
+            max_keepalive_connections=config.max_keepalive if config.keepalive else 0,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+        self.http2 = self._http2_enabled()
+        self._session: Optional["requests.Session"] = None
+        # One async session per event loop, as httpx clients are bound to one
+        self._async_sessions: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self.cache = self._create_cache()
+        self.stale_while_revalidate = config.cache_stale_while_revalidate
+        self.stale_if_error = config.cache_stale_if_error
+        self._flight = SingleFlight()
+        self._async_flight = AsyncSingleFlight()
+        self._refreshing: Set["asyncio.Future[Dict[str, Any]]"] = set()
+        self._lock = threading.Lock()
+        self.revalidations = 0
+        self.rate_limiter = self._create_rate_limiter()
+        self.concurrency = self._create_concurrency()
+        self.observers: List[Callable[[str, Any], None]] = []
+
+    def add_observer(self, observer: Callable[[str, Any], None]) -> None:
+        """Call ``observer(endpoint, result)`` for every fetched response."""
+        if observer not in self.observers:
+            self.observers.append(observer)
+
+    def _notify(self, endpoint: str, result: Any) -> None:
+        """Pass a successful upstream response to the observers."""
+        if is_error(result):
+            return
+        for observer in self.observers:
+            try:
+                observer(endpoint, result)
+            except Exception as e:
+                logger.warning(f"Response observer failed for {endpoint}: {e}")
+
+    def _create_rate_limiter(self) -> TokenBucket:
+        """Create the upstream rate limit, shared by all processes if configured."""
+        if config.rate_limit_shared:
+            try:
+                return SharedTokenBucket(
+                    config.rate_limit_path, config.rate_limit, config.rate_limit_burst
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(
+                    f"Could not open shared rate limit {config.rate_limit_path}, "
+                    f"limiting this process alone: {e}"
+                )
+        return TokenBucket(config.rate_limit, config.rate_limit_burst)
+
+    def _create_concurrency(self) -> Optional[AdaptiveConcurrency]:
+        """Create the adaptive in-flight limit, if enabled."""
+        if not config.adaptive_concurrency:
+            return None
+        return AdaptiveConcurrency(
+            initial=config.concurrency_initial,
+            min_limit=config.concurrency_min,
+            max_limit=config.concurrency_max,
+            latency_factor=config.concurrency_latency_factor,
+        )
+
+    def _create_cache(self) -> Optional[Union[ResponseCache, TieredCache]]:
+        """Create the response cache configured for this client, if any."""
+        if not config.cache_enabled:
+            return None
+        ttls = config.cache_ttls + DEFAULT_TTLS
+        stale_ttl = max(
+            config.cache_stale_while_revalidate, config.cache_stale_if_error
+        )
+        memory = ResponseCache(
+            ttls=ttls,
+            default_ttl=config.cache_default_ttl,
+            max_entries=config.cache_max_entries,
+            max_bytes=config.cache_max_bytes,
+            stale_ttl=stale_ttl,
+            models=config.cache_models,
+        )
+        if config.cache_backend != "sqlite":
+            return memory
+
+        from transfermarkt_mcp.disk_cache import SQLiteCache
+
+        try:
+            disk = SQLiteCache(
+                config.cache_path,
+                ttls=ttls,
+                default_ttl=config.cache_default_ttl,
+                max_bytes=config.cache_disk_max_bytes,
+                stale_ttl=stale_ttl,
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(
+                f"Could not open disk cache {config.cache_path}, "
+                f"caching in memory only: {e}"
+            )
+            return memory
+        return TieredCache(memory, disk)
+
+    @property
+    def session(self) -> "requests.Session":
+        """The session of the blocking path, created on first use."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> "requests.Session":
+        """Create a requests session with retry strategy and a sized pool."""
+        # requests is only imported by the blocking path; the tools use httpx
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
 
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry strategy."""
         session = requests.Session()
+        if not config.keepalive:
+            session.headers["Connection"] = "close"
 
         # Configure retry strategy
         retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=list(RETRY_STATUS_FORCELIST),
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # pool_connections is the number of hosts kept, pool_maxsize the
+        # connections kept per host; threads beyond it open throwaway
+        # connections instead of waiting
+        adapter = HTTPAdapter(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            max_retries=retry_strategy,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         return session
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Make an HTTP request with error handling."""
+    def _create_async_session(self) -> httpx.AsyncClient:
+        """Create an httpx async client for the current event loop."""
+        timeout = httpx.Timeout(self.timeout, connect=self.connect_timeout)
+        return httpx.AsyncClient(timeout=timeout, limits=self.limits, http2=self.http2)
+
+    @staticmethod
+    def _http2_enabled() -> bool:
+        """Return True if HTTP/2 is requested and the h2 package is available."""
+        if not config.http2:
+            return False
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("HTTP2 is enabled but h2 is not installed; using HTTP/1.1")
+            return False
+        return True
+
+    def _get_async_session(self) -> httpx.AsyncClient:
+        """
+        Return the async client bound to the running event loop. Opening one
+        also drops the sessions of loops that have since been closed.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None or session.is_closed:
+            self._drop_finished_sessions()
+            session = self._async_sessions[loop] = self._create_async_session()
+        return session
+
+    def _drop_finished_sessions(self) -> None:
+        """
+        Forget the async sessions of event loops that have been closed.
+        Their connections are bound to the dead loop, so awaiting aclose()
+        from another loop fails with "Event loop is closed"; the sockets
+        are released when the sessions are garbage-collected.
+        """
+        for loop in [loop for loop in self._async_sessions if loop.is_closed()]:
+            del self._async_sessions[loop]
+
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        cached: Optional[CacheEntry] = None,
+        **kwargs: Any,
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, str]]]:
+        """
+        Make an HTTP request with error handling.
+
+        When ``cached`` carries validators the request is conditional, and a
+        304 returns the cached body without downloading it again. Returns
+        the body and the response's validators (None for errors).
+        """
+        import requests
+
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        template = metrics.endpoint_template(endpoint)
+        started = time.perf_counter()
+        status = size = kind = None
 
         try:
             logger.debug(f"Making {method} request to {url}")
-            response = self.session.request(
-                method=method, url=url, timeout=self.timeout, **kwargs
+            response = self._send(
+                method,
+                url,
+                template,
+                headers=self._conditional_headers(cached),
+                **kwargs,
             )
+            status, size = str(response.status_code), len(response.content)
+            retries = getattr(getattr(response.raw, "retries", None), "history", ())
+            if retries:
+                metrics.UPSTREAM_RETRIES.inc(len(retries), endpoint=template)
+            if response.status_code == 304 and cached is not None:
+                return self._not_modified(endpoint, cached)
             response.raise_for_status()
-            return response.json()
+            return self._decode(response.content), self._validators(response.headers)
 
         except requests.exceptions.Timeout:
-            return {"error": f"Request timed out after {self.timeout} seconds"}
+            kind, error = "timeout", f"Request timed out after {self.timeout} seconds"
         except requests.exceptions.ConnectionError:
-            return {"error": "Failed to connect to the API"}
+            kind, error = "connection", "Failed to connect to the API"
         except requests.exceptions.HTTPError as e:
-            return {
-                "error": f"HTTP error {e.response.status_code}: {e.response.reason}"
-            }
+            kind = "http"
+            error = f"HTTP error {e.response.status_code}: {e.response.reason}"
         except requests.exceptions.RequestException as e:
-            return {"error": f"Request failed: {str(e)}"}
+            kind, error = "request", f"Request failed: {str(e)}"
         except ValueError as e:
-            return {"error": f"Invalid JSON response: {str(e)}"}
+            kind, error = "invalid_json", f"Invalid JSON response: {str(e)}"
+        finally:
+            metrics.record_upstream(
+                template,
+                status or kind or "exception",
+                time.perf_counter() - started,
+                size,
+                kind,
+            )
+        return {"error": error}, None
+
+    def _send(
+        self, method: str, url: str, template: str = "", **kwargs: Any
+    ) -> "requests.Response":
+        """Send a request through the rate limiter and concurrency limit."""
+        delay = self.rate_limiter.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        if self.concurrency is None:
+            return self.session.request(
+                method=method,
+                url=url,
+                timeout=(self.connect_timeout, self.timeout),
+                **kwargs,
+            )
+
+        self.concurrency.acquire()
+        start = time.monotonic()
+        overloaded = True
+        try:
+            response = self.session.request(
+                method=method,
+                url=url,
+                timeout=(self.connect_timeout, self.timeout),
+                **kwargs,
+            )
+            overloaded = response.status_code in RETRY_STATUS_FORCELIST
+            return response
+        finally:
+            self.concurrency.release(time.monotonic() - start, overloaded, template)
+
+    @staticmethod
+    def _backoff_time(attempt: int) -> float:
+        """Backoff before retry number ``attempt``, matching urllib3's Retry."""
+        if attempt <= 1:
+            return 0.0
+        return RETRY_BACKOFF_FACTOR * 2.0 ** (attempt - 1)
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """Parse a numeric Retry-After header, if the status honours it."""
+        if response.status_code not in RETRY_AFTER_STATUSES:
+            return None
+        try:
+            return max(0.0, float(response.headers.get("Retry-After", "")))
+        except ValueError:
+            return None
+
+    async def _alimited_request(
+        self,
+        session: httpx.AsyncClient,
+        method: str,
+        url: str,
+        template: str = "",
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send one attempt through the rate limiter and concurrency limit."""
+        delay = await self.rate_limiter.areserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.concurrency is None:
+            return await session.request(method=method, url=url, **kwargs)
+
+        await self.concurrency.aacquire()
+        start = time.monotonic()
+        overloaded = True
+        try:
+            response = await session.request(method=method, url=url, **kwargs)
+            overloaded = response.status_code in RETRY_STATUS_FORCELIST
+            return response
+        finally:
+            self.concurrency.release(time.monotonic() - start, overloaded, template)
+
+    async def _asend(
+        self,
+        session: httpx.AsyncClient,
+        method: str,
+        url: str,
+        template: str = "",
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request, retrying transport errors and retryable statuses.
+        Retries are counted under the endpoint ``template``.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await self._alimited_request(
+                    session, method, url, template, **kwargs
+                )
+            except httpx.TransportError:
+                if attempt >= RETRY_TOTAL:
+                    raise
+                attempt += 1
+                metrics.UPSTREAM_RETRIES.inc(endpoint=template)
+                await asyncio.sleep(self._backoff_time(attempt))
+                continue
+
+            if (
+                response.status_code not in RETRY_STATUS_FORCELIST
+                or attempt >= RETRY_TOTAL
+            ):
+                return response
+
+            attempt += 1
+            metrics.UPSTREAM_RETRIES.inc(endpoint=template)
+            retry_after = self._retry_after(response)
+            if retry_after is not None:
+                await self.rate_limiter.apause(retry_after)
+            await response.aclose()
+            await asyncio.sleep(
+                retry_after if retry_after is not None else self._backoff_time(attempt)
+            )
+
+    async def _amake_request(
+        self,
+        method: str,
+        endpoint: str,
+        cached: Optional[CacheEntry] = None,
+        **kwargs: Any,
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, str]]]:
+        """Make an async HTTP request with the same contract as the sync path."""
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        template = metrics.endpoint_template(endpoint)
+        started = time.perf_counter()
+        status = size = kind = None
+
+        try:
+            logger.debug(f"Making async {method} request to {url}")
+            session = self._get_async_session()
+            response = await self._asend(
+                session,
+                method,
+                url,
+                template,
+                headers=self._conditional_headers(cached),
+                **kwargs,
+            )
+            status, size = str(response.status_code), len(response.content)
+            if response.status_code == 304 and cached is not None:
+                return self._not_modified(endpoint, cached)
+            response.raise_for_status()
+            return self._decode(response.content), self._validators(response.headers)
+
+        except httpx.TimeoutException:
+            kind, error = "timeout", f"Request timed out after {self.timeout} seconds"
+        except httpx.NetworkError:
+            kind, error = "connection", "Failed to connect to the API"
+        except httpx.HTTPStatusError as e:
+            kind = "http"
+            error = f"HTTP error {e.response.status_code}: {e.response.reason_phrase}"
+        except (httpx.HTTPError, httpx.InvalidURL, httpx.StreamError) as e:
+            kind, error = "request", f"Request failed: {str(e)}"
+        except ValueError as e:
+            kind, error = "invalid_json", f"Invalid JSON response: {str(e)}"
+        finally:
+            metrics.record_upstream(
+                template,
+                status or kind or "exception",
+                time.perf_counter() - started,
+                size,
+                kind,
+            )
+        return {"error": error}, None
+
+    @staticmethod
+    def _decode(body: bytes) -> Any:
+        """Decode a response body with the configured JSON backend."""
+        return jsonlib.decode_body(body, keep_raw=config.json_passthrough)
+
+    @staticmethod
+    def _conditional_headers(cached: Optional[CacheEntry]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since from a cached entry."""
+        validators = cached.validators if cached is not None else None
+        if not validators:
+            return {}
+        headers = {}
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last_modified" in validators:
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    @staticmethod
+    def _validators(headers: Any) -> Optional[Dict[str, str]]:
+        """Extract the ETag and Last-Modified validators of a response."""
+        validators = {}
+        if headers.get("ETag"):
+            validators["etag"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            validators["last_modified"] = headers["Last-Modified"]
+        return validators or None
+
+    def _not_modified(
+        self, endpoint: str, cached: CacheEntry
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, str]]]:
+        """Account for a 304 and hand back the cached body."""
+        with self._lock:
+            self.revalidations += 1
+        logger.debug(f"{endpoint} not modified, reusing cached body")
+        return cached.value, cached.validators
+
+    def _cache_lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached response for ``key``, if caching is enabled."""
+        if self.cache is None:
+            return None
+        return self.cache.get(key)
+
+    def _cache_entry(self, key: str) -> Optional[CacheEntry]:
+        """Return a retained entry holding validators to revalidate, if any."""
+        if self.cache is None:
+            return None
+        entry = self.cache.get_entry(key)
+        return entry if entry is not None and entry.validators else None
+
+    def _cache_store(
+        self,
+        key: str,
+        endpoint: str,
+        result: Dict[str, Any],
+        validators: Optional[Dict[str, str]] = None,
+        cached: Optional[CacheEntry] = None,
+    ) -> None:
+        """
+        Cache a successful response; error dictionaries are never cached.
+        A body reused after a 304 keeps its known size.
+        """
+        if self.cache is None or is_error(result):
+            return
+        size = cached.size if cached is not None and result is cached.value else None
+        self.cache.set(key, endpoint, result, size=size, validators=validators)
+
+    def _stale_lookup(self, key: str, max_stale: float) -> Optional[Tuple[Any, float]]:
+        """Return ``(value, age)`` of an entry expired within ``max_stale``."""
+        if self.cache is None or max_stale <= 0:
+            return None
+        return self.cache.get_stale(key, max_stale)
+
+    async def _acache_lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Like _cache_lookup, reading a disk tier off the event loop."""
+        if isinstance(self.cache, TieredCache):
+            return await self.cache.aget(key)
+        return self._cache_lookup(key)
+
+    async def _acache_entry(self, key: str) -> Optional[CacheEntry]:
+        """Like _cache_entry, reading a disk tier off the event loop."""
+        if not isinstance(self.cache, TieredCache):
+            return self._cache_entry(key)
+        entry = await self.cache.aget_entry(key)
+        return entry if entry is not None and entry.validators else None
+
+    async def _acache_store(
+        self,
+        key: str,
+        endpoint: str,
+        result: Dict[str, Any],
+        validators: Optional[Dict[str, str]] = None,
+        cached: Optional[CacheEntry] = None,
+    ) -> None:
+        """Like _cache_store, writing a disk tier off the event loop."""
+        if not isinstance(self.cache, TieredCache):
+            self._cache_store(key, endpoint, result, validators, cached)
+        elif not is_error(result):
+            size = (
+                cached.size if cached is not None and result is cached.value else None
+            )
+            await self.cache.aset(
+                key, endpoint, result, size=size, validators=validators
+            )
+
+    async def _astale_lookup(
+        self, key: str, max_stale: float
+    ) -> Optional[Tuple[Any, float]]:
+        """Like _stale_lookup, reading a disk tier off the event loop."""
+        if not isinstance(self.cache, TieredCache) or max_stale <= 0:
+            return self._stale_lookup(key, max_stale)
+        return await self.cache.aget_stale(key, max_stale)
+
+    @staticmethod
+    def _mark_stale(
+        value: Dict[str, Any], age: float, error: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Return a copy of a cached response flagged as stale."""
+        if not isinstance(value, dict):
+            return value
+        marked = dict(value, stale=True, cacheAge=round(age, 1))
+        if error is not None:
+            marked["upstreamError"] = error
+        return marked
+
+    def _serve_stale_on_error(self, key: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace an upstream error with a stale cached response, if any."""
+        if not is_error(result):
+            return result
+        return self._stale_for_error(
+            key, result, self._stale_lookup(key, self.stale_if_error)
+        )
+
+    async def _aserve_stale_on_error(
+        self, key: str, result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Like _serve_stale_on_error, reading a disk tier off the event loop."""
+        if not is_error(result):
+            return result
+        return self._stale_for_error(
+            key, result, await self._astale_lookup(key, self.stale_if_error)
+        )
+
+    def _stale_for_error(
+        self,
+        key: str,
+        result: Dict[str, Any],
+        stale: Optional[Tuple[Any, float]],
+    ) -> Dict[str, Any]:
+        if stale is None:
+            return result
+        logger.info(f"Serving stale {key} after upstream error: {result['error']}")
+        return self._mark_stale(*stale, error=result["error"])
 
     def get(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Make a GET request."""
-        return self._make_request("GET", endpoint, params=params)
+        key = make_cache_key(endpoint, params)
+        cached = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+
+        def fetch() -> Dict[str, Any]:
+            cached = self._cache_entry(key)
+            result, validators = self._make_request(
+                "GET", endpoint, cached, params=params
+            )
+            self._cache_store(key, endpoint, result, validators, cached)
+            self._notify(endpoint, result)
+            return result
+
+        stale = self._stale_lookup(key, self.stale_while_revalidate)
+        if stale is not None:
+            threading.Thread(
+                target=self._flight.do, args=(key, fetch), daemon=True
+            ).start()
+            return self._mark_stale(*stale)
+
+        return self._serve_stale_on_error(key, self._flight.do(key, fetch))
+
+    async def aget(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make a GET request without blocking the event loop."""
+        key = make_cache_key(endpoint, params)
+        cached = await self._acache_lookup(key)
+        if cached is not None:
+            return cached
+
+        async def fetch() -> Dict[str, Any]:
+            cached = await self._acache_entry(key)
+            result, validators = await self._amake_request(
+                "GET", endpoint, cached, params=params
+            )
+            await self._acache_store(key, endpoint, result, validators, cached)
+            self._notify(endpoint, result)
+            return result
+
+        stale = await self._astale_lookup(key, self.stale_while_revalidate)
+        if stale is not None:
+            refresh = asyncio.ensure_future(self._async_flight.do(key, fetch))
+            self._refreshing.add(refresh)
+            refresh.add_done_callback(self._refreshing.discard)
+            return self._mark_stale(*stale)
+
+        result = await self._async_flight.do(key, fetch)
+        return await self._aserve_stale_on_error(key, result)
+
+    async def aiter_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Make many GET requests concurrently, yielding results as they arrive.
+
+        ``calls`` holds ``(endpoint, params)`` pairs; at most ``concurrency``
+        are in flight at once. Yields ``(index, result)`` in completion order.
+        Requests still pending when the caller stops iterating are cancelled.
+        """
+        semaphore = asyncio.Semaphore(concurrency or config.batch_concurrency)
+
+        async def bounded(
+            index: int, endpoint: str, params: Optional[Dict[str, Any]]
+        ) -> Tuple[int, Dict[str, Any]]:
+            async with semaphore:
+                return index, await self.aget(endpoint, params=params)
+
+        tasks = [
+            asyncio.ensure_future(bounded(index, endpoint, params))
+            for index, (endpoint, params) in enumerate(calls)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def aget_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Make many GET requests concurrently, at most ``concurrency`` at a time.
+
+        ``calls`` holds ``(endpoint, params)`` pairs. Results come back in the
+        same order; failures are error dictionaries in their slot, so one bad
+        request never fails the whole batch.
+        """
+        results: List[Dict[str, Any]] = [{}] * len(calls)
+        async for index, result in self.aiter_many(calls, concurrency):
+            results[index] = result
+        return results
 
     def close(self) -> None:
-        """Close the HTTP session."""
-        self.session.close()
+        """Close the HTTP session, if the blocking path has used it."""
+        if self._session is not None:
+            self._session.close()
+
+    async def aclose(self) -> None:
+        """Close the sync session and the async sessions of every live event loop."""
+        self.close()
+        for refresh in list(self._refreshing):
+            refresh.cancel()
+        self._drop_finished_sessions()
+        sessions = list(self._async_sessions.values())
+        self._async_sessions.clear()
+        for session in sessions:
+            await session.aclose()
+
+
+_client: Optional[TransfermarktClient] = None
+_client_lock = threading.Lock()
+if TYPE_CHECKING:
+    # Built by __getattr__ on first access; declared for type checkers only
+    client: TransfermarktClient
+_client_hooks: List[Callable[[TransfermarktClient], object]] = []
+
+
+def on_client(hook: Callable[[TransfermarktClient], object]) -> None:
+    """
+    Call ``hook(client)`` once the global client is built, or now if it
+    already is. Server setup attaches observers and stats this way, so
+    creating the server does not build the client. Hooks are handed the
+    client and must not read the module's ``client`` themselves.
+    """
+    with _client_lock:
+        if _client is None:
+            _client_hooks.append(hook)
+            return
+    hook(_client)
 
 
-# Global client instance
-client = TransfermarktClient()
+def __getattr__(name: str) -> Any:
+    # The global ``client`` is built on first access, so importing this
+    # module (as every tool registration does) sets nothing up
+    global _client
+    if name != "client":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                built = TransfermarktClient()
+                for hook in _client_hooks:
+                    hook(built)
+                _client_hooks.clear()
+                _client = built
+    return _client
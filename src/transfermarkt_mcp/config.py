@@ -2,6 +2,7 @@
 
 import os
 import logging
+from typing import List, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -11,10 +12,67 @@ load_dotenv()
 DEFAULT_BASE_URL = "http://127.0.0.1:8000"
 DEFAULT_TIMEOUT = 30
 DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_CACHE_TTL = 300
+DEFAULT_CACHE_MAX_ENTRIES = 2048
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_CACHE_BACKEND = "memory"
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "transfermarkt-mcp", "responses.sqlite3"
+)
+DEFAULT_CACHE_DISK_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_CACHE_STALE_WHILE_REVALIDATE = 0
+DEFAULT_CACHE_STALE_IF_ERROR = 86400
+DEFAULT_BATCH_CONCURRENCY = 8
+DEFAULT_PROJECTION = "full"
+DEFAULT_JSON_BACKEND = "auto"
+DEFAULT_SEARCH_INDEX_MAX_ENTRIES = 200000
+DEFAULT_TRANSFER_GRAPH_MAX_PLAYERS = 100000
+DEFAULT_SNAPSHOT_COMPETITIONS = "GB1,ES1,L1,IT1,FR1"
+DEFAULT_PREFETCH_BUDGET = 60
+DEFAULT_PREFETCH_CONCURRENCY = 2
+DEFAULT_PREFETCH_TOP_RESULTS = 1
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 100
+DEFAULT_MAX_KEEPALIVE = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+DEFAULT_RATE_LIMIT = 0.0
+DEFAULT_RATE_LIMIT_BURST = 10
+DEFAULT_RATE_LIMIT_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "transfermarkt-mcp", "ratelimit.sqlite3"
+)
+DEFAULT_TRANSPORT = "stdio"
+DEFAULT_HTTP_HOST = "127.0.0.1"
+DEFAULT_HTTP_PORT = 8080
+DEFAULT_WORKERS = 1
+DEFAULT_CONCURRENCY_INITIAL = 16
+DEFAULT_CONCURRENCY_MIN = 1
+DEFAULT_CONCURRENCY_MAX = 100
+DEFAULT_CONCURRENCY_LATENCY_FACTOR = 0.0
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_bool(value: str) -> bool:
+    """Interpret common truthy strings from the environment."""
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _parse_list(value: str) -> List[str]:
+    """Split a comma-separated list, dropping blanks."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _parse_ttls(value: str) -> List[Tuple[str, float]]:
+    """Parse ``pattern=seconds`` pairs separated by commas."""
+    ttls = []
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        pattern, _, seconds = item.partition("=")
+        ttls.append((pattern.strip().strip("/"), float(seconds)))
+    return ttls
+
+
 class Config:
     """Application configuration."""
 
@@ -23,6 +81,150 @@ class Config:
         self.request_timeout = int(os.getenv("REQUEST_TIMEOUT", DEFAULT_TIMEOUT))
         self.log_level = os.getenv("LOG_LEVEL", DEFAULT_LOG_LEVEL)
 
+        # Connection pooling; both timeouts fall back to REQUEST_TIMEOUT
+        self.connect_timeout = float(os.getenv("CONNECT_TIMEOUT", self.request_timeout))
+        self.read_timeout = float(os.getenv("READ_TIMEOUT", self.request_timeout))
+        self.pool_connections = int(
+            os.getenv("HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS)
+        )
+        self.pool_maxsize = int(os.getenv("HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE))
+        self.max_keepalive = int(os.getenv("HTTP_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE))
+        self.keepalive = _parse_bool(os.getenv("HTTP_KEEPALIVE", "true"))
+        self.keepalive_expiry = float(
+            os.getenv("HTTP_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY)
+        )
+        # Only honoured by the async client, and only when h2 is installed
+        self.http2 = _parse_bool(os.getenv("HTTP2", "false"))
+
+        # Upstream request rate shared by every tool (0 disables the limit)
+        self.rate_limit = float(os.getenv("RATE_LIMIT", DEFAULT_RATE_LIMIT))
+        self.rate_limit_burst = int(
+            os.getenv("RATE_LIMIT_BURST", DEFAULT_RATE_LIMIT_BURST)
+        )
+        # One budget for every process on the host, kept in a SQLite file
+        # (set by --workers)
+        self.rate_limit_shared = _parse_bool(os.getenv("RATE_LIMIT_SHARED", "false"))
+        self.rate_limit_path = os.path.expanduser(
+            os.getenv("RATE_LIMIT_PATH", DEFAULT_RATE_LIMIT_PATH)
+        )
+
+        # AIMD limit on requests in flight, reacting to 429/5xx (and latency
+        # rises per endpoint when CONCURRENCY_LATENCY_FACTOR is above 0)
+        self.adaptive_concurrency = _parse_bool(
+            os.getenv("ADAPTIVE_CONCURRENCY", "true")
+        )
+        self.concurrency_initial = int(
+            os.getenv("CONCURRENCY_INITIAL", DEFAULT_CONCURRENCY_INITIAL)
+        )
+        self.concurrency_min = int(
+            os.getenv("CONCURRENCY_MIN", DEFAULT_CONCURRENCY_MIN)
+        )
+        self.concurrency_max = int(
+            os.getenv("CONCURRENCY_MAX", DEFAULT_CONCURRENCY_MAX)
+        )
+        self.concurrency_latency_factor = float(
+            os.getenv("CONCURRENCY_LATENCY_FACTOR", DEFAULT_CONCURRENCY_LATENCY_FACTOR)
+        )
+
+        # Response cache; CACHE_TTLS patterns take precedence over the defaults
+        self.cache_enabled = _parse_bool(os.getenv("CACHE_ENABLED", "true"))
+        self.cache_default_ttl = float(
+            os.getenv("CACHE_DEFAULT_TTL", DEFAULT_CACHE_TTL)
+        )
+        self.cache_max_entries = int(
+            os.getenv("CACHE_MAX_ENTRIES", DEFAULT_CACHE_MAX_ENTRIES)
+        )
+        self.cache_max_bytes = int(
+            os.getenv("CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES)
+        )
+        self.cache_ttls = _parse_ttls(os.getenv("CACHE_TTLS", ""))
+        # Hold modelled responses as compact slots objects in the memory cache
+        self.cache_models = _parse_bool(os.getenv("CACHE_MODELS", "false"))
+
+        # Seconds past its TTL an entry is still served: instantly while it is
+        # refreshed in the background, or only when upstream fails
+        self.cache_stale_while_revalidate = float(
+            os.getenv(
+                "CACHE_STALE_WHILE_REVALIDATE", DEFAULT_CACHE_STALE_WHILE_REVALIDATE
+            )
+        )
+        self.cache_stale_if_error = float(
+            os.getenv("CACHE_STALE_IF_ERROR", DEFAULT_CACHE_STALE_IF_ERROR)
+        )
+
+        # "sqlite" adds a disk tier shared by every process using CACHE_PATH
+        self.cache_backend = os.getenv("CACHE_BACKEND", DEFAULT_CACHE_BACKEND).lower()
+        self.cache_path = os.getenv("CACHE_PATH", DEFAULT_CACHE_PATH)
+        self.cache_disk_max_bytes = int(
+            os.getenv("CACHE_DISK_MAX_BYTES", DEFAULT_CACHE_DISK_MAX_BYTES)
+        )
+
+        # Upper bound on concurrent upstream requests issued by one batch tool
+        self.batch_concurrency = int(
+            os.getenv("BATCH_CONCURRENCY", DEFAULT_BATCH_CONCURRENCY)
+        )
+
+        # Tool result shape when a call passes no fields: "full" or "compact"
+        self.default_projection = os.getenv(
+            "DEFAULT_PROJECTION", DEFAULT_PROJECTION
+        ).lower()
+
+        # "auto" picks orjson, then msgspec, then the stdlib json module
+        self.json_backend = os.getenv("JSON_BACKEND", DEFAULT_JSON_BACKEND).lower()
+        # Keep response bytes so unprojected results skip re-encoding
+        self.json_passthrough = _parse_bool(os.getenv("JSON_PASSTHROUGH", "true"))
+
+        # In-process name index fed by every search and roster response
+        self.search_index_enabled = _parse_bool(
+            os.getenv("SEARCH_INDEX_ENABLED", "true")
+        )
+        self.search_index_max_entries = int(
+            os.getenv("SEARCH_INDEX_MAX_ENTRIES", DEFAULT_SEARCH_INDEX_MAX_ENTRIES)
+        )
+
+        # In-process graph of transfers between clubs, fed by every transfer
+        # history response; the least recently seen players drop out first
+        self.transfer_graph_enabled = _parse_bool(
+            os.getenv("TRANSFER_GRAPH_ENABLED", "true")
+        )
+        self.transfer_graph_max_players = int(
+            os.getenv("TRANSFER_GRAPH_MAX_PLAYERS", DEFAULT_TRANSFER_GRAPH_MAX_PLAYERS)
+        )
+
+        # Background fetches of the usual follow-ups of searches and profiles,
+        # limited to PREFETCH_BUDGET requests per minute
+        self.prefetch_enabled = _parse_bool(os.getenv("PREFETCH_ENABLED", "false"))
+        self.prefetch_budget = float(
+            os.getenv("PREFETCH_BUDGET", DEFAULT_PREFETCH_BUDGET)
+        )
+        self.prefetch_concurrency = int(
+            os.getenv("PREFETCH_CONCURRENCY", DEFAULT_PREFETCH_CONCURRENCY)
+        )
+        self.prefetch_top_results = int(
+            os.getenv("PREFETCH_TOP_RESULTS", DEFAULT_PREFETCH_TOP_RESULTS)
+        )
+
+        # Prometheus metrics at /metrics on the HTTP transports, and
+        # OpenTelemetry spans when opentelemetry-api is installed
+        self.metrics_enabled = _parse_bool(os.getenv("METRICS_ENABLED", "true"))
+        self.otel_enabled = _parse_bool(os.getenv("OTEL_ENABLED", "false"))
+
+        # Transport (stdio, http or sse); the HTTP transports listen on
+        # HTTP_HOST:HTTP_PORT with WORKERS processes, and stateless HTTP
+        # lets any worker serve any request
+        self.transport = os.getenv("MCP_TRANSPORT", DEFAULT_TRANSPORT)
+        self.http_host = os.getenv("HTTP_HOST", DEFAULT_HTTP_HOST)
+        self.http_port = int(os.getenv("HTTP_PORT", DEFAULT_HTTP_PORT))
+        self.workers = int(os.getenv("WORKERS", DEFAULT_WORKERS))
+        self.http_stateless = _parse_bool(os.getenv("HTTP_STATELESS", "false"))
+
+        # Snapshot preloaded into the cache and name index at startup, and
+        # the competitions "snapshot export" crawls by default
+        self.snapshot_path = os.path.expanduser(os.getenv("SNAPSHOT_PATH", ""))
+        self.snapshot_competitions = _parse_list(
+            os.getenv("SNAPSHOT_COMPETITIONS", DEFAULT_SNAPSHOT_COMPETITIONS)
+        )
+
         # Configure logging
         logging.getLogger().setLevel(getattr(logging, self.log_level.upper()))
 
@@ -0,0 +1,346 @@
+"""SQLite-backed response cache shared by server processes on one host."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from transfermarkt_mcp import jsonlib
+from transfermarkt_mcp.cache import CacheEntry, TTLPolicy
+from transfermarkt_mcp.config import config
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    validators TEXT,
+    endpoint TEXT
+);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+# Reads only refresh an entry's LRU timestamp this often, to keep readers
+# from turning into writers that contend for the database lock.
+ACCESS_RESOLUTION = 60.0
+
+# Writes between checks of the total stored size against ``max_bytes``.
+SIZE_CHECK_INTERVAL = 64
+
+
+class SQLiteCache(TTLPolicy):
+    """
+    Persistent TTL cache in a SQLite database in WAL mode.
+
+    Several processes may open the same file: SQLite serialises writers and
+    WAL lets readers proceed concurrently. Timestamps are wall-clock so they
+    are comparable across processes. Once the stored bytes exceed
+    ``max_bytes`` (checked every ``SIZE_CHECK_INTERVAL`` writes) the cache is
+    compacted: rows expired for longer than ``stale_ttl`` are deleted first,
+    then the least recently accessed rows. Database errors are logged and
+    treated as cache misses, never surfaced to tools.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttls: Optional[List[Tuple[str, float]]] = None,
+        default_ttl: float = 300,
+        max_bytes: int = 512 * 1024 * 1024,
+        busy_timeout: float = 5.0,
+        stale_ttl: float = 0,
+    ) -> None:
+        super().__init__(ttls, default_ttl)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+        self._writes = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(responses)")}
+            if "validators" not in columns:
+                # Databases created before conditional requests were supported
+                conn.execute("ALTER TABLE responses ADD COLUMN validators TEXT")
+            if "endpoint" not in columns:
+                # Databases created before entries were promoted to memory
+                conn.execute("ALTER TABLE responses ADD COLUMN endpoint TEXT")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _decode(blob: bytes) -> Any:
+        """Decode a stored body, keeping the bytes for pass-through."""
+        return jsonlib.decode_body(blob, keep_raw=config.json_passthrough)
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def lookup(
+        self, key: str
+    ) -> Optional[Tuple[Any, float, str, Optional[Dict[str, str]]]]:
+        """
+        Return ``(value, remaining_ttl, endpoint, validators)`` for a fresh
+        entry, or None.
+        """
+        now = time.time()
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, expires_at, accessed_at, endpoint, validators "
+                "FROM responses WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                self._count(False)
+                return None
+            value, expires_at, accessed_at, endpoint, validators = row
+            if now - accessed_at > ACCESS_RESOLUTION:
+                with conn:
+                    conn.execute(
+                        "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                        (now, key),
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed for {key}: {e}")
+            self._count(False)
+            return None
+
+        self._count(True)
+        return (
+            self._decode(value),
+            expires_at - now,
+            # Rows written before the endpoint was stored: the key minus its query
+            endpoint or key.split("?", 1)[0],
+            json.loads(validators) if validators else None,
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a fresh cached value, or None on a miss."""
+        found = self.lookup(key)
+        return None if found is None else found[0]
+
+    def contains(self, key: str) -> bool:
+        """Return True if ``key`` is fresh, without counting a lookup."""
+        try:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT 1 FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed for {key}: {e}")
+            return False
+        return row is not None
+
+    def get_stale(self, key: str, max_stale: float) -> Optional[Tuple[Any, float]]:
+        """
+        Return ``(value, age)`` for an entry expired at most ``max_stale``
+        seconds ago (or still fresh), or None.
+        """
+        now = time.time()
+        max_stale = min(max_stale, self.stale_ttl)
+        try:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value, stored_at FROM responses "
+                    "WHERE key = ? AND expires_at + ? > ?",
+                    (key, max_stale, now),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed for {key}: {e}")
+            return None
+        if row is None:
+            return None
+        with self._lock:
+            self.stale_hits += 1
+        return self._decode(row[0]), now - row[1]
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for ``key``, fresh or stale, without counting it."""
+        try:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value, stored_at, expires_at, size, validators "
+                    "FROM responses WHERE key = ? AND expires_at + ? > ?",
+                    (key, self.stale_ttl, time.time()),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed for {key}: {e}")
+            return None
+        if row is None:
+            return None
+        value, stored_at, expires_at, size, validators = row
+        return CacheEntry(
+            self._decode(value),
+            stored_at,
+            expires_at - stored_at,
+            size,
+            json.loads(validators) if validators else None,
+        )
+
+    def set(
+        self,
+        key: str,
+        endpoint: str,
+        value: Any,
+        size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        validators: Optional[Dict[str, str]] = None,
+        age: float = 0.0,
+    ) -> None:
+        """
+        Store ``value`` under ``key`` using the TTL policy for ``endpoint``;
+        ``age`` backdates a response fetched that many seconds ago.
+        """
+        ttl = self.ttl_for(endpoint) if ttl is None else ttl
+        if ttl <= 0:
+            return
+        blob = jsonlib.dumps(value)
+        if len(blob) > self.max_bytes:
+            return
+
+        now = time.time()
+        stored_at = now - age
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, value, stored_at, expires_at, accessed_at, size, "
+                    "validators, endpoint) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        blob,
+                        stored_at,
+                        stored_at + ttl,
+                        now,
+                        len(blob),
+                        json.dumps(validators) if validators else None,
+                        endpoint.strip("/"),
+                    ),
+                )
+            with self._lock:
+                self._writes += 1
+                check_size = self._writes % SIZE_CHECK_INTERVAL == 0
+            if check_size and self.total_bytes() > self.max_bytes:
+                self.compact()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache write failed for {key}: {e}")
+
+    def total_bytes(self) -> int:
+        """Return the summed size of all stored responses."""
+        row = (
+            self._connect()
+            .execute("SELECT COALESCE(SUM(size), 0) FROM responses")
+            .fetchone()
+        )
+        return int(row[0])
+
+    def compact(self, target_ratio: float = 0.9, vacuum: bool = False) -> int:
+        """
+        Delete expired rows, then least recently used rows until the cache
+        holds at most ``target_ratio * max_bytes``. Returns rows deleted.
+        """
+        target = int(self.max_bytes * target_ratio)
+        conn = self._connect()
+        with conn:
+            deleted = conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ?",
+                (time.time() - self.stale_ttl,),
+            ).rowcount
+            total = self.total_bytes()
+            if total > target:
+                rows = conn.execute(
+                    "SELECT key, size FROM responses ORDER BY accessed_at"
+                ).fetchall()
+                victims = []
+                for key, size in rows:
+                    if total <= target:
+                        break
+                    victims.append((key,))
+                    total -= size
+                conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+                deleted += len(victims)
+        if vacuum:
+            conn.execute("VACUUM")
+        with self._lock:
+            self.evictions += deleted
+        return deleted
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM responses")
+        with self._lock:
+            self.hits = self.misses = self.stale_hits = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current occupancy."""
+        try:
+            entries, total = (
+                self._connect()
+                .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses")
+                .fetchone()
+            )
+        except sqlite3.Error:
+            entries, total = None, None
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "stale_hits": self.stale_hits,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": total,
+                "path": self.path,
+            }
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,105 @@
+"""JSON encoding and decoding through the fastest available backend."""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Tuple, Union
+
+from transfermarkt_mcp.config import config
+
+logger = logging.getLogger(__name__)
+
+# Preference order when JSON_BACKEND is "auto"
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+class RawJSON(dict):
+    """
+    A decoded JSON object that keeps the bytes it was decoded from.
+
+    Serializing it again can reuse ``raw`` instead of re-encoding. Copies
+    (``dict(value)``, projections) are plain dicts, so anything derived
+    from the response drops the raw body; the object itself must be
+    treated as read-only.
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, value: Dict[str, Any], raw: bytes) -> None:
+        super().__init__(value)
+        self.raw = raw
+
+
+def _load_backend(
+    name: str,
+) -> Tuple[Callable[[Union[bytes, str]], Any], Callable[[Any], bytes]]:
+    """Return ``(loads, dumps)`` for a backend; raises ImportError if missing."""
+    if name == "orjson":
+        import orjson
+
+        def orjson_dumps(value: Any) -> bytes:
+            return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+        return orjson.loads, orjson_dumps
+    if name == "msgspec":
+        import msgspec
+
+        decoder = msgspec.json.Decoder()
+        encoder = msgspec.json.Encoder(enc_hook=str)
+
+        def msgspec_loads(data: Union[bytes, str]) -> Any:
+            try:
+                return decoder.decode(data)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+
+        return msgspec_loads, encoder.encode
+    if name == "json":
+
+        def json_dumps(value: Any) -> bytes:
+            return json.dumps(
+                value, separators=(",", ":"), ensure_ascii=False, default=str
+            ).encode()
+
+        return json.loads, json_dumps
+    raise ValueError(f"Unknown JSON backend: {name}")
+
+
+def select_backend(
+    preferred: str = "auto",
+) -> Tuple[str, Callable[[Union[bytes, str]], Any], Callable[[Any], bytes]]:
+    """Pick ``preferred``, or the first importable backend for "auto"."""
+    candidates = BACKENDS if preferred == "auto" else (preferred, "json")
+    for name in candidates:
+        try:
+            return (name, *_load_backend(name))
+        except ImportError:
+            logger.info(f"JSON backend {name} is not installed")
+    raise RuntimeError("No JSON backend available")
+
+
+BACKEND, _loads, _dumps = select_backend(config.json_backend)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON; raises ValueError on malformed input."""
+    return _loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """Encode ``value`` as compact UTF-8 JSON, reusing a RawJSON's bytes."""
+    if isinstance(value, RawJSON):
+        return value.raw
+    return _dumps(value)
+
+
+def decode_body(data: bytes, keep_raw: bool = False) -> Any:
+    """Decode a response body, keeping the bytes on objects if ``keep_raw``."""
+    value = _loads(data)
+    if keep_raw and isinstance(value, dict):
+        return RawJSON(value, data)
+    return value
+
+
+def serialize_tool_result(value: Any) -> str:
+    """FastMCP tool serializer: unchanged responses are passed through."""
+    return dumps(value).decode()
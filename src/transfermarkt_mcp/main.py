@@ -1,18 +1,225 @@
 """Main entry point for the Transfermarkt MCP server."""
 
+import argparse
+import asyncio
 import logging
-from transfermarkt_mcp.server import create_mcp_server
+import os
+import sys
+from typing import TYPE_CHECKING, Any, List, Literal, Optional
+
+from transfermarkt_mcp.config import config
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+    from starlette.applications import Starlette
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create the MCP server instance at module level for fastmcp run
-mcp = create_mcp_server()
+TRANSPORTS = ("stdio", "http", "sse")
+
+# Settings decided at startup that worker processes read from the
+# environment: config attribute -> environment variable
+WORKER_SETTINGS = {
+    "transport": "MCP_TRANSPORT",
+    "http_stateless": "HTTP_STATELESS",
+    "rate_limit_shared": "RATE_LIMIT_SHARED",
+    "cache_backend": "CACHE_BACKEND",
+    "snapshot_path": "SNAPSHOT_PATH",
+}
+
+
+def get_server() -> "FastMCP":
+    """Return the module's MCP server, creating it on first use."""
+    server = globals().get("mcp")
+    if server is None:
+        from transfermarkt_mcp.server import create_mcp_server
+
+        server = globals()["mcp"] = create_mcp_server()
+    return server
+
+
+def __getattr__(name: str) -> Any:
+    # ``mcp`` (what fastmcp run looks up) is created on first access, so
+    # the snapshot commands and --help never import fastmcp
+    if name == "mcp":
+        return get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def http_app() -> "Starlette":
+    """
+    The server as an ASGI app for the HTTP transports; uvicorn calls this
+    factory in every worker process.
+    """
+    transport: Literal["http", "sse"] = "sse" if config.transport == "sse" else "http"
+    return get_server().http_app(
+        transport=transport, stateless_http=config.http_stateless
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser: serve by default, or manage snapshots."""
+    parser = argparse.ArgumentParser(
+        prog="transfermarkt-mcp", description="Transfermarkt MCP server"
+    )
+    parser.add_argument(
+        "--snapshot",
+        metavar="PATH",
+        help="preload a snapshot into the cache, name index and transfer graph",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default=config.transport,
+        help="stdio, or streamable http / sse on --host:--port (default: stdio)",
+    )
+    parser.add_argument("--host", default=config.http_host)
+    parser.add_argument("--port", type=int, default=config.http_port)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=config.workers,
+        help="server processes for --transport http, sharing one cache and "
+        "one upstream rate limit (default: WORKERS or 1)",
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    snapshot = commands.add_parser("snapshot", help="export or import snapshots")
+    actions = snapshot.add_subparsers(dest="action", required=True)
+
+    export = actions.add_parser(
+        "export", help="crawl competitions into a snapshot file"
+    )
+    export.add_argument("path", help="output file, e.g. top5.jsonl.gz")
+    export.add_argument(
+        "--competitions",
+        default=",".join(config.snapshot_competitions),
+        help="comma-separated competition IDs (default: SNAPSHOT_COMPETITIONS)",
+    )
+    export.add_argument("--season", help="season ID, e.g. 2024 (default: current)")
+    export.add_argument(
+        "--players",
+        default="",
+        help="comma-separated per-player facets to include, e.g. profile,market_value",
+    )
+
+    load = actions.add_parser(
+        "import", help="load a snapshot into the configured cache"
+    )
+    load.add_argument("path", help="snapshot file")
+    return parser
+
+
+def run_snapshot(args: argparse.Namespace) -> int:
+    """Run a snapshot subcommand; returns the process exit code."""
+    from transfermarkt_mcp.client import client
+    from transfermarkt_mcp.snapshot import export_snapshot, load_snapshot
+    from transfermarkt_mcp.tools.players import PLAYER_FACETS
+
+    if args.action == "import":
+        if config.cache_backend != "sqlite":
+            logger.warning(
+                "CACHE_BACKEND is not sqlite, so the import only lasts for this "
+                "process; set SNAPSHOT_PATH to preload a server instead"
+            )
+        try:
+            summary = load_snapshot(client, args.path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load snapshot {args.path}: {e}")
+            return 1
+        print(f"Loaded {summary['loaded']} responses, {summary['skipped']} too old")
+        return 0
+
+    competitions = [c.strip() for c in args.competitions.split(",") if c.strip()]
+    facets = [f.strip() for f in args.players.split(",") if f.strip()]
+    unknown = [facet for facet in facets if facet not in PLAYER_FACETS]
+    if not competitions or unknown:
+        logger.error(
+            f"Need at least one competition and known player facets "
+            f"({', '.join(PLAYER_FACETS)}); unknown: {', '.join(unknown) or '-'}"
+        )
+        return 2
+
+    async def export() -> dict:
+        try:
+            return await export_snapshot(
+                client, args.path, competitions, args.season, facets
+            )
+        finally:
+            await client.aclose()
+
+    summary = asyncio.run(export())
+    print(f"Wrote {summary['records']} responses to {summary['path']}")
+    for error in summary["errors"]:
+        print(f"  failed: {error['endpoint']}: {error['error']}")
+    return 0 if summary["records"] else 1
+
+
+def apply_settings(**settings: Any) -> None:
+    """Set config values in this process and, for workers, the environment."""
+    for name, value in settings.items():
+        setattr(config, name, value)
+        text = str(value).lower() if isinstance(value, bool) else str(value)
+        os.environ[WORKER_SETTINGS[name]] = text
+
+
+def serve_http(args: argparse.Namespace) -> int:
+    """Serve over HTTP with uvicorn; returns the process exit code."""
+    import uvicorn
+
+    settings: dict = {"transport": args.transport}
+    if args.snapshot:
+        settings["snapshot_path"] = args.snapshot
+    if args.workers > 1:
+        if args.transport == "sse":
+            logger.error(
+                "SSE sessions live in one process; use --transport http for "
+                "several workers"
+            )
+            return 2
+        # Any worker may receive any request, and all of them share one
+        # cache and one upstream budget
+        settings.update(http_stateless=True, rate_limit_shared=True)
+        if config.cache_enabled and config.cache_backend != "sqlite":
+            if "CACHE_BACKEND" in os.environ:
+                logger.warning(
+                    f"CACHE_BACKEND={config.cache_backend}: each worker keeps its "
+                    f"own cache"
+                )
+            else:
+                settings["cache_backend"] = "sqlite"
+    apply_settings(**settings)
+
+    logger.info(
+        f"Serving {args.transport} on {args.host}:{args.port} "
+        f"with {args.workers} worker(s)"
+    )
+    uvicorn.run(
+        "transfermarkt_mcp.main:http_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        log_level=config.log_level.lower(),
+    )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the MCP server, or a snapshot subcommand."""
+    args = build_parser().parse_args(argv)
+    if args.command == "snapshot":
+        sys.exit(run_snapshot(args))
+    if args.transport != "stdio":
+        sys.exit(serve_http(args))
 
+    mcp = get_server()
+    if args.snapshot:
+        from transfermarkt_mcp.server import preload_snapshot
 
-def main() -> None:
-    """Run the MCP server."""
+        preload_snapshot(args.snapshot)
     try:
         logger.info("Starting Transfermarkt MCP Server...")
         mcp.run()
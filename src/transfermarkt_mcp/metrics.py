@@ -0,0 +1,391 @@
+"""
+Prometheus metrics and optional OpenTelemetry spans.
+
+Tool calls and upstream requests are recorded into an in-process
+registry that renders the Prometheus text format, served at ``/metrics``
+by the HTTP transports. Component stats (cache, concurrency limit,
+prefetcher, name index, transfer graph) are read when scraped. With
+``--workers`` each process has its own registry, and a scrape shows the
+counts of the worker that answered it. With
+``OTEL_ENABLED`` and opentelemetry-api installed, the same events are
+also emitted as spans.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from transfermarkt_mcp.config import config
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+# opentelemetry.trace once _tracer() has looked for it, or None if missing
+trace: Any = ...
+
+logger = logging.getLogger(__name__)
+
+# Seconds; upstream calls with retries can take tens of seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[str, ...]
+
+# Cache stats that only ever grow, exported as counters
+CACHE_COUNTERS = ("hits", "misses", "stale_hits", "evictions")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(v))}"' for name, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = tuple(labels[name] for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(tuple(labels[name] for name in self.labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            for key, value in values
+        ]
+
+
+class Histogram:
+    """Cumulative histogram with labels and fixed bucket bounds."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # Per label set: count per bucket (not cumulative), sum, count
+        self._series: Dict[Labels, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(labels[name] for name in self.labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            series[0][bisect.bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            series = self._series.get(tuple(labels[name] for name in self.labels))
+            return series[2] if series else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            series = sorted(
+                (key, (list(counts), total, count))
+                for key, (counts, total, count) in self._series.items()
+            )
+        lines = []
+        for key, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket in zip(self.buckets, counts):
+                cumulative += bucket
+                labels = _format_labels(
+                    self.labels + ("le",), key + (_format_value(bound),)
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+def _flatten(prefix: str, stats: Dict[str, Any]) -> Iterator[Tuple[str, str, float]]:
+    """Yield ``(name, key, value)`` per numeric value, nested keys joined."""
+    for key, value in stats.items():
+        name = f"{prefix}_{key}"
+        if isinstance(value, dict):
+            yield from _flatten(name, value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, key, value
+
+
+class Registry:
+    """Metrics rendered together in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Any] = {}
+        self._stats: Dict[
+            str, Tuple[str, Callable[[], Dict[str, Any]], Sequence[str]]
+        ] = {}
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        metric: Counter = self._metrics.setdefault(name, Counter(name, help, labels))
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric: Histogram = self._metrics.setdefault(
+            name, Histogram(name, help, labels, buckets)
+        )
+        return metric
+
+    def add_stats(
+        self,
+        prefix: str,
+        help: str,
+        stats: Callable[[], Dict[str, Any]],
+        counters: Sequence[str] = (),
+    ) -> None:
+        """
+        Export a component's ``stats()`` read at scrape time, one metric
+        per numeric value, named ``{prefix}_{key}`` (nested keys joined).
+        Values under a key in ``counters`` only ever grow and are exported
+        as counters, with a ``_total`` suffix; the rest are gauges.
+        """
+        self._stats[prefix] = (help, stats, counters)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        for prefix, (help, stats, counters) in self._stats.items():
+            try:
+                values = list(_flatten(prefix, stats()))
+            except Exception as e:
+                logger.warning(f"Could not collect {prefix} stats: {e}")
+                continue
+            for name, key, value in values:
+                kind = "gauge"
+                if key in counters:
+                    name, kind = f"{name}_total", "counter"
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+TOOL_DURATION = registry.histogram(
+    "transfermarkt_tool_duration_seconds",
+    "Duration of MCP tool calls.",
+    ["tool", "outcome"],
+)
+TOOL_RESULT_BYTES = registry.counter(
+    "transfermarkt_tool_result_bytes_total",
+    "Bytes of tool results returned to MCP clients.",
+    ["tool"],
+)
+UPSTREAM_DURATION = registry.histogram(
+    "transfermarkt_upstream_request_duration_seconds",
+    "Duration of upstream API requests, retries included.",
+    ["endpoint", "status"],
+)
+UPSTREAM_BYTES = registry.counter(
+    "transfermarkt_upstream_response_bytes_total",
+    "Bytes of upstream response bodies received.",
+    ["endpoint"],
+)
+UPSTREAM_RETRIES = registry.counter(
+    "transfermarkt_upstream_retries_total",
+    "Upstream request attempts that were retried.",
+    ["endpoint"],
+)
+UPSTREAM_ERRORS = registry.counter(
+    "transfermarkt_upstream_errors_total",
+    "Upstream requests that ended in an error, by type.",
+    ["endpoint", "type"],
+)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    The endpoint with its variable segment replaced, so metrics have one
+    series per kind of call: "players/8198/stats" is "players/{id}/stats".
+    """
+    parts = endpoint.strip("/").split("/")
+    if len(parts) > 2 and parts[1] == "search":
+        return f"{parts[0]}/search/{{query}}"
+    if len(parts) > 1:
+        parts[1] = "{id}"
+    return "/".join(parts)
+
+
+def _tracer() -> Any:
+    """The package's tracer when tracing is on, importing OpenTelemetry then."""
+    global trace
+    if not config.otel_enabled:
+        return None
+    if trace is ...:
+        try:
+            from opentelemetry import trace as module
+
+            trace = module
+        except ImportError:  # optional: pip install transfermarkt-mcp[otel]
+            trace = None
+    return None if trace is None else trace.get_tracer("transfermarkt_mcp")
+
+
+def record_upstream(
+    endpoint: str,
+    status: str,
+    seconds: float,
+    size: Optional[int] = None,
+    error: Optional[str] = None,
+) -> None:
+    """
+    Record one upstream request of ``endpoint`` (a template): its final
+    HTTP status (or error type, if none arrived), duration, body size and
+    error type, plus a span when tracing is on.
+    """
+    UPSTREAM_DURATION.observe(seconds, endpoint=endpoint, status=status)
+    if size:
+        UPSTREAM_BYTES.inc(size, endpoint=endpoint)
+    if error is not None:
+        UPSTREAM_ERRORS.inc(endpoint=endpoint, type=error)
+
+    tracer = _tracer()
+    if tracer is not None:
+        # Emitted once finished, under whatever span is current (the tool's)
+        end = time.time_ns()
+        span = tracer.start_span(
+            f"GET {endpoint}",
+            start_time=end - int(seconds * 1e9),
+            attributes={"http.route": endpoint, "http.status": status},
+        )
+        if error is not None:
+            span.set_attribute("error.type", error)
+        span.end(end_time=end)
+
+
+@contextmanager
+def tool_span(tool: str) -> Iterator[None]:
+    """Make a span for a tool call current, when tracing is on."""
+    tracer = _tracer()
+    if tracer is None:
+        yield
+        return
+    with tracer.start_as_current_span(f"tool {tool}", attributes={"mcp.tool": tool}):
+        yield
+
+
+async def metrics_endpoint(request: Any) -> Any:
+    """``GET /metrics``: the registry in the Prometheus text format."""
+    from starlette.responses import Response
+
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
+def _add_client_stats(client: Any) -> None:
+    """Export the stats of the client's cache, limiter and prefetcher."""
+    from transfermarkt_mcp.prefetch import prefetcher
+
+    if client.cache is not None:
+        registry.add_stats(
+            "transfermarkt_cache",
+            "Response cache stats.",
+            client.cache.stats,
+            counters=CACHE_COUNTERS,
+        )
+    if client.concurrency is not None:
+        registry.add_stats(
+            "transfermarkt_concurrency",
+            "Adaptive upstream concurrency limit.",
+            client.concurrency.stats,
+        )
+    if prefetcher is not None:
+        registry.add_stats(
+            "transfermarkt_prefetch",
+            "Background prefetch outcomes.",
+            prefetcher.stats,
+            counters=list(prefetcher.counts),
+        )
+
+
+def register_metrics(mcp: "FastMCP") -> None:
+    """
+    Add the /metrics route and component stats to ``mcp``; tool calls are
+    recorded by the server's ToolMetricsMiddleware.
+    """
+    from transfermarkt_mcp.client import on_client
+
+    mcp.custom_route("/metrics", methods=["GET"])(metrics_endpoint)
+
+    if config.search_index_enabled:
+        from transfermarkt_mcp.search_index import index
+
+        registry.add_stats(
+            "transfermarkt_search_index_entries",
+            "Names in the search index, by kind.",
+            index.stats,
+        )
+    if config.transfer_graph_enabled:
+        from transfermarkt_mcp.transfer_graph import graph
+
+        registry.add_stats(
+            "transfermarkt_transfer_graph", "Transfer graph size.", graph.stats
+        )
+    on_client(_add_client_stats)
+    if config.otel_enabled and _tracer() is None:
+        logger.warning("OTEL_ENABLED is set but opentelemetry-api is not installed")
+
+    logger.info("Serving metrics at /metrics")
@@ -0,0 +1,390 @@
+"""
+Typed, compact models of the main upstream entities.
+
+Each model is a slots dataclass built from a decoded response with
+``from_dict`` (or straight from the body with ``from_json``), which checks
+the shape of every known field and raises ``ModelValidationError`` naming
+the offending path. Keys the model does not know are kept in ``extra`` and
+fields absent from the response stay ``MISSING``, so ``to_dict`` rebuilds
+the original object. Holding entries as slots instances instead of dicts
+is what makes them compact in the response cache.
+"""
+
+import logging
+from dataclasses import Field, dataclass, field, fields
+from fnmatch import fnmatchcase
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from transfermarkt_mcp import jsonlib
+
+logger = logging.getLogger(__name__)
+
+# A JSON value that is not an object or array
+Scalar = Union[str, int, float, bool, None]
+
+M = TypeVar("M", bound="Model")
+
+
+class _Missing:
+    """Marker for a field absent from the response."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+MISSING: Any = _Missing()
+
+
+class ModelValidationError(ValueError):
+    """An upstream response does not have the shape its model expects."""
+
+    def __init__(self, path: str, message: str) -> None:
+        super().__init__(f"{path}: {message}")
+        self.path = path
+
+
+def key(json_key: str, required: bool = False) -> Any:
+    """Declare a field read from ``json_key`` in the response."""
+    return field(default=MISSING, metadata={"key": json_key, "required": required})
+
+
+# (attribute, JSON key, kind, nested model, required) per model class
+_Spec = List[Tuple[str, str, str, Optional[Type["Model"]], bool]]
+_SPECS: Dict[type, _Spec] = {}
+
+
+def _kind(annotation: Any) -> Tuple[str, Optional[Type["Model"]]]:
+    """Classify a field annotation for validation and conversion."""
+    if isinstance(annotation, type) and issubclass(annotation, Model):
+        return "model", annotation
+    origin = get_origin(annotation)
+    if origin in (list, List):
+        (item,) = get_args(annotation) or (Any,)
+        if isinstance(item, type) and issubclass(item, Model):
+            return "models", item
+        return "list", None
+    if origin in (dict, Dict):
+        return "object", None
+    if annotation == Scalar:
+        return "scalar", None
+    return "any", None
+
+
+class Model:
+    """Base of the response models; subclasses are slots dataclasses."""
+
+    __slots__ = ()
+    # Set on each subclass by @dataclass; declared for fields() to type-check
+    __dataclass_fields__: ClassVar[Dict[str, "Field[Any]"]]
+
+    extra: Optional[Dict[str, Any]]
+
+    @classmethod
+    def _spec(cls) -> _Spec:
+        spec = _SPECS.get(cls)
+        if spec is None:
+            hints = get_type_hints(cls)
+            spec = []
+            for f in fields(cls):
+                if "key" not in f.metadata:
+                    continue
+                kind, model = _kind(hints[f.name])
+                spec.append(
+                    (f.name, f.metadata["key"], kind, model, f.metadata["required"])
+                )
+            _SPECS[cls] = spec
+        return spec
+
+    @classmethod
+    def from_dict(cls: Type[M], data: Any, path: Optional[str] = None) -> M:
+        """Build the model from a decoded JSON object, validating its shape."""
+        path = path or cls.__name__
+        if not isinstance(data, dict):
+            raise ModelValidationError(
+                path, f"expected an object, got {type(data).__name__}"
+            )
+
+        values: Dict[str, Any] = {}
+        known = set()
+        for attr, json_key, kind, model, required in cls._spec():
+            known.add(json_key)
+            if json_key not in data:
+                if required:
+                    raise ModelValidationError(
+                        f"{path}.{json_key}", "missing required field"
+                    )
+                continue
+            values[attr] = _convert(data[json_key], kind, model, f"{path}.{json_key}")
+
+        values["extra"] = {k: v for k, v in data.items() if k not in known} or None
+        return cls(**values)
+
+    @classmethod
+    def from_json(cls: Type[M], body: Union[bytes, str]) -> M:
+        """Decode a response body and build the model from it."""
+        try:
+            data = jsonlib.loads(body)
+        except ValueError as e:
+            raise ModelValidationError(cls.__name__, f"invalid JSON: {e}") from e
+        return cls.from_dict(data)
+
+    def get(self, attr: str, default: Any = None) -> Any:
+        """Return a field's value, or ``default`` if it was absent."""
+        value = getattr(self, attr)
+        return default if value is MISSING else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Rebuild the JSON object the model was created from."""
+        data: Dict[str, Any] = {}
+        for attr, json_key, kind, _, _ in self._spec():
+            value = getattr(self, attr)
+            if value is MISSING:
+                continue
+            if kind == "model" and value is not None:
+                value = value.to_dict()
+            elif kind == "models" and value is not None:
+                value = [item.to_dict() for item in value]
+            data[json_key] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+def _convert(value: Any, kind: str, model: Optional[Type[Model]], path: str) -> Any:
+    """Validate ``value`` against a field kind, building nested models."""
+    if value is None or kind == "any":
+        return value
+    if kind == "scalar":
+        if isinstance(value, (dict, list)):
+            raise ModelValidationError(
+                path, f"expected a scalar, got {type(value).__name__}"
+            )
+        return value
+    if kind == "object":
+        if not isinstance(value, dict):
+            raise ModelValidationError(
+                path, f"expected an object, got {type(value).__name__}"
+            )
+        return value
+    if kind == "model" and model is not None:
+        return model.from_dict(value, path)
+    if not isinstance(value, list):
+        raise ModelValidationError(
+            path, f"expected an array, got {type(value).__name__}"
+        )
+    if kind == "models" and model is not None:
+        return [model.from_dict(item, f"{path}[{i}]") for i, item in enumerate(value)]
+    return value
+
+
+@dataclass(slots=True)
+class ClubRef(Model):
+    """A club as referenced from players, transfers and competitions."""
+
+    id: Scalar = key("id")
+    name: Scalar = key("name")
+    extra: Optional[Dict[str, Any]] = None
+
+
+@dataclass(slots=True)
+class PlayerClub(Model):
+    """A player's current club and contract."""
+
+    id: Scalar = key("id")
+    name: Scalar = key("name")
+    joined: Scalar = key("joined")
+    contract_expires: Scalar = key("contractExpires")
+    contract_option: Scalar = key("contractOption")
+    extra: Optional[Dict[str, Any]] = None
+
+
+@dataclass(slots=True)
+class PlayerProfile(Model):
+    """``players/{id}/profile``."""
+
+    id: Scalar = key("id", required=True)
+    url: Scalar = key("url")
+    name: Scalar = key("name")
+    full_name: Scalar = key("fullName")
+    image_url: Scalar = key("imageUrl")
+    date_of_birth: Scalar = key("dateOfBirth")
+    place_of_birth: Dict[str, Any] = key("placeOfBirth")
+    age: Scalar = key("age")
+    height: Scalar = key("height")
+    citizenship: List[Any] = key("citizenship")
+    is_retired: Scalar = key("isRetired")
+    position: Any = key("position")
+    foot: Scalar = key("foot")
+    shirt_number: Scalar = key("shirtNumber")
+    club: Any = key("club")
+    market_value: Scalar = key("marketValue")
+    agent: Dict[str, Any] = key("agent")
+    updated_at: Scalar = key("updatedAt")
+    extra: Optional[Dict[str, Any]] = None
+
+
+@dataclass(slots=True)
+class MarketValuePoint(Model):
+    """One point of a market value history."""
+
+    age: Scalar = key("age")
+    date: Scalar = key("date")
+    club_id: Scalar = key("clubId")
+    club_name: Scalar = key("clubName")
+    value: Scalar = key("value")
+    extra: Optional[Dict[str, Any]] = None
+
+
+@dataclass(slots=True)
+class MarketValueHistory(Model):
+    """``players/{id}/market_value``."""
+
+    id: Scalar = key("id", required=True)
+    market_value: Scalar = key("marketValue")
+    market_value_history: List[MarketValuePoint] = key("marketValueHistory")
+    updated_at: Scalar = key("updatedAt")
+    extra: Optional[Dict[str, Any]] = None
+
+
+@dataclass(slots=True)
+class Transfer(Model):
+    """One move in a transfer history."""
+
+    id: Scalar = key("id")
+    club_from: ClubRef = key("clubFrom")
+    club_to: ClubRef = key("clubTo")
+    date: Scalar = key("date")
+    upcoming: Scalar = key("upcoming")
+    season: Scalar = key("season")
+    market_value: Scalar = key("marketValue")
+    fee: Scalar = key("fee")
+    extra: Optional[Dict[str, Any]] = None
+
+
+@dataclass(slots=True)
+class TransferHistory(Model):
+    """``players/{id}/transfers``."""
+
+    id: Scalar = key("id", required=True)
+    transfers: List[Transfer] = key("transfers")
+    youth_clubs: List[Any] = key("youthClubs")
+    updated_at: Scalar = key("updatedAt")
+    extra: Optional[Dict[str, Any]] = None
+
+
+@dataclass(slots=True)
+class ClubProfile(Model):
+    """``clubs/{id}/profile``."""
+
+    id: Scalar = key("id", required=True)
+    url: Scalar = key("url")
+    name: Scalar = key("name")
+    official_name: Scalar = key("officialName")
+    image: Scalar = key("image")
+    founded_on: Scalar = key("foundedOn")
+    members: Scalar = key("members")
+    stadium_name: Scalar = key("stadiumName")
+    stadium_seats: Scalar = key("stadiumSeats")
+    current_market_value: Scalar = key("currentMarketValue")
+    colors: List[Any] = key("colors")
+    squad: Dict[str, Any] = key("squad")
+    league: Dict[str, Any] = key("league")
+    updated_at: Scalar = key("updatedAt")
+    extra: Optional[Dict[str, Any]] = None
+
+
+@dataclass(slots=True)
+class SquadEntry(Model):
+    """One player in a club's squad list."""
+
+    id: Scalar = key("id")
+    name: Scalar = key("name")
+    position: Scalar = key("position")
+    date_of_birth: Scalar = key("dateOfBirth")
+    age: Scalar = key("age")
+    nationality: List[Any] = key("nationality")
+    height: Scalar = key("height")
+    foot: Scalar = key("foot")
+    joined_on: Scalar = key("joinedOn")
+    signed_from: Scalar = key("signedFrom")
+    contract: Scalar = key("contract")
+    market_value: Scalar = key("marketValue")
+    status: Scalar = key("status")
+    extra: Optional[Dict[str, Any]] = None
+
+
+@dataclass(slots=True)
+class ClubSquad(Model):
+    """``clubs/{id}/players``."""
+
+    id: Scalar = key("id")
+    players: List[SquadEntry] = key("players")
+    updated_at: Scalar = key("updatedAt")
+    extra: Optional[Dict[str, Any]] = None
+
+
+@dataclass(slots=True)
+class Competition(Model):
+    """``competitions/{id}/clubs``: a competition season and its clubs."""
+
+    id: Scalar = key("id")
+    name: Scalar = key("name")
+    season_id: Scalar = key("seasonId")
+    clubs: List[ClubRef] = key("clubs")
+    updated_at: Scalar = key("updatedAt")
+    extra: Optional[Dict[str, Any]] = None
+
+
+# Endpoint patterns whose responses are held as models in the cache
+ENDPOINT_MODELS: List[Tuple[str, Type[Model]]] = [
+    ("players/*/profile", PlayerProfile),
+    ("players/*/market_value", MarketValueHistory),
+    ("players/*/transfers", TransferHistory),
+    ("clubs/*/profile", ClubProfile),
+    ("clubs/*/players", ClubSquad),
+    ("competitions/*/clubs", Competition),
+]
+
+
+def model_for(endpoint: str) -> Optional[Type[Model]]:
+    """Return the model of responses from ``endpoint``, if there is one."""
+    endpoint = endpoint.strip("/")
+    for pattern, model in ENDPOINT_MODELS:
+        if fnmatchcase(endpoint, pattern):
+            return model
+    return None
+
+
+def compact(endpoint: str, value: Any) -> Any:
+    """Convert a response to its model for storage; other values pass through."""
+    model = model_for(endpoint)
+    if model is None or not isinstance(value, dict):
+        return value
+    try:
+        return model.from_dict(value)
+    except ModelValidationError as e:
+        logger.debug(f"Caching {endpoint} as a plain dict: {e}")
+        return value
+
+
+def expand(value: Any) -> Any:
+    """Turn a stored model back into the response object."""
+    return value.to_dict() if isinstance(value, Model) else value
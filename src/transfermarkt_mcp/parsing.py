@@ -0,0 +1,122 @@
+"""Helpers for normalising loosely typed values in upstream responses."""
+
+import re
+from datetime import date, datetime
+from typing import Any, Optional
+
+_MONEY_PATTERN = re.compile(r"(-?\d+(?:[.,]\d+)*)\s*(bn|b|m|k|th\.?)?", re.IGNORECASE)
+_MONEY_MULTIPLIERS = {"bn": 1e9, "b": 1e9, "m": 1e6, "k": 1e3, "th": 1e3, "th.": 1e3}
+_DATE_FORMATS = ("%Y-%m-%d", "%b %d, %Y", "%d.%m.%Y", "%d/%m/%Y")
+
+
+def _join_thousands(text: str) -> Optional[str]:
+    """Drop the separators from "1.234" or "1,500,000"; None unless grouped by 3."""
+    groups = re.split(r"[.,]", text)
+    if any(len(group) != 3 for group in groups[1:]):
+        return None
+    return "".join(groups)
+
+
+def _parse_amount(text: str) -> Optional[float]:
+    """
+    Parse "45.00", "1,5", "1,500,000" or "1.500.000,50" into a float.
+
+    With both separators the last one is the decimal point; a repeated one,
+    or a single comma followed by three digits, separates thousands.
+    """
+    decimal = ""
+    if "." in text and "," in text:
+        decimal = text[max(text.rfind("."), text.rfind(","))]
+    elif text.count(".") == 1:
+        decimal = "."
+    elif text.count(",") == 1 and not re.search(r",\d{3}$", text):
+        decimal = ","
+    whole, fraction = text.rsplit(decimal, 1) if decimal else (text, "0")
+    digits = _join_thousands(whole)
+    if digits is None:
+        return None
+    return float(f"{digits}.{fraction}")
+
+
+def parse_money(value: Any) -> Optional[float]:
+    """
+    Parse a market value or fee into euros.
+
+    Accepts numbers as-is and strings such as "€45.00m", "€500k",
+    "€1.20bn" or "€1,500,000". Returns None for missing or non-numeric
+    values such as "-", "?" or "free transfer".
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _MONEY_PATTERN.search(str(value))
+    if match is None:
+        return None
+    amount = _parse_amount(match.group(1))
+    if amount is None:
+        return None
+    unit = (match.group(2) or "").lower()
+    return amount * _MONEY_MULTIPLIERS.get(unit, 1.0)
+
+
+def parse_int(value: Any) -> Optional[int]:
+    """
+    Parse counts such as 12, "12", "1.234" or "90'" into an int; returns
+    None for fractional values such as "12.5".
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    digits = _join_thousands(re.sub(r"[^\d.,-]", "", str(value)))
+    if digits is None:
+        return None
+    try:
+        return int(digits)
+    except ValueError:
+        return None
+
+
+def season_start_year(season: Any) -> Optional[int]:
+    """
+    Normalise a season identifier to the year it starts in.
+
+    Accepts "2023", 2023, "23/24" and "2023/24"; returns None otherwise.
+    """
+    if season is None:
+        return None
+    text = str(season).strip()
+    match = re.fullmatch(r"(\d{2}|\d{4})(?:/(\d{2}|\d{4}))?", text)
+    if match is None:
+        return None
+    start = int(match.group(1))
+    if len(match.group(1)) == 2:
+        start += 1900 if start >= 70 else 2000
+    return start
+
+
+def parse_date(value: Any) -> Optional[date]:
+    """
+    Parse a date such as "2023-12-19", "Dec 19, 2023" or "19.12.2023".
+
+    A time part after "T" or a space in ISO dates is ignored; returns None
+    for missing or unrecognised values.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    if re.match(r"\d{4}-\d{2}-\d{2}[T ]", text):
+        text = text[:10]
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
@@ -0,0 +1,211 @@
+"""Speculative prefetching of the calls that usually follow a lookup."""
+
+import asyncio
+import logging
+import threading
+from contextvars import ContextVar
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from transfermarkt_mcp.cache import TieredCache, make_cache_key
+from transfermarkt_mcp.config import config
+from transfermarkt_mcp.ratelimit import TokenBucket
+
+if TYPE_CHECKING:
+    from transfermarkt_mcp.client import TransfermarktClient
+
+logger = logging.getLogger(__name__)
+
+# Follow-up endpoints per response: (endpoint pattern, where the IDs come
+# from - "results" of a search or the endpoint's own ID - and templates)
+RULES: List[Tuple[str, str, List[str]]] = [
+    (
+        "players/search/*",
+        "results",
+        [
+            "players/{id}/profile",
+            "players/{id}/market_value",
+            "players/{id}/transfers",
+        ],
+    ),
+    (
+        "players/*/profile",
+        "endpoint",
+        ["players/{id}/market_value", "players/{id}/transfers"],
+    ),
+    ("clubs/search/*", "results", ["clubs/{id}/profile", "clubs/{id}/players"]),
+    ("clubs/*/profile", "endpoint", ["clubs/{id}/players"]),
+    ("competitions/search/*", "results", ["competitions/{id}/clubs"]),
+]
+
+# Set inside prefetch tasks so their own responses trigger nothing further
+_prefetching: ContextVar[bool] = ContextVar("prefetching", default=False)
+
+
+def follow_ups(endpoint: str, result: Any, top_results: int = 1) -> List[str]:
+    """Return the endpoints likely to be requested after ``endpoint``."""
+    endpoint = endpoint.strip("/")
+    for pattern, source, templates in RULES:
+        if not fnmatchcase(endpoint, pattern):
+            continue
+        if source == "endpoint":
+            ids = [endpoint.split("/")[1]]
+        else:
+            results = result.get("results") if isinstance(result, dict) else None
+            ids = [
+                item["id"]
+                for item in (results if isinstance(results, list) else [])
+                if isinstance(item, dict) and item.get("id")
+            ][:top_results]
+        return [template.format(id=i) for i in ids for template in templates]
+    return []
+
+
+class Prefetcher:
+    """
+    Client observer that warms the cache with likely follow-up calls.
+
+    After an uncached search or profile response it fetches the top
+    results' usual next endpoints in background tasks. Prefetches never
+    compete with foreground calls: they are spent from their own
+    ``budget`` per minute, at most ``concurrency`` run at once, and none
+    start while the adaptive concurrency limit is more than ``max_load``
+    full or the upstream rate limit is short of tokens. Anything already
+    cached is skipped.
+    """
+
+    def __init__(
+        self,
+        client: "TransfermarktClient",
+        budget: float = 60,
+        concurrency: int = 2,
+        top_results: int = 1,
+        max_load: float = 0.5,
+    ) -> None:
+        self.client = client
+        # Up to ten seconds' worth of budget can be spent at once
+        self.budget = TokenBucket(budget / 60.0, burst=max(1, int(budget / 6)))
+        self.concurrency = concurrency
+        self.top_results = top_results
+        self.max_load = max_load
+        self._active: Set[str] = set()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {
+            "fetched": 0,
+            "failed": 0,
+            "cached": 0,
+            "busy": 0,
+            "over_budget": 0,
+        }
+
+    def observe(self, endpoint: str, result: Any) -> None:
+        """Schedule the follow-ups of a foreground response."""
+        if _prefetching.get():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # the blocking client path has no loop to prefetch on
+        for follow_up in follow_ups(endpoint, result, self.top_results):
+            self._schedule(loop, follow_up)
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop, endpoint: str) -> None:
+        # A disk tier is checked by the task, off the event loop
+        cache = getattr(self.client.cache, "memory", self.client.cache)
+        if cache is not None and cache.contains(make_cache_key(endpoint)):
+            self._count("cached")
+            return
+        with self._lock:
+            if endpoint in self._active:
+                return
+            if len(self._active) >= self.concurrency or self._upstream_busy():
+                self.counts["busy"] += 1
+                return
+            if not self.budget.try_acquire():
+                self.counts["over_budget"] += 1
+                return
+            self._active.add(endpoint)
+        task = loop.create_task(self._fetch(endpoint))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _upstream_busy(self) -> bool:
+        """True when foreground calls fill the adaptive concurrency limit."""
+        concurrency = self.client.concurrency
+        if concurrency is None:
+            return False
+        stats = concurrency.stats()
+        return bool(stats["waiting"]) or (
+            stats["in_flight"] >= stats["limit"] * self.max_load
+        )
+
+    async def _rate_limited(self) -> bool:
+        """True when the upstream rate limit is short of tokens."""
+        limiter = self.client.rate_limiter
+        return await limiter.aavailable() < limiter.burst * self.max_load
+
+    async def _fetch(self, endpoint: str) -> None:
+        from transfermarkt_mcp.client import is_error
+
+        _prefetching.set(True)
+        try:
+            cache = self.client.cache
+            if isinstance(cache, TieredCache) and await cache.acontains(
+                make_cache_key(endpoint)
+            ):
+                self._count("cached")
+                return
+            # Checked here as a shared rate limit reads its database
+            if await self._rate_limited():
+                self._count("busy")
+                return
+            result = await self.client.aget(endpoint)
+            self._count("failed" if is_error(result) else "fetched")
+            logger.debug(f"Prefetched {endpoint}")
+        except Exception as e:
+            self._count("failed")
+            logger.debug(f"Prefetch of {endpoint} failed: {e}")
+        finally:
+            with self._lock:
+                self._active.discard(endpoint)
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self.counts[outcome] += 1
+
+    async def wait(self) -> None:
+        """Wait for the prefetches in flight to finish."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def cancel(self) -> None:
+        """Cancel the prefetches in flight."""
+        for task in list(self._tasks):
+            task.cancel()
+
+    def stats(self) -> Dict[str, int]:
+        """Return prefetch outcome counters."""
+        with self._lock:
+            return dict(self.counts, in_flight=len(self._active))
+
+
+# The server's prefetcher, once started
+prefetcher: Optional[Prefetcher] = None
+
+
+def start_prefetcher(client: "TransfermarktClient") -> Optional[Prefetcher]:
+    """Attach a prefetcher configured from the environment to ``client``."""
+    global prefetcher
+    if client.cache is None:
+        logger.warning("Prefetching needs the response cache; not starting it")
+        return None
+    if prefetcher is None:
+        prefetcher = Prefetcher(
+            client,
+            budget=config.prefetch_budget,
+            concurrency=config.prefetch_concurrency,
+            top_results=config.prefetch_top_results,
+        )
+        client.add_observer(prefetcher.observe)
+    return prefetcher
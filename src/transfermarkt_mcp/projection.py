@@ -0,0 +1,114 @@
+"""Server-side field selection to shrink tool results before serialization."""
+
+from typing import Any, Dict, List, Optional
+
+from transfermarkt_mcp.cache import STALE_FIELDS
+from transfermarkt_mcp.config import config
+
+# Alias that expands to a tool's compact default projection
+COMPACT = "@compact"
+
+# A compiled projection: nested dicts of path segments, with KEEP marking
+# a segment whose whole subtree is kept.
+Trie = Dict[str, Any]
+KEEP = True
+
+
+def compile_fields(fields: List[str]) -> Trie:
+    """Compile dotted paths such as "transfers.clubTo.name" into a trie."""
+    trie: Trie = {}
+    for field in fields:
+        parts = [part for part in field.strip().split(".") if part]
+        if not parts:
+            continue
+        node = trie
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is KEEP:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = KEEP
+    return trie
+
+
+def _merge(a: Any, b: Any) -> Any:
+    """Merge two subtrees, either of which may be KEEP."""
+    if a is KEEP or b is KEEP:
+        return KEEP
+    merged = dict(a)
+    for key, value in b.items():
+        merged[key] = _merge(merged[key], value) if key in merged else value
+    return merged
+
+
+def _select(node: Any, sub: Any) -> Any:
+    """Project ``node`` by the subtree ``sub``, which may be KEEP."""
+    return node if sub is KEEP else _apply(node, sub)
+
+
+def _apply(node: Any, trie: Trie) -> Any:
+    if isinstance(node, list):
+        # Paths step into lists implicitly; an explicit "*" segment does too.
+        if "*" in trie:
+            rest = {key: value for key, value in trie.items() if key != "*"}
+            sub = _merge(rest, trie["*"])
+            return [_select(item, sub) for item in node]
+        return [_apply(item, trie) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    wildcard = trie.get("*")
+    if wildcard is None:
+        return {
+            key: _select(node[key], sub) for key, sub in trie.items() if key in node
+        }
+
+    projected = {}
+    for key, value in node.items():
+        sub = trie.get(key)
+        projected[key] = _select(
+            value, wildcard if sub is None else _merge(sub, wildcard)
+        )
+    return projected
+
+
+def project(data: Any, fields: List[str]) -> Any:
+    """
+    Keep only the given dotted paths of ``data``.
+
+    Paths step into lists element-wise, so "transfers.fee" keeps the fee of
+    every transfer; "*" matches every key (or list item) at its level, and
+    a bare "*" keeps everything. Missing paths are skipped silently.
+    """
+    return _apply(data, compile_fields(fields))
+
+
+def apply_projection(
+    result: Dict[str, Any], fields: Optional[List[str]], compact: List[str]
+) -> Dict[str, Any]:
+    """
+    Project a tool result using the caller's ``fields``.
+
+    ``"@compact"`` in ``fields`` expands to the tool's ``compact`` paths.
+    When ``fields`` is None the server default applies: the full payload,
+    or the compact projection if DEFAULT_PROJECTION=compact. Error
+    dictionaries are never projected, and the markers of a stale cached
+    response are always kept.
+    """
+    if "error" in result:
+        return result
+    if fields is None:
+        if config.default_projection != "compact":
+            return result
+        fields = [COMPACT]
+    if not fields:
+        return result
+
+    expanded: List[str] = []
+    for field in fields:
+        expanded.extend(compact if field == COMPACT else [field])
+    if result.get("stale") is True:
+        expanded.extend(STALE_FIELDS)
+    projected: Dict[str, Any] = project(result, expanded)
+    return projected
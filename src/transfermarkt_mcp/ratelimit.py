@@ -0,0 +1,373 @@
+"""Client-side rate limiting and adaptive concurrency for upstream requests."""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Smoothing of the latency average compared against the baseline
+LATENCY_ALPHA = 0.2
+# How quickly the latency baseline follows latencies above it
+BASELINE_DRIFT = 0.01
+# Latency rises smaller than this (seconds) never count as congestion
+LATENCY_TOLERANCE = 0.05
+
+
+class TokenBucket:
+    """
+    Token bucket shared by every caller of the client.
+
+    ``reserve`` takes a token and returns how long the caller must wait
+    before sending; tokens are handed out in arrival order, so concurrent
+    callers are spread evenly at ``rate`` per second after an initial
+    ``burst``. A ``rate`` of 0 disables limiting, but pauses still apply.
+    The ``a``-prefixed methods are for the event loop.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self, write: bool = True) -> Iterator[float]:
+        """
+        Hold the bucket's state for updating, or only reading when not
+        ``write``; yields the time.
+        """
+        with self._lock:
+            yield time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token; return the seconds to wait before using it."""
+        with self._locked(write=self.rate > 0) as now:
+            if self.rate <= 0:
+                return max(0.0, self._blocked_until - now)
+            self._refill(now)
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(delay, self._blocked_until - now)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def available(self) -> float:
+        """Return the tokens that could be taken right now without waiting."""
+        with self._locked(write=self.rate > 0) as now:
+            if now < self._blocked_until:
+                return 0.0
+            if self.rate <= 0:
+                return float(self.burst)
+            self._refill(now)
+            return max(0.0, self._tokens)
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available now; never waits or borrows."""
+        with self._locked(write=self.rate > 0) as now:
+            if now < self._blocked_until:
+                return False
+            if self.rate <= 0:
+                return True
+            self._refill(now)
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for ``seconds``, e.g. after a Retry-After."""
+        with self._locked() as now:
+            self._blocked_until = max(self._blocked_until, now + seconds)
+
+    async def areserve(self) -> float:
+        return self.reserve()
+
+    async def aavailable(self) -> float:
+        return self.available()
+
+    async def apause(self, seconds: float) -> None:
+        self.pause(seconds)
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    Token bucket shared by every process on the host through a SQLite file.
+
+    Each operation reads and writes the bucket's one row in an immediate
+    transaction, so worker processes draw from one budget of ``rate`` per
+    second and a Retry-After pause in one holds them all. Timestamps are
+    wall-clock so they are comparable across processes. With a ``rate``
+    of 0 only pauses are shared, and checking for one is a plain read. If
+    the database fails, the error is logged and the bucket goes on
+    limiting this process alone from the last state it read. The
+    ``a``-prefixed methods run the database access in a worker thread.
+    """
+
+    def __init__(
+        self, path: str, rate: float, burst: int = 1, busy_timeout: float = 5.0
+    ) -> None:
+        super().__init__(rate, burst)
+        self.path = path
+        self._updated = time.time()
+        self._failed = False
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(
+            path, timeout=busy_timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS bucket (id INTEGER PRIMARY KEY, "
+            "tokens REAL NOT NULL, updated REAL NOT NULL, blocked_until REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO bucket VALUES (0, ?, ?, 0)",
+            (self._tokens, self._updated),
+        )
+
+    def _database_failed(self, e: sqlite3.Error) -> None:
+        if not self._failed:
+            logger.warning(
+                f"Shared rate limit {self.path} failed, limiting this process "
+                f"alone: {e}"
+            )
+        self._failed = True
+        try:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+        except sqlite3.Error:
+            pass
+
+    def _begin(self) -> bool:
+        """Lock the row and load its state; False if the database failed."""
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            row = self._conn.execute(
+                "SELECT tokens, updated, blocked_until FROM bucket WHERE id = 0"
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._database_failed(e)
+            return False
+        if row is not None:
+            self._tokens, self._updated, self._blocked_until = row
+        return True
+
+    def _commit(self) -> None:
+        try:
+            self._conn.execute(
+                "UPDATE bucket SET tokens = ?, updated = ?, blocked_until = ? "
+                "WHERE id = 0",
+                (self._tokens, self._updated, self._blocked_until),
+            )
+            self._conn.execute("COMMIT")
+            self._failed = False
+        except sqlite3.Error as e:
+            self._database_failed(e)
+
+    def _read_pause(self) -> None:
+        """Load the shared pause without taking the write lock."""
+        try:
+            row = self._conn.execute(
+                "SELECT blocked_until FROM bucket WHERE id = 0"
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._database_failed(e)
+            return
+        if row is not None:
+            self._blocked_until = row[0]
+        self._failed = False
+
+    @contextmanager
+    def _locked(self, write: bool = True) -> Iterator[float]:
+        with self._lock:
+            if not write:
+                self._read_pause()
+                yield time.time()
+                return
+            locked = self._begin()
+            try:
+                yield time.time()
+            except BaseException:
+                if locked:
+                    self._conn.execute("ROLLBACK")
+                raise
+            if locked:
+                self._commit()
+
+    async def areserve(self) -> float:
+        return await asyncio.to_thread(self.reserve)
+
+    async def aavailable(self) -> float:
+        return await asyncio.to_thread(self.available)
+
+    async def apause(self, seconds: float) -> None:
+        await asyncio.to_thread(self.pause, seconds)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD limit on the number of requests in flight.
+
+    Each success grows the limit by ``increase / limit`` (about ``increase``
+    per round trip of a full window); an overload signal - a 429/5xx or
+    a transport error - multiplies it by ``decrease``, at most once per
+    smoothed latency so one burst of failures shrinks it once.
+
+    A positive ``latency_factor`` also treats an endpoint's smoothed
+    latency rising that many times above its own baseline as overload.
+    Latencies are tracked per ``endpoint`` passed to ``release``, so a
+    slow endpoint is never compared against a fast one.
+
+    Slots are taken with ``acquire`` (threads) or ``aacquire`` (any event
+    loop) and returned with ``release``, which also feeds the outcome
+    back into the limit.
+    """
+
+    def __init__(
+        self,
+        initial: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_factor: float = 0.0,
+    ) -> None:
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        # Smoothed latency and its baseline per endpoint
+        self._endpoints: Dict[str, Tuple[float, float]] = {}
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    def _capacity(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    def acquire(self) -> None:
+        """Block the calling thread until a slot is free, then take it."""
+        with self._available:
+            while self.in_flight >= self._capacity():
+                self._available.wait()
+            self.in_flight += 1
+
+    async def aacquire(self) -> None:
+        """Wait without blocking the event loop until a slot is free."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self.in_flight < self._capacity():
+                self.in_flight += 1
+                return
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, future))
+                except ValueError:
+                    pass
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the cancellation
+                self.release()
+            raise
+
+    def release(
+        self,
+        latency: Optional[float] = None,
+        overloaded: bool = False,
+        endpoint: str = "",
+    ) -> None:
+        """Return a slot, adjusting the limit for the request's outcome."""
+        with self._lock:
+            if latency is not None or overloaded:
+                self._record(latency, overloaded, endpoint)
+            self.in_flight -= 1
+            self._dispatch()
+
+    def _record(
+        self, latency: Optional[float], overloaded: bool, endpoint: str
+    ) -> None:
+        if latency is not None:
+            self.latency = self._smooth(self.latency, latency)
+            if self.latency_factor > 0:
+                overloaded = self._latency_rose(endpoint, latency) or overloaded
+
+        if not overloaded:
+            self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+            return
+
+        now = time.monotonic()
+        if now - self._last_decrease >= (self.latency or 0.0):
+            self.limit = max(self.min_limit, self.limit * self.decrease)
+            self._last_decrease = now
+
+    @staticmethod
+    def _smooth(average: Optional[float], latency: float) -> float:
+        if average is None:
+            return latency
+        return average + LATENCY_ALPHA * (latency - average)
+
+    def _latency_rose(self, endpoint: str, latency: float) -> bool:
+        """Update ``endpoint``'s latency estimates and compare them."""
+        previous = self._endpoints.get(endpoint)
+        if previous is None:
+            self._endpoints[endpoint] = (latency, latency)
+            return False
+
+        average = self._smooth(previous[0], latency)
+        # The baseline follows the smoothed latency rather than single
+        # samples, so ordinary jitter does not drag it down
+        baseline = previous[1]
+        if average < baseline:
+            baseline = average
+        else:
+            baseline += BASELINE_DRIFT * (average - baseline)
+        self._endpoints[endpoint] = (average, baseline)
+        return average > baseline * self.latency_factor + LATENCY_TOLERANCE
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiting coroutines, then wake waiting threads."""
+        while self._waiters and self.in_flight < self._capacity():
+            loop, future = self._waiters.popleft()
+            if future.done():
+                continue
+            self.in_flight += 1
+            loop.call_soon_threadsafe(self._resolve, future)
+        if self.in_flight < self._capacity():
+            self._available.notify()
+
+    def _resolve(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current limit and latency estimates."""
+        with self._lock:
+            return {
+                "limit": self._capacity(),
+                "in_flight": self.in_flight,
+                "waiting": len(self._waiters),
+                "latency": self.latency,
+            }
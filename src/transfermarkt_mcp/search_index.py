@@ -0,0 +1,273 @@
+"""In-process fuzzy name index of players, clubs and competitions."""
+
+import logging
+import math
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from transfermarkt_mcp.config import config
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("player", "club", "competition")
+
+# Matches scoring below this are never returned
+MIN_SCORE = 0.3
+# Share of the query's trigrams a candidate must contain
+MIN_SHARED = 0.5
+
+# Letters NFKD does not decompose into a base letter plus accents
+_FOLD = str.maketrans(
+    {
+        "ß": "ss",
+        "æ": "ae",
+        "œ": "oe",
+        "ø": "o",
+        "ł": "l",
+        "đ": "d",
+        "ð": "d",
+        "þ": "th",
+        "ı": "i",
+    }
+)
+
+# Item fields kept next to each name, per kind
+INFO_FIELDS = {
+    "player": ("position", "age", "club"),
+    "club": ("country",),
+    "competition": ("country",),
+}
+
+# Where names appear in responses: (endpoint pattern, kind, list key or None
+# for the response object itself)
+SOURCES: List[Tuple[str, str, Optional[str]]] = [
+    ("players/search/*", "player", "results"),
+    ("clubs/search/*", "club", "results"),
+    ("competitions/search/*", "competition", "results"),
+    ("clubs/*/players", "player", "players"),
+    ("competitions/*/clubs", "club", "clubs"),
+    ("competitions/*/clubs", "competition", None),
+    ("players/*/profile", "player", None),
+    ("clubs/*/profile", "club", None),
+]
+
+Key = Tuple[str, str]
+
+
+def fold(text: str) -> str:
+    """Lower-case ``text``, strip accents and collapse punctuation to spaces."""
+    text = unicodedata.normalize("NFKD", text.casefold().translate(_FOLD))
+    chars = [
+        char if char.isalnum() else " "
+        for char in text
+        if not unicodedata.combining(char)
+    ]
+    return " ".join("".join(chars).split())
+
+
+def trigrams(folded: str) -> FrozenSet[str]:
+    """Character trigrams of a folded name, padded at the ends."""
+    padded = f"  {folded} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+@dataclass
+class IndexEntry:
+    """One named entity."""
+
+    kind: str
+    id: str
+    name: str
+    folded: str
+    grams: FrozenSet[str]
+    info: Dict[str, Any]
+
+
+def _score(query: str, grams: FrozenSet[str], entry: IndexEntry, shared: int) -> float:
+    """Rank a candidate: exact names first, then whole-word prefixes, then typos."""
+    if entry.folded == query:
+        return 1.0
+    # Similarity of the whole names, averaged with how much of the query
+    # the name covers so a misspelt surname still finds the full name
+    similarity = (
+        2 * shared / (len(grams) + len(entry.grams)) + shared / len(grams)
+    ) / 2
+    words = entry.folded.split()
+    if all(any(word.startswith(part) for word in words) for part in query.split()):
+        # Surnames and abbreviations ("messi", "real mad") rank above typos
+        return 0.75 + 0.2 * similarity
+    return similarity
+
+
+def _item_info(kind: str, item: Dict[str, Any]) -> Dict[str, Any]:
+    """The INFO_FIELDS of a response item, nested objects by their name."""
+    info = {}
+    for field in INFO_FIELDS[kind]:
+        value = item.get(field)
+        if isinstance(value, dict):
+            value = value.get("name")
+        if value is not None:
+            info[field] = value
+    return info
+
+
+def _match(score: float, entry: IndexEntry) -> Dict[str, Any]:
+    return {"id": entry.id, "name": entry.name, "score": round(score, 3), **entry.info}
+
+
+def rank(kind: str, query: str, items: Any, limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    Rank response ``items`` of ``kind`` against ``query`` as ``lookup``
+    does, but keep weak matches: they are the upstream's own answers.
+    Ties keep the items' order.
+    """
+    folded = fold(query)
+    grams = trigrams(folded)
+    scored = []
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict) or not item.get("id"):
+            continue
+        name = item.get("name")
+        if not isinstance(name, str):
+            continue
+        entry_folded = fold(name)
+        entry = IndexEntry(
+            kind,
+            str(item["id"]),
+            name,
+            entry_folded,
+            trigrams(entry_folded),
+            _item_info(kind, item),
+        )
+        if not folded or not entry_folded:
+            score = 0.0
+        else:
+            score = _score(folded, grams, entry, len(grams & entry.grams))
+        scored.append((score, entry))
+    scored.sort(key=lambda match: -match[0])
+    return [_match(score, entry) for score, entry in scored[:limit]]
+
+
+class SearchIndex:
+    """
+    Trigram index answering name to ID lookups without a round trip.
+
+    Names are folded (case, accents, punctuation) before indexing, so
+    "Fenerbahce" finds "Fenerbahçe", and ranked by trigram similarity, so
+    typos still match. ``observe`` is a client observer that indexes every
+    search, roster and profile response seen. The least recently indexed
+    entities are dropped beyond ``max_entries``.
+    """
+
+    def __init__(self, max_entries: int = 200000) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Key, IndexEntry]" = OrderedDict()
+        self._postings: Dict[str, Set[Key]] = {}
+        self._names: Dict[str, Set[Key]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, kind: str, entity_id: Any, name: Any, **info: Any) -> None:
+        """Index ``name`` for an entity, replacing what was known about it."""
+        if not entity_id or not isinstance(name, str):
+            return
+        folded = fold(name)
+        if not folded:
+            return
+        key = (kind, str(entity_id))
+        entry = IndexEntry(kind, key[1], name, folded, trigrams(folded), info)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._unlink(key, previous)
+            self._entries[key] = entry
+            self._names.setdefault(folded, set()).add(key)
+            for gram in entry.grams:
+                self._postings.setdefault(gram, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest, evicted = self._entries.popitem(last=False)
+                self._unlink(oldest, evicted)
+
+    def _unlink(self, key: Key, entry: IndexEntry) -> None:
+        same_name = self._names[entry.folded]
+        same_name.discard(key)
+        if not same_name:
+            del self._names[entry.folded]
+        for gram in entry.grams:
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+
+    def observe(self, endpoint: str, result: Any) -> None:
+        """Index the names in a successful response from ``endpoint``."""
+        if not isinstance(result, dict):
+            return
+        endpoint = endpoint.strip("/")
+        for pattern, kind, list_key in SOURCES:
+            if not fnmatchcase(endpoint, pattern):
+                continue
+            items = [result] if list_key is None else result.get(list_key)
+            for item in items if isinstance(items, list) else []:
+                if isinstance(item, dict):
+                    self._add_item(kind, item)
+
+    def _add_item(self, kind: str, item: Dict[str, Any]) -> None:
+        self.add(kind, item.get("id"), item.get("name"), **_item_info(kind, item))
+
+    def lookup(self, kind: str, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` entities of ``kind`` best matching ``query``."""
+        folded = fold(query)
+        if not folded:
+            return []
+        with self._lock:
+            exact = [
+                self._entries[key]
+                for key in self._names.get(folded, ())
+                if key[0] == kind
+            ]
+            # A name seen before is answered as is, without fuzzy ranking
+            scored = [(1.0, entry) for entry in exact] or self._fuzzy(kind, folded)
+        scored.sort(key=lambda match: (-match[0], match[1].name, match[1].id))
+        return [_match(score, entry) for score, entry in scored[:limit]]
+
+    def _fuzzy(self, kind: str, folded: str) -> List[Tuple[float, IndexEntry]]:
+        """Score the entities sharing enough trigrams with ``folded``."""
+        grams = trigrams(folded)
+        # A match shares at least ``need`` of the query's trigrams, so it is
+        # in the postings of one of the len - need + 1 rarest; trigrams
+        # common to many names (" ma", "an ") are only used for scoring.
+        need = max(1, math.ceil(len(grams) * MIN_SHARED))
+        postings = sorted((self._postings.get(gram, ()) for gram in grams), key=len)
+        candidates: Set[Key] = set()
+        for keys in postings[: len(grams) - need + 1]:
+            candidates.update(keys)
+
+        scored = []
+        for key in candidates:
+            if key[0] != kind:
+                continue
+            entry = self._entries[key]
+            shared = len(grams & entry.grams)
+            if shared < need:
+                continue
+            score = _score(folded, grams, entry, shared)
+            if score >= MIN_SCORE:
+                scored.append((score, entry))
+        return scored
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of indexed entities per kind."""
+        with self._lock:
+            counts = Counter(kind for kind, _ in self._entries)
+        return {kind: counts[kind] for kind in KINDS}
+
+
+index = SearchIndex(max_entries=config.search_index_max_entries)
@@ -1,25 +1,108 @@
 """MCP server setup and tool registration."""
 
 import logging
+import time
+from typing import Any
+
+import mcp.types as mt
 from fastmcp import FastMCP
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+
+from transfermarkt_mcp.config import config
+from transfermarkt_mcp.jsonlib import serialize_tool_result
+from transfermarkt_mcp.metrics import TOOL_DURATION, TOOL_RESULT_BYTES, tool_span
 
 logger = logging.getLogger(__name__)
 
 
+def _result_bytes(result: Any) -> int:
+    size = 0
+    for content in getattr(result, "content", None) or []:
+        text = getattr(content, "text", None)
+        if isinstance(text, str):
+            size += len(text) if text.isascii() else len(text.encode())
+    return size
+
+
+class ToolMetricsMiddleware(Middleware):
+    """Time every tool call and count the bytes of its result."""
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        tool = context.message.name
+        outcome = "exception"
+        started = time.perf_counter()
+        try:
+            with tool_span(tool):
+                result = await call_next(context)
+            content = getattr(result, "structured_content", None)
+            outcome = (
+                "error" if isinstance(content, dict) and "error" in content else "ok"
+            )
+            TOOL_RESULT_BYTES.inc(_result_bytes(result), tool=tool)
+            return result
+        finally:
+            TOOL_DURATION.observe(
+                time.perf_counter() - started, tool=tool, outcome=outcome
+            )
+
+
+def preload_snapshot(path: str) -> None:
+    """Warm the response cache, name index and transfer graph from a snapshot."""
+    from transfermarkt_mcp.client import client
+    from transfermarkt_mcp.snapshot import load_snapshot
+
+    try:
+        load_snapshot(client, path, client.observers)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not load snapshot {path}: {e}")
+
+
 def create_mcp_server() -> FastMCP:
     """Create and configure the MCP server instance with all tools."""
     mcp = FastMCP(
         name="Transfermarkt MCP Server",
-        dependencies=["requests", "python-dotenv"],
+        tool_serializer=serialize_tool_result,
     )
 
     # Import tools to register them
     from transfermarkt_mcp.tools.clubs import register_club_tools
     from transfermarkt_mcp.tools.players import register_player_tools
     from transfermarkt_mcp.tools.competitions import register_competition_tools
+    from transfermarkt_mcp.tools.analytics import register_analytics_tools
 
     register_club_tools(mcp)
     register_player_tools(mcp)
     register_competition_tools(mcp)
+    register_analytics_tools(mcp)
+
+    if config.search_index_enabled:
+        from transfermarkt_mcp.tools.search import register_search_tools
+
+        register_search_tools(mcp)
+
+    if config.transfer_graph_enabled:
+        from transfermarkt_mcp.tools.network import register_network_tools
+
+        register_network_tools(mcp)
+
+    if config.prefetch_enabled:
+        from transfermarkt_mcp.client import on_client
+        from transfermarkt_mcp.prefetch import start_prefetcher
+
+        on_client(start_prefetcher)
+
+    if config.metrics_enabled:
+        from transfermarkt_mcp.metrics import register_metrics
+
+        mcp.add_middleware(ToolMetricsMiddleware())
+        register_metrics(mcp)
+
+    if config.snapshot_path:
+        preload_snapshot(config.snapshot_path)
 
     return mcp
@@ -0,0 +1,252 @@
+"""
+Offline snapshots of competitions, clubs and players for warm starts.
+
+A snapshot is a gzip-compressed JSON Lines file: a header line describing
+the crawl, then one line per upstream response with its cache key,
+endpoint, fetch time and body. ``export_snapshot`` crawls competitions
+into one; ``load_snapshot`` replays one into the response cache and the
+response observers (name index, transfer graph), each response keeping
+its real age so TTLs and stale serving apply as if it had just been
+fetched that long ago.
+"""
+
+import gzip
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from transfermarkt_mcp import jsonlib
+from transfermarkt_mcp.cache import make_cache_key
+
+if TYPE_CHECKING:
+    from transfermarkt_mcp.client import TransfermarktClient
+
+logger = logging.getLogger(__name__)
+
+FORMAT = "transfermarkt-mcp-snapshot"
+VERSION = 1
+
+Call = Tuple[str, Optional[Dict[str, Any]]]
+
+
+@dataclass
+class SnapshotRecord:
+    """One upstream response in a snapshot."""
+
+    key: str
+    endpoint: str
+    fetched_at: float
+    value: Any
+
+
+async def crawl(
+    client: "TransfermarktClient",
+    competition_ids: Sequence[str],
+    season_id: Optional[str] = None,
+    player_facets: Sequence[str] = (),
+) -> Tuple[List[SnapshotRecord], List[Dict[str, Any]]]:
+    """
+    Fetch competitions, their clubs' profiles and squads, and the chosen
+    per-player facets, with the same parameters the tools use.
+
+    Returns:
+        The successful responses and one ``{"endpoint", "error"}`` per failure
+    """
+    from transfermarkt_mcp.client import is_error
+    from transfermarkt_mcp.tools.players import PLAYER_FACETS
+
+    records: List[SnapshotRecord] = []
+    errors: List[Dict[str, Any]] = []
+    season = {"season_id": season_id} if season_id else {}
+
+    async def fetch(calls: List[Call]) -> List[Any]:
+        results = await client.aget_many(calls)
+        fetched_at = time.time()
+        for (endpoint, params), result in zip(calls, results):
+            if is_error(result):
+                errors.append({"endpoint": endpoint, "error": result["error"]})
+            else:
+                key = make_cache_key(endpoint, params)
+                records.append(SnapshotRecord(key, endpoint, fetched_at, result))
+        return results
+
+    competitions = await fetch(
+        [(f"competitions/{cid}/clubs", season) for cid in competition_ids]
+    )
+    club_ids = list(
+        dict.fromkeys(
+            club["id"]
+            for competition in competitions
+            if not is_error(competition)
+            for club in competition.get("clubs") or []
+            if isinstance(club, dict) and club.get("id")
+        )
+    )
+    logger.info(
+        f"Snapshot: {len(club_ids)} clubs in {len(competition_ids)} competitions"
+    )
+
+    club_calls: List[Call] = []
+    for club_id in club_ids:
+        club_calls.append((f"clubs/{club_id}/profile", None))
+        club_calls.append((f"clubs/{club_id}/players", season))
+    squads = (await fetch(club_calls))[1::2]
+    if not player_facets:
+        return records, errors
+
+    player_ids = list(
+        dict.fromkeys(
+            player["id"]
+            for squad in squads
+            if not is_error(squad)
+            for player in squad.get("players") or []
+            if isinstance(player, dict) and player.get("id")
+        )
+    )
+    logger.info(
+        f"Snapshot: {len(player_ids)} players, facets: {', '.join(player_facets)}"
+    )
+    await fetch(
+        [
+            (
+                PLAYER_FACETS[facet].format(player_id=player_id),
+                {"season": season_id} if facet == "stats" and season_id else None,
+            )
+            for player_id in player_ids
+            for facet in player_facets
+        ]
+    )
+    return records, errors
+
+
+def write_snapshot(
+    path: str, records: List[SnapshotRecord], meta: Optional[Dict[str, Any]] = None
+) -> None:
+    """Write ``records`` to ``path`` atomically, replacing any older snapshot."""
+    header = {
+        "format": FORMAT,
+        "version": VERSION,
+        "createdAt": time.time(),
+        "records": len(records),
+        **(meta or {}),
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    partial = f"{path}.partial"
+    with gzip.open(partial, "wb") as out:
+        out.write(jsonlib.dumps(header) + b"\n")
+        for record in records:
+            line = {
+                "key": record.key,
+                "endpoint": record.endpoint,
+                "fetchedAt": record.fetched_at,
+                "value": record.value,
+            }
+            out.write(jsonlib.dumps(line) + b"\n")
+    os.replace(partial, path)
+
+
+def read_snapshot(path: str) -> Tuple[Dict[str, Any], Iterator[SnapshotRecord]]:
+    """
+    Open a snapshot; returns its header and an iterator over its records.
+    Raises ValueError if the file is not a snapshot this version can read,
+    or (while iterating) if it is truncated.
+    """
+    source = gzip.open(path, "rb")
+    try:
+        header = jsonlib.loads(source.readline())
+    except (OSError, ValueError) as e:
+        source.close()
+        raise ValueError(f"{path} is not a snapshot: {e}") from e
+    if not isinstance(header, dict) or header.get("format") != FORMAT:
+        source.close()
+        raise ValueError(f"{path} is not a snapshot")
+    if header.get("version") != VERSION:
+        source.close()
+        raise ValueError(f"Unsupported snapshot version: {header.get('version')}")
+
+    def records() -> Iterator[SnapshotRecord]:
+        with source:
+            try:
+                for line in source:
+                    item = jsonlib.loads(line)
+                    yield SnapshotRecord(
+                        item["key"], item["endpoint"], item["fetchedAt"], item["value"]
+                    )
+            except (EOFError, KeyError, TypeError) as e:
+                raise ValueError(f"{path} is truncated or corrupt: {e}") from e
+
+    return header, records()
+
+
+async def export_snapshot(
+    client: "TransfermarktClient",
+    path: str,
+    competition_ids: Sequence[str],
+    season_id: Optional[str] = None,
+    player_facets: Sequence[str] = (),
+) -> Dict[str, Any]:
+    """Crawl competitions into a snapshot at ``path``; returns a summary."""
+    records, errors = await crawl(client, competition_ids, season_id, player_facets)
+    write_snapshot(
+        path,
+        records,
+        {
+            "competitions": list(competition_ids),
+            "seasonId": season_id,
+            "playerFacets": list(player_facets),
+        },
+    )
+    logger.info(f"Wrote {len(records)} responses to {path}, {len(errors)} failed")
+    return {"path": path, "records": len(records), "errors": errors}
+
+
+def load_snapshot(
+    client: "TransfermarktClient",
+    path: str,
+    observers: Sequence[Callable[[str, Any], None]] = (),
+) -> Dict[str, Any]:
+    """
+    Replay a snapshot into ``client``'s cache and pass each response to
+    ``observers``, such as the client's own.
+
+    Responses older than their TTL plus the client's stale retention are
+    skipped for the cache (they still reach the observers). Returns counts of
+    loaded and skipped responses; unreadable files raise ValueError or
+    OSError.
+    """
+    header, records = read_snapshot(path)
+    cache = client.cache
+    retention = max(client.stale_while_revalidate, client.stale_if_error)
+    now = time.time()
+    loaded = skipped = 0
+    for record in records:
+        for observer in observers:
+            observer(record.endpoint, record.value)
+        if cache is None:
+            continue
+        age = max(0.0, now - record.fetched_at)
+        ttl = cache.ttl_for(record.endpoint)
+        if age >= ttl + retention:
+            skipped += 1
+            continue
+        cache.set(record.key, record.endpoint, record.value, ttl=ttl, age=age)
+        loaded += 1
+
+    logger.info(
+        f"Loaded {loaded} responses from snapshot {path} "
+        f"({skipped} too old, created {time.ctime(header['createdAt'])})"
+    )
+    return {"loaded": loaded, "skipped": skipped, "createdAt": header["createdAt"]}
@@ -0,0 +1,569 @@
+"""Analytics MCP tools computed server-side over many players."""
+
+import bisect
+import logging
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from transfermarkt_mcp.parsing import (
+    parse_date,
+    parse_int,
+    parse_money,
+    season_start_year,
+)
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+# numpy once _numpy() has looked for it: the module, or None if missing
+np: Any = ...
+
+logger = logging.getLogger(__name__)
+
+MAX_ANALYTICS_PLAYERS = 50
+MAX_SQUAD_RANKING = 50
+DAYS_PER_YEAR = 365.2425
+
+# Columns always present in the market value table
+MARKET_VALUE_COLUMNS = [
+    "id",
+    "current",
+    "peak",
+    "peak_date",
+    "peak_age",
+    "current_vs_peak",
+    "cagr",
+    "change",
+]
+MARKET_VALUE_SORT_COLUMNS = ["current", "peak", "current_vs_peak", "cagr", "change"]
+
+# Squad stat columns and the stats entry field each one totals
+SQUAD_STATS = {
+    "appearances": "appearances",
+    "minutes": "minutesPlayed",
+    "goals": "goals",
+    "assists": "assists",
+    "yellow_cards": "yellowCards",
+    "red_cards": "redCards",
+}
+PER_90_STATS = ["goals", "assists"]
+SQUAD_RANK_COLUMNS = list(SQUAD_STATS) + [f"{stat}_per_90" for stat in PER_90_STATS]
+
+
+def _numpy() -> Any:
+    """
+    Import numpy on first use rather than with the tools, which register
+    at every server start; None when it is not installed.
+    """
+    global np
+    if np is ...:
+        try:
+            import numpy
+
+            np = numpy
+        except ImportError:  # optional: pip install transfermarkt-mcp[analytics]
+            np = None
+    return np
+
+
+def interpolate(
+    x: Sequence[float], xp: Sequence[float], fp: Sequence[float]
+) -> List[Optional[float]]:
+    """
+    Linearly interpolate the curve ``(xp, fp)`` at each of ``x``.
+
+    ``xp`` must be ascending; points outside it give None rather than the
+    nearest end value. Uses NumPy when installed.
+    """
+    if not xp:
+        return [None] * len(x)
+    np = _numpy()
+    if np is not None:
+        values = np.interp(x, xp, fp, left=np.nan, right=np.nan)
+        return [None if np.isnan(value) else float(value) for value in values]
+
+    result: List[Optional[float]] = []
+    for point in x:
+        if point < xp[0] or point > xp[-1]:
+            result.append(None)
+            continue
+        i = bisect.bisect_left(xp, point)
+        if xp[i] == point:
+            result.append(float(fp[i]))
+            continue
+        share = (point - xp[i - 1]) / (xp[i] - xp[i - 1])
+        result.append(fp[i - 1] + share * (fp[i] - fp[i - 1]))
+    return result
+
+
+def percentile_ranks(values: Sequence[float]) -> List[float]:
+    """
+    Percentile rank (0-100) of each value within ``values``: the share
+    below it, counting ties as half below. Uses NumPy when installed.
+    """
+    if not values:
+        return []
+    np = _numpy()
+    if np is not None:
+        array = np.asarray(values, dtype=float)
+        ordered = np.sort(array)
+        below = np.searchsorted(ordered, array, side="left")
+        upto = np.searchsorted(ordered, array, side="right")
+        ranks: List[float] = ((below + upto) * 50.0 / len(values)).tolist()
+        return ranks
+
+    ordered = sorted(values)
+    return [
+        (bisect.bisect_left(ordered, value) + bisect.bisect_right(ordered, value))
+        * 50.0
+        / len(values)
+        for value in values
+    ]
+
+
+def value_curve(data: Dict[str, Any]) -> Tuple[List[float], List[float], List[Any]]:
+    """
+    Points of a market value history as ascending times (in years), values
+    and the points themselves; points without a date or value are dropped
+    and a later point on the same day replaces an earlier one.
+    """
+    by_day: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+    for point in data.get("marketValueHistory") or []:
+        if not isinstance(point, dict):
+            continue
+        day = parse_date(point.get("date"))
+        value = parse_money(point.get("value"))
+        if day is not None and value is not None:
+            by_day[day.toordinal()] = (value, point)
+    days = sorted(by_day)
+    return (
+        [day / DAYS_PER_YEAR for day in days],
+        [by_day[day][0] for day in days],
+        [by_day[day][1] for day in days],
+    )
+
+
+def birth_time(
+    times: Sequence[float], points: Sequence[Dict[str, Any]]
+) -> Optional[float]:
+    """
+    Estimate the birth time (in years) from the whole-year ages of points.
+
+    Each point's age bounds the birth to one year before its date; the
+    middle of the intersection of those windows is returned.
+    """
+    earliest, latest = float("-inf"), float("inf")
+    for time, point in zip(times, points):
+        age = parse_int(point.get("age"))
+        if age is None:
+            continue
+        earliest = max(earliest, time - age - 1)
+        latest = min(latest, time - age)
+    if earliest == float("-inf"):
+        return None
+    if earliest > latest:  # inconsistent ages; trust the latest point
+        earliest = latest - 1
+    return (earliest + latest) / 2
+
+
+def _ratio(numerator: Optional[float], denominator: Optional[float]) -> Optional[float]:
+    if numerator is None or not denominator:
+        return None
+    return round(numerator / denominator, 4)
+
+
+def summarize_market_values(
+    data: Dict[str, Any], window_months: int, ages: Sequence[float]
+) -> List[Any]:
+    """
+    One row of the market value table: current and peak value, when the
+    peak was reached, current against peak, the compound annual growth
+    from the first to the latest valuation, the change over the last
+    ``window_months`` and the value interpolated at each of ``ages``.
+    """
+    times, values, points = value_curve(data)
+    current = parse_money(data.get("marketValue"))
+    if not values:
+        return [current, None, None, None, None, None, None] + [None] * len(ages)
+    if current is None:
+        current = values[-1]
+
+    peak = max(range(len(values)), key=values.__getitem__)
+    born = birth_time(times, points)
+    peak_age = round(times[peak] - born, 1) if born is not None else None
+
+    years = times[-1] - times[0]
+    cagr = None
+    if years > 0 and values[0] > 0 and values[-1] > 0:
+        cagr = round((values[-1] / values[0]) ** (1 / years) - 1, 4)
+
+    # One interpolation for the window start and every requested age
+    queries = [times[-1] - window_months / 12]
+    if born is not None:
+        queries.extend(born + age for age in ages)
+    found = interpolate(queries, times, values)
+    before = found[0]
+    change = round(values[-1] / before - 1, 4) if before else None
+    at_ages = found[1:] if born is not None else [None] * len(ages)
+
+    return [
+        current,
+        values[peak],
+        points[peak].get("date"),
+        peak_age,
+        _ratio(current, values[peak]),
+        cagr,
+        change,
+    ] + [round(value) if value is not None else None for value in at_ages]
+
+
+def _interpolate_rows(queries: Any, times: Any, values: Any, lengths: Any) -> Any:
+    """
+    interpolate() for every row of the ``queries`` array against the curve
+    in the same row of ``times`` and ``values``, which are NaN-padded past
+    each row's length; NaN where a query falls outside its curve.
+    """
+    np = _numpy()
+    rows = np.arange(len(times))[:, None]
+    last = np.maximum(lengths - 1, 0)[:, None]
+    # Points at or before each query; the NaN padding never counts
+    count = (times[:, None, :] <= queries[:, :, None]).sum(axis=2)
+    low = np.maximum(count - 1, 0)
+    high = np.minimum(count, last)
+    span = times[rows, high] - times[rows, low]
+    share = np.where(
+        span > 0, (queries - times[rows, low]) / np.where(span > 0, span, 1), 0.0
+    )
+    low_value = values[rows, low]
+    found = low_value + share * (values[rows, high] - low_value)
+    outside = (count == 0) | ~(queries <= times[rows, last])
+    return np.where(outside, np.nan, found)
+
+
+def _rounded(value: Any, digits: Optional[int] = None) -> Any:
+    """A NumPy scalar as a rounded float (int without ``digits``), or None for NaN."""
+    value = float(value)
+    return None if value != value else round(value, digits)
+
+
+def market_value_rows(
+    results: Sequence[Dict[str, Any]], window_months: int, ages: Sequence[float]
+) -> List[List[Any]]:
+    """
+    summarize_market_values() for each of ``results``. With NumPy the
+    curves are stacked into NaN-padded arrays and each column is computed
+    for every player at once; parsing the histories stays per point.
+    """
+    np = _numpy()
+    if np is None or not results:
+        return [summarize_market_values(data, window_months, ages) for data in results]
+
+    curves = [value_curve(data) for data in results]
+    lengths = np.array([len(curve[0]) for curve in curves])
+    times = np.full((len(curves), max(int(lengths.max()), 1)), np.nan)
+    values = np.full_like(times, np.nan)
+    for row, (curve_times, curve_values, _) in enumerate(curves):
+        times[row, : len(curve_times)] = curve_times
+        values[row, : len(curve_values)] = curve_values
+    # A missing birth time becomes NaN, which every column passes through
+    born = np.array([birth_time(curve[0], curve[2]) for curve in curves], dtype=float)
+    currents = [parse_money(data.get("marketValue")) for data in results]
+
+    rows = np.arange(len(curves))
+    last = np.maximum(lengths - 1, 0)
+    first_value, last_value = values[:, 0], values[rows, last]
+    current = np.array(currents, dtype=float)
+    current = np.where(np.isnan(current), last_value, current)
+    peak = np.argmax(np.where(np.isnan(values), -np.inf, values), axis=1)
+    peak_value = values[rows, peak]
+    years = times[rows, last] - times[:, 0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        peak_age = times[rows, peak] - born
+        vs_peak = np.where(peak_value != 0, current / peak_value, np.nan)
+        growing = (years > 0) & (first_value > 0) & (last_value > 0)
+        cagr = np.where(growing, (last_value / first_value) ** (1 / years) - 1, np.nan)
+        # One interpolation for the window start and every requested age
+        queries = np.column_stack(
+            [times[rows, last] - window_months / 12] + [born + age for age in ages]
+        )
+        found = _interpolate_rows(queries, times, values, lengths)
+        before = found[:, 0]
+        change = np.where(before != 0, last_value / before - 1, np.nan)
+
+    table = []
+    for row, (_, _, points) in enumerate(curves):
+        if not lengths[row]:
+            table.append([currents[row]] + [None] * (6 + len(ages)))
+            continue
+        table.append(
+            [
+                float(current[row]),
+                float(peak_value[row]),
+                points[peak[row]].get("date"),
+                _rounded(peak_age[row], 1),
+                _rounded(vs_peak[row], 4),
+                _rounded(cagr[row], 4),
+                _rounded(change[row], 4),
+            ]
+            + [_rounded(value) for value in found[row, 1:]]
+        )
+    return table
+
+
+async def analyze_market_values(
+    player_ids: List[str],
+    window_months: int = 12,
+    ages: Optional[List[float]] = None,
+    sort_by: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Compare the market value histories of several players as one table.
+
+    Fetches every player's history concurrently and computes, per player,
+    the current and peak value, the age at the peak, current value as a
+    share of the peak, compound annual growth (CAGR) over the history,
+    the relative change over the last ``window_months`` and, for
+    age-aligned comparisons, the value each player had at given ages.
+
+    Args:
+        player_ids: Player IDs to compare (at most 50)
+        window_months: Months over which "change" is measured (default: 12)
+        ages: Ages at which to compare values, e.g. [21, 23, 25]
+        sort_by: Column to rank by, highest first: current, peak,
+            current_vs_peak, cagr or change (default: input order)
+
+    Returns:
+        Dictionary with "columns" and one row per player, plus any
+        per-player errors, or error information
+    """
+    from transfermarkt_mcp.client import client, is_error
+
+    player_ids = list(dict.fromkeys(pid.strip() for pid in player_ids if pid.strip()))
+    if not player_ids:
+        return {"error": "At least one player ID is required"}
+
+    if len(player_ids) > MAX_ANALYTICS_PLAYERS:
+        return {"error": f"At most {MAX_ANALYTICS_PLAYERS} players per analysis"}
+
+    if window_months < 1:
+        return {"error": "Window must be at least one month"}
+
+    if sort_by is not None and sort_by not in MARKET_VALUE_SORT_COLUMNS:
+        return {
+            "error": f"Unknown sort column: {sort_by}. "
+            f"Valid columns: {', '.join(MARKET_VALUE_SORT_COLUMNS)}"
+        }
+
+    ages = list(dict.fromkeys(ages or []))
+    logger.info(f"Analyzing market values of {len(player_ids)} players")
+
+    results = await client.aget_many(
+        [(f"players/{player_id}/market_value", None) for player_id in player_ids]
+    )
+
+    found_ids = []
+    histories = []
+    errors = []
+    for player_id, result in zip(player_ids, results):
+        if is_error(result):
+            errors.append({"id": player_id, "error": result["error"]})
+            continue
+        found_ids.append(player_id)
+        histories.append(result)
+    table = market_value_rows(histories, window_months, ages)
+    rows = [[player_id] + row for player_id, row in zip(found_ids, table)]
+
+    columns = MARKET_VALUE_COLUMNS + [f"value_at_{age:g}" for age in ages]
+    if sort_by is not None:
+        i = columns.index(sort_by)
+        rows.sort(key=lambda row: (row[i] is None, -(row[i] or 0)))
+
+    return {
+        "window_months": window_months,
+        "columns": columns,
+        "rows": rows,
+        "errors": errors,
+    }
+
+
+def season_totals(
+    entries: Sequence[Dict[str, Any]], season: Optional[int], club_id: str
+) -> List[int]:
+    """
+    Totals of each SQUAD_STATS column over a player's stats entries for
+    ``season`` (a start year), across competitions. Entries for another
+    club, such as before a mid-season transfer, are left out.
+    """
+    totals = [0] * len(SQUAD_STATS)
+    for entry in entries:
+        if season_start_year(entry.get("seasonId")) != season:
+            continue
+        if entry.get("clubId") not in (None, club_id):
+            continue
+        for i, key in enumerate(SQUAD_STATS.values()):
+            totals[i] += parse_int(entry.get(key)) or 0
+    return totals
+
+
+def squad_season(
+    season_id: Optional[str], entries: Iterable[Sequence[Dict[str, Any]]]
+) -> Optional[int]:
+    """
+    The start year of ``season_id``, or else of the latest season in any
+    player's stats entries, so the whole squad is totalled over one season.
+    """
+    season = season_start_year(season_id) if season_id else None
+    if season is None:
+        seasons = (
+            season_start_year(entry.get("seasonId"))
+            for player_entries in entries
+            for entry in player_entries
+            if isinstance(entry, dict)
+        )
+        season = max((s for s in seasons if s is not None), default=None)
+    return season
+
+
+async def get_club_squad_stats(
+    club_id: str,
+    season_id: Optional[str] = None,
+    rank_by: str = "goals",
+    limit: int = 10,
+    min_minutes: int = 270,
+) -> Dict[str, Any]:
+    """
+    Rank a club's players by a season statistic, with squad totals.
+
+    Fetches the roster and every player's stats concurrently, totals each
+    player's season across competitions, and returns only the top
+    ``limit`` players by ``rank_by`` with their totals, per-90 rates and
+    percentile within the squad. Answers questions like "top scorers at
+    this club this season" in one call.
+
+    Args:
+        club_id: Unique identifier of the club
+        season_id: Season to aggregate (default: the latest season with stats)
+        rank_by: Column to rank by: appearances, minutes, goals, assists,
+            yellow_cards, red_cards, goals_per_90 or assists_per_90
+        limit: Number of ranked players to return (default: 10)
+        min_minutes: Minutes a player needs for per-90 rates (default: 270)
+
+    Returns:
+        Dictionary with "columns", the ranked "rows", squad "totals" and
+        any per-player errors, or error information
+    """
+    from transfermarkt_mcp.client import client, is_error
+    from transfermarkt_mcp.models import ClubSquad, ModelValidationError
+
+    if not club_id.strip():
+        return {"error": "Club ID cannot be empty"}
+
+    if rank_by not in SQUAD_RANK_COLUMNS:
+        return {
+            "error": f"Unknown rank column: {rank_by}. "
+            f"Valid columns: {', '.join(SQUAD_RANK_COLUMNS)}"
+        }
+
+    if not 1 <= limit <= MAX_SQUAD_RANKING:
+        return {"error": f"Limit must be between 1 and {MAX_SQUAD_RANKING}"}
+
+    if min_minutes < 0:
+        return {"error": "Minimum minutes cannot be negative"}
+
+    logger.info(
+        f"Getting squad stats for club ID: {club_id}, "
+        f"season: {season_id or 'current'}, ranked by {rank_by}"
+    )
+
+    params = {"season_id": season_id} if season_id else {}
+    roster = await client.aget(f"clubs/{club_id}/players", params=params)
+    if is_error(roster):
+        return roster
+    try:
+        squad = ClubSquad.from_dict(roster)
+    except ModelValidationError as e:
+        return {"error": f"Invalid squad response for club {club_id}: {e}"}
+
+    # The same calls as get_club_squad_details, so either warms the other
+    stats_params = {"season": season_id} if season_id else None
+    players = [player for player in squad.players or [] if player.id]
+    results = await client.aget_many(
+        [(f"players/{player.id}/stats", stats_params) for player in players]
+    )
+
+    errors = []
+    entries = {}
+    for player, result in zip(players, results):
+        if is_error(result):
+            errors.append({"id": player.id, "error": result["error"]})
+        else:
+            entries[player.id] = [
+                entry for entry in result.get("stats") or [] if isinstance(entry, dict)
+            ]
+    season = squad_season(season_id, entries.values())
+
+    # Columnar table: one list per column, one position per player
+    players = [player for player in players if player.id in entries]
+    table: Dict[str, List[Any]] = {
+        "id": [player.id for player in players],
+        "name": [player.get("name") for player in players],
+        "position": [player.get("position") for player in players],
+    }
+    totals = [season_totals(entries[player.id], season, club_id) for player in players]
+    for i, stat in enumerate(SQUAD_STATS):
+        table[stat] = [row[i] for row in totals]
+    minutes = table["minutes"]
+    for stat in PER_90_STATS:
+        table[f"{stat}_per_90"] = [
+            round(value * 90 / played, 2) if played and played >= min_minutes else None
+            for value, played in zip(table[stat], minutes)
+        ]
+
+    ranked = [i for i, value in enumerate(table[rank_by]) if value is not None]
+    ranked.sort(key=lambda i: (-table[rank_by][i], table["name"][i] or ""))
+    percentiles = dict(
+        zip(ranked, percentile_ranks([table[rank_by][i] for i in ranked]))
+    )
+
+    columns = ["rank", "id", "name", "position"] + SQUAD_RANK_COLUMNS + ["percentile"]
+    rows = []
+    rank = 0
+    for position, i in enumerate(ranked[:limit]):
+        if position == 0 or table[rank_by][i] != table[rank_by][ranked[position - 1]]:
+            rank = position + 1
+        rows.append(
+            [rank]
+            + [table[column][i] for column in columns[1:-1]]
+            + [round(percentiles[i], 1)]
+        )
+
+    return {
+        "club_id": club_id,
+        "season": season,
+        "rank_by": rank_by,
+        "players": len(players),
+        "ranked": len(ranked),
+        "columns": columns,
+        "rows": rows,
+        "totals": {stat: sum(table[stat]) for stat in SQUAD_STATS},
+        "errors": errors,
+    }
+
+
+def register_analytics_tools(mcp: "FastMCP") -> None:
+    """Register all analytics tools with the MCP server."""
+    mcp.tool()(analyze_market_values)
+    mcp.tool()(get_club_squad_stats)
+
+    logger.info(
+        "Registered analytics tools: analyze_market_values, get_club_squad_stats"
+    )
@@ -1,18 +1,83 @@
 """Club-related MCP tools."""
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+from fastmcp import Context, FastMCP
+
+from transfermarkt_mcp.parsing import parse_int, parse_money
+from transfermarkt_mcp.projection import apply_projection
+from transfermarkt_mcp.tools.analytics import SQUAD_STATS, season_totals, squad_season
+from transfermarkt_mcp.tools.pagination import MAX_SEARCH_RESULTS, fetch_search_pages
 
 logger = logging.getLogger(__name__)
 
+# Compact default projection of each tool, selected with fields=["@compact"]
+COMPACT_FIELDS = {
+    "search_clubs": [
+        "query",
+        "pageNumber",
+        "lastPageNumber",
+        "pagesFetched",
+        "errors",
+        "results.id",
+        "results.name",
+        "results.country",
+        "results.marketValue",
+    ],
+    "get_club_profile": [
+        "id",
+        "name",
+        "foundedOn",
+        "stadiumName",
+        "currentMarketValue",
+        "league.id",
+        "league.name",
+    ],
+    "get_club_players": [
+        "id",
+        "players.id",
+        "players.name",
+        "players.position",
+        "players.age",
+        "players.nationality",
+        "players.marketValue",
+    ],
+    # Columns are chosen with facets; compact only drops the echoed season_id
+    "get_club_squad_details": ["club_id", "season", "columns", "rows", "errors"],
+}
+
+# Roster columns always present in the squad table
+SQUAD_BASE_COLUMNS = ["id", "name", "position", "age", "market_value"]
 
-def search_clubs(club_name: str, page_number: int = 1) -> Dict[str, Any]:
+# Columns contributed by each per-player facet of the squad table
+SQUAD_FACET_COLUMNS = {
+    "profile": ["contract_expires", "foot", "height"],
+    "market_value": ["peak_market_value"],
+    "stats": ["appearances", "goals", "assists", "minutes"],
+    "injuries": ["injuries", "days_injured", "last_injury"],
+    "transfers": ["transfers", "last_transfer"],
+}
+DEFAULT_SQUAD_FACETS = ["market_value", "stats", "injuries"]
+
+
+async def search_clubs(
+    club_name: str,
+    page_number: int = 1,
+    max_results: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    ctx: Optional[Context] = None,
+) -> Dict[str, Any]:
     """
     Search for clubs by name with pagination support.
 
     Args:
         club_name: Name of the club to search for
         page_number: Page number for pagination (default: 1)
+        max_results: Optional cap; when set, this and the following pages
+            are fetched concurrently until the cap is reached
+        fields: Optional dotted paths to keep (e.g. "results.name");
+            "@compact" selects a compact default
 
     Returns:
         Dictionary containing search results or error information
@@ -25,17 +90,33 @@ def search_clubs(club_name: str, page_number: int = 1) -> Dict[str, Any]:
     if page_number < 1:
         return {"error": "Page number must be positive"}
 
+    if max_results is not None and not 1 <= max_results <= MAX_SEARCH_RESULTS:
+        return {"error": f"Max results must be between 1 and {MAX_SEARCH_RESULTS}"}
+
     logger.info(f"Searching for clubs: '{club_name}', page: {page_number}")
 
-    return client.get(f"clubs/search/{club_name}", params={"page_number": page_number})
+    if max_results is not None:
+        result = await fetch_search_pages(
+            f"clubs/search/{club_name}", page_number, max_results, ctx
+        )
+    else:
+        result = await client.aget(
+            f"clubs/search/{club_name}", params={"page_number": page_number}
+        )
 
+    return apply_projection(result, fields, COMPACT_FIELDS["search_clubs"])
 
-def get_club_profile(club_id: str) -> Dict[str, Any]:
+
+async def get_club_profile(
+    club_id: str, fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get detailed profile information for a specific club.
 
     Args:
         club_id: Unique identifier of the club
+        fields: Optional dotted paths to keep (e.g. "league.name");
+            "@compact" selects a compact default
 
     Returns:
         Dictionary containing club profile data or error information
@@ -47,16 +128,23 @@ def get_club_profile(club_id: str) -> Dict[str, Any]:
 
     logger.info(f"Getting club profile for ID: {club_id}")
 
-    return client.get(f"clubs/{club_id}/profile")
+    result = await client.aget(f"clubs/{club_id}/profile")
+    return apply_projection(result, fields, COMPACT_FIELDS["get_club_profile"])
 
 
-def get_club_players(club_id: str, season_id: Optional[str] = None) -> Dict[str, Any]:
+async def get_club_players(
+    club_id: str,
+    season_id: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
     """
     Get players list for a specific club, optionally filtered by season.
 
     Args:
         club_id: Unique identifier of the club
         season_id: Optional season identifier for filtering
+        fields: Optional dotted paths to keep (e.g. "players.name");
+            "@compact" selects a compact default
 
     Returns:
         Dictionary containing players data or error information
@@ -74,16 +162,200 @@ def get_club_players(club_id: str, season_id: Optional[str] = None) -> Dict[str,
     if season_id:
         params["season_id"] = season_id
 
-    return client.get(f"clubs/{club_id}/players", params=params)
+    result = await client.aget(f"clubs/{club_id}/players", params=params)
+    return apply_projection(result, fields, COMPACT_FIELDS["get_club_players"])
+
+
+def _summarize_profile(
+    data: Dict[str, Any], season: Optional[int], club_id: str
+) -> List[Any]:
+    """Contract expiry, preferred foot and height from a player profile."""
+    club = data.get("club") or {}
+    return [club.get("contractExpires"), data.get("foot"), data.get("height")]
+
+
+def _summarize_market_value(
+    data: Dict[str, Any], season: Optional[int], club_id: str
+) -> List[Any]:
+    """Highest value in a player's market value history."""
+    parsed = (
+        parse_money(point.get("value"))
+        for point in data.get("marketValueHistory") or []
+    )
+    values = [value for value in parsed if value is not None]
+    return [max(values) if values else None]
+
+
+def _summarize_stats(
+    data: Dict[str, Any], season: Optional[int], club_id: str
+) -> List[Any]:
+    """Totals for the squad's season at this club, across competitions."""
+    entries = [entry for entry in data.get("stats") or [] if isinstance(entry, dict)]
+    totals = dict(zip(SQUAD_STATS, season_totals(entries, season, club_id)))
+    return [totals[column] for column in SQUAD_FACET_COLUMNS["stats"]]
+
+
+def _summarize_injuries(
+    data: Dict[str, Any], season: Optional[int], club_id: str
+) -> List[Any]:
+    """Injury count, total days out and the most recent injury."""
+    injuries = data.get("injuries") or []
+    days = sum(parse_int(injury.get("days")) or 0 for injury in injuries)
+    last = injuries[0].get("injury") if injuries else None
+    return [len(injuries), days, last]
+
+
+def _summarize_transfers(
+    data: Dict[str, Any], season: Optional[int], club_id: str
+) -> List[Any]:
+    """Transfer count and a one-line description of the latest move."""
+    transfers = data.get("transfers") or []
+    if not transfers:
+        return [0, None]
+    last = transfers[0]
+    club_from = (last.get("clubFrom") or {}).get("name")
+    club_to = (last.get("clubTo") or {}).get("name")
+    summary = f"{last.get('date')}: {club_from} -> {club_to}"
+    if last.get("fee"):
+        summary += f" ({last['fee']})"
+    return [len(transfers), summary]
+
+
+SQUAD_SUMMARIZERS = {
+    "profile": _summarize_profile,
+    "market_value": _summarize_market_value,
+    "stats": _summarize_stats,
+    "injuries": _summarize_injuries,
+    "transfers": _summarize_transfers,
+}
+
+
+async def get_club_squad_details(
+    club_id: str,
+    season_id: Optional[str] = None,
+    facets: Optional[List[str]] = None,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Get a club's squad enriched with per-player data as one compact table.
+
+    Fetches the roster, then fetches the chosen per-player data concurrently
+    (bounded by BATCH_CONCURRENCY) and summarises it into columns.
+
+    Args:
+        club_id: Unique identifier of the club
+        season_id: Optional season identifier for the roster and stats
+            (default: the latest season in any player's stats)
+        facets: Per-player data to add: profile, market_value, stats,
+            injuries, transfers (default: market_value, stats, injuries)
+        fields: Optional top-level keys to keep (e.g. "rows"); rows are
+            lists, so columns are chosen with facets. "@compact" expands
+            to a small default set
+
+    Returns:
+        Dictionary with "columns" and one row per player, the "season"
+        (start year) the stats columns total, plus any per-player errors,
+        or error information
+    """
+    from transfermarkt_mcp.client import client, is_error
+    from transfermarkt_mcp.models import ClubSquad, ModelValidationError
+    from transfermarkt_mcp.tools.players import PLAYER_FACETS
+
+    if not club_id.strip():
+        return {"error": "Club ID cannot be empty"}
+
+    facets = list(dict.fromkeys(facets or DEFAULT_SQUAD_FACETS))
+    unknown = [facet for facet in facets if facet not in SQUAD_SUMMARIZERS]
+    if unknown:
+        return {
+            "error": f"Unknown facets: {', '.join(unknown)}. "
+            f"Valid facets: {', '.join(SQUAD_SUMMARIZERS)}"
+        }
+
+    logger.info(
+        f"Getting squad details for club ID: {club_id}, "
+        f"season: {season_id or 'current'}, facets: {', '.join(facets)}"
+    )
+
+    params = {"season_id": season_id} if season_id else {}
+    roster = await client.aget(f"clubs/{club_id}/players", params=params)
+    if is_error(roster):
+        return roster
+    try:
+        squad = ClubSquad.from_dict(roster)
+    except ModelValidationError as e:
+        return {"error": f"Invalid squad response for club {club_id}: {e}"}
+
+    players = [p for p in squad.players or [] if p.id]
+    keys = [(player.id, facet) for player in players for facet in facets]
+    calls = [
+        (
+            PLAYER_FACETS[facet].format(player_id=player_id),
+            {"season": season_id} if facet == "stats" and season_id else None,
+        )
+        for player_id, facet in keys
+    ]
+    results = dict(zip(keys, await client.aget_many(calls)))
+    # One season for the whole squad, as in get_club_squad_stats
+    season = None
+    if "stats" in facets:
+        season = squad_season(
+            season_id,
+            (
+                results[(player.id, "stats")].get("stats") or []
+                for player in players
+                if not is_error(results[(player.id, "stats")])
+            ),
+        )
+
+    rows = []
+    errors = []
+    for player in players:
+        row = [
+            player.id,
+            player.get("name"),
+            player.get("position"),
+            player.get("age"),
+            parse_money(player.get("market_value")),
+        ]
+        for facet in facets:
+            result = results[(player.id, facet)]
+            if is_error(result):
+                errors.append(
+                    {
+                        "player_id": player.id,
+                        "facet": facet,
+                        "error": result["error"],
+                    }
+                )
+                row.extend([None] * len(SQUAD_FACET_COLUMNS[facet]))
+            else:
+                row.extend(SQUAD_SUMMARIZERS[facet](result, season, club_id))
+        rows.append(row)
+
+    columns = SQUAD_BASE_COLUMNS + [
+        column for facet in facets for column in SQUAD_FACET_COLUMNS[facet]
+    ]
+    result = {
+        "club_id": club_id,
+        "season_id": season_id,
+        "season": season,
+        "columns": columns,
+        "rows": rows,
+        "errors": errors,
+    }
+    return apply_projection(result, fields, COMPACT_FIELDS["get_club_squad_details"])
 
 
-def register_club_tools(mcp) -> None:
+def register_club_tools(mcp: FastMCP) -> None:
     """Register all club tools with the MCP server."""
     # Use the decorator syntax that FastMCP expects
     mcp.tool()(search_clubs)
     mcp.tool()(get_club_profile)
     mcp.tool()(get_club_players)
+    mcp.tool()(get_club_squad_details)
 
     logger.info(
-        "Registered club tools: search_clubs, get_club_profile, get_club_players"
+        "Registered club tools: search_clubs, get_club_profile, get_club_players, "
+        "get_club_squad_details"
     )
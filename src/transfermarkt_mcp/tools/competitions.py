@@ -1,15 +1,60 @@
 import logging
+from typing import Any, Dict, List, Optional
 
-logger = logging.getLogger(__name__)
+from fastmcp import Context, FastMCP
+
+from transfermarkt_mcp.projection import apply_projection
+from transfermarkt_mcp.tools.pagination import MAX_SEARCH_RESULTS, fetch_search_pages
 
+logger = logging.getLogger(__name__)
 
-def search_competitions(competition_name: str, page_number: int = 1):
+# Compact default projection of each tool, selected with fields=["@compact"]
+COMPACT_FIELDS = {
+    "search_competitions": [
+        "query",
+        "pageNumber",
+        "lastPageNumber",
+        "pagesFetched",
+        "errors",
+        "results.id",
+        "results.name",
+        "results.country",
+        "results.clubs",
+    ],
+    "get_competition_clubs": ["id", "name", "seasonId", "clubs.id", "clubs.name"],
+    "get_competition_details": ["id", "name", "seasonId"],
+    "crawl_competition": [
+        "competition_id",
+        "season_id",
+        "errors",
+        "clubs.id",
+        "clubs.name",
+        "clubs.players.id",
+        "clubs.players.name",
+    ],
+}
+
+# Squad fields kept per player in crawl results
+CRAWL_PLAYER_FIELDS = ("id", "name", "position", "age", "marketValue")
+
+
+async def search_competitions(
+    competition_name: str,
+    page_number: int = 1,
+    max_results: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    ctx: Optional[Context] = None,
+):
     """
     Search for competitions by name with pagination support.
 
     Args:
         competition_name (str): Name of the competition to search for
         page_number (int): Page number for pagination (default: 1)
+        max_results (int): Optional cap; when set, this and the following
+            pages are fetched concurrently until the cap is reached
+        fields (list): Optional dotted paths to keep (e.g. "results.name");
+            "@compact" selects a compact default
 
     Returns:
         dict: Dictionary containing search results or error information
@@ -22,20 +67,35 @@ def search_competitions(competition_name: str, page_number: int = 1):
     if page_number < 1:
         return {"error": "Page number must be positive"}
 
+    if max_results is not None and not 1 <= max_results <= MAX_SEARCH_RESULTS:
+        return {"error": f"Max results must be between 1 and {MAX_SEARCH_RESULTS}"}
+
     logging.info(
         f"Searching for competitions: '{competition_name}', page: {page_number}"
     )
 
-    return client.get(
-        f"competitions/search/{competition_name}", params={"page_number": page_number}
-    )
+    if max_results is not None:
+        result = await fetch_search_pages(
+            f"competitions/search/{competition_name}", page_number, max_results, ctx
+        )
+    else:
+        result = await client.aget(
+            f"competitions/search/{competition_name}",
+            params={"page_number": page_number},
+        )
 
+    return apply_projection(result, fields, COMPACT_FIELDS["search_competitions"])
 
-def get_competition_clubs(competition_id: str):
+
+async def get_competition_clubs(
+    competition_id: str, fields: Optional[List[str]] = None
+):
     """Get all clubs participating in a specific competition.
 
     Args:
         competition_id (str): The competition ID (e.g. 'TR1' for Turkish Super Lig)
+        fields (list): Optional dotted paths to keep (e.g. "clubs.name");
+            "@compact" selects a compact default
 
     Returns:
         dict: Dictionary containing clubs data or error information
@@ -47,14 +107,19 @@ def get_competition_clubs(competition_id: str):
 
     logging.info(f"Getting clubs for competition ID: {competition_id}")
 
-    return client.get(f"competitions/{competition_id}/clubs")
+    result = await client.aget(f"competitions/{competition_id}/clubs")
+    return apply_projection(result, fields, COMPACT_FIELDS["get_competition_clubs"])
 
 
-def get_competition_details(competition_id: str):
+async def get_competition_details(
+    competition_id: str, fields: Optional[List[str]] = None
+):
     """Get detailed information about a specific competition.
 
     Args:
         competition_id (str): The competition ID (e.g. 'TR1' for Turkish Super Lig)
+        fields (list): Optional dotted paths to keep (e.g. "name");
+            "@compact" selects a compact default
 
     Returns:
         dict: Dictionary containing competition details or error information
@@ -66,16 +131,100 @@ def get_competition_details(competition_id: str):
 
     logging.info(f"Getting competition details for ID: {competition_id}")
 
-    return client.get(f"competitions/{competition_id}")
+    result = await client.aget(f"competitions/{competition_id}")
+    return apply_projection(result, fields, COMPACT_FIELDS["get_competition_details"])
+
+
+async def crawl_competition(
+    competition_id: str,
+    season_id: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    ctx: Optional[Context] = None,
+):
+    """Get every club in a competition together with its squad.
+
+    Squads are fetched concurrently (bounded by BATCH_CONCURRENCY). A progress
+    notification is sent as each club's squad arrives, so clients see the
+    crawl advance instead of waiting for the whole league.
+
+    Args:
+        competition_id (str): The competition ID (e.g. 'GB1' for Premier League)
+        season_id (str): Optional season identifier (e.g. '2023')
+        fields (list): Optional dotted paths to keep (e.g. "clubs.players.name");
+            "@compact" expands to a small default set
+
+    Returns:
+        dict: Clubs with compact squads (id, name, position, age, market
+        value), plus per-club errors, or error information
+    """
+    from transfermarkt_mcp.client import client, is_error
+
+    if not competition_id.strip():
+        return {"error": "Competition ID cannot be empty"}
 
+    logging.info(
+        f"Crawling competition ID: {competition_id}, season: {season_id or 'current'}"
+    )
 
-def register_competition_tools(mcp) -> None:
+    params = {"season_id": season_id} if season_id else {}
+    competition = await client.aget(
+        f"competitions/{competition_id}/clubs", params=params
+    )
+    if is_error(competition):
+        return competition
+
+    clubs = [
+        club
+        for club in competition.get("clubs") or []
+        if isinstance(club, dict) and club.get("id")
+    ]
+    total = len(clubs)
+    if ctx is not None:
+        await ctx.report_progress(0, total, f"Found {total} clubs")
+
+    calls = [(f"clubs/{club['id']}/players", params) for club in clubs]
+    squads: List[Optional[List[Dict[str, Any]]]] = [None] * total
+    errors = []
+    done = 0
+    async for index, result in client.aiter_many(calls):
+        club = clubs[index]
+        done += 1
+        if is_error(result):
+            errors.append({"club_id": club["id"], "error": result["error"]})
+            message = f"{club.get('name', club['id'])}: {result['error']}"
+        else:
+            squad = [
+                {field: player.get(field) for field in CRAWL_PLAYER_FIELDS}
+                for player in result.get("players") or []
+                if isinstance(player, dict)
+            ]
+            squads[index] = squad
+            message = f"{club.get('name', club['id'])}: {len(squad)} players"
+        if ctx is not None:
+            await ctx.report_progress(done, total, message)
+
+    result = {
+        "competition_id": competition_id,
+        "season_id": competition.get("seasonId", season_id),
+        "clubs": [
+            {"id": club["id"], "name": club.get("name"), "players": squad}
+            for club, squad in zip(clubs, squads)
+            if squad is not None
+        ],
+        "errors": errors,
+    }
+    return apply_projection(result, fields, COMPACT_FIELDS["crawl_competition"])
+
+
+def register_competition_tools(mcp: FastMCP) -> None:
     """Register all club tools with the MCP server."""
     # Use the decorator syntax that FastMCP expects
     mcp.tool()(search_competitions)
     mcp.tool()(get_competition_clubs)
     mcp.tool()(get_competition_details)
+    mcp.tool()(crawl_competition)
 
     logger.info(
-        "Registered competition tools: search_competitions, get_competition_clubs, get_competition_details"
+        "Registered competition tools: search_competitions, get_competition_clubs, "
+        "get_competition_details, crawl_competition"
     )
@@ -0,0 +1,101 @@
+"""Transfer network MCP tool backed by the local transfer graph."""
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from transfermarkt_mcp.parsing import parse_date
+from transfermarkt_mcp.transfer_graph import graph
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+logger = logging.getLogger(__name__)
+
+NETWORK_QUERIES = ("neighbors", "path", "flow")
+MAX_PATH_HOPS = 6
+MAX_NEIGHBORS = 50
+
+
+async def query_transfer_network(
+    query: str,
+    club_id: str,
+    other_club_id: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    max_hops: int = 3,
+    directed: bool = True,
+    limit: int = 10,
+) -> Dict[str, Any]:
+    """
+    Query the network of transfers between clubs without refetching.
+
+    Answers from every player transfer history fetched so far (by
+    get_player_transfers, get_players_batch or a snapshot), so coverage
+    grows as histories are fetched; "graph" reports how many are known.
+
+    Args:
+        query: neighbors (clubs that traded most players with club_id),
+            path (shortest chain of moves from club_id to other_club_id)
+            or flow (moves, loans and fees in and out of club_id, or only
+            those with other_club_id)
+        club_id: Unique identifier of the club
+        other_club_id: Second club, required for path
+        since: Only moves on or after this date (YYYY-MM-DD)
+        until: Only moves on or before this date (YYYY-MM-DD)
+        max_hops: Longest chain path looks for (default: 3)
+        directed: Whether path follows moves only in their direction
+        limit: Maximum number of neighbors (default: 10)
+
+    Returns:
+        Dictionary with the query's result and the graph's size, or error
+        information
+    """
+    if query not in NETWORK_QUERIES:
+        return {
+            "error": f"Unknown query: {query}. "
+            f"Valid queries: {', '.join(NETWORK_QUERIES)}"
+        }
+
+    if not club_id.strip():
+        return {"error": "Club ID cannot be empty"}
+
+    if query == "neighbors" and not 1 <= limit <= MAX_NEIGHBORS:
+        return {"error": f"Limit must be between 1 and {MAX_NEIGHBORS}"}
+
+    if query == "path":
+        if not other_club_id or other_club_id == club_id:
+            return {"error": "Path needs a different other_club_id"}
+        if not 1 <= max_hops <= MAX_PATH_HOPS:
+            return {"error": f"Max hops must be between 1 and {MAX_PATH_HOPS}"}
+        if since or until:
+            return {"error": "Path does not support since or until"}
+
+    window = {}
+    for name, value in (("since", since), ("until", until)):
+        if value is not None:
+            day = parse_date(value)
+            if day is None:
+                return {"error": f"Invalid {name} date: {value}"}
+            window[name] = day.isoformat()
+
+    logger.info(f"Querying transfer network: {query} for club ID: {club_id}")
+
+    result: Dict[str, Any] = {"query": query, "graph": graph.stats()}
+    if query == "neighbors":
+        result["club"] = graph.club(club_id)
+        result["neighbors"] = graph.neighbors(club_id, limit=limit, **window)
+    elif query == "path" and other_club_id:
+        result["path"] = graph.path(club_id, other_club_id, max_hops, directed)
+    else:
+        result.update(graph.flow(club_id, other_club_id, **window))
+    return result
+
+
+def register_network_tools(mcp: "FastMCP") -> None:
+    """Register the transfer network tool and feed the graph from the client."""
+    from transfermarkt_mcp.client import on_client
+
+    on_client(lambda client: client.add_observer(graph.observe))
+    mcp.tool()(query_transfer_network)
+
+    logger.info("Registered network tools: query_transfer_network")
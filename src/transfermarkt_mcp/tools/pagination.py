@@ -0,0 +1,99 @@
+"""Multi-page fetching shared by the search tools."""
+
+import logging
+import math
+from typing import Any, Dict, List, Optional
+
+from fastmcp import Context
+
+from transfermarkt_mcp.parsing import parse_int
+
+logger = logging.getLogger(__name__)
+
+# Hard cap on results a single search call may collect across pages
+MAX_SEARCH_RESULTS = 500
+
+
+async def fetch_search_pages(
+    endpoint: str,
+    page_number: int,
+    max_results: int,
+    ctx: Optional[Context] = None,
+) -> Dict[str, Any]:
+    """
+    Collect up to ``max_results`` search results starting at ``page_number``.
+
+    The first page reveals the page size and last page number; the further
+    pages needed to reach the cap are then fetched concurrently. Results are
+    appended in page order as soon as each page arrives, fetching stops
+    early once the cap is reached, and a progress notification is sent per
+    page.
+
+    Returns:
+        The first page's metadata with the merged "results", the pages that
+        were merged and any per-page errors, or error information
+    """
+    from transfermarkt_mcp.client import client, is_error
+
+    first = await client.aget(endpoint, params={"page_number": page_number})
+    if is_error(first):
+        return first
+
+    results = first.get("results")
+    last_page = parse_int(first.get("lastPageNumber"))
+    if not isinstance(results, list) or last_page is None:
+        return first
+
+    collected: List[Any] = list(results)
+    pages: List[int] = []
+    if results and len(collected) < max_results:
+        needed = math.ceil((max_results - len(collected)) / len(results))
+        pages = list(range(page_number + 1, last_page + 1))[:needed]
+
+    total = 1 + len(pages)
+    if ctx is not None:
+        await ctx.report_progress(
+            1, total, f"Page {page_number}: {len(results)} results"
+        )
+
+    calls = [(endpoint, {"page_number": page}) for page in pages]
+    arrived: Dict[int, Dict[str, Any]] = {}
+    merged = [page_number]
+    errors = []
+    next_page = page_number + 1
+    received = 1
+    async for index, page in client.aiter_many(calls):
+        arrived[pages[index]] = page
+        received += 1
+        if ctx is not None:
+            count = "error" if is_error(page) else len(page.get("results") or [])
+            await ctx.report_progress(
+                received, total, f"Page {pages[index]}: {count} results"
+            )
+
+        while next_page in arrived:
+            page = arrived.pop(next_page)
+            if is_error(page):
+                errors.append({"page": next_page, "error": page["error"]})
+            else:
+                collected.extend(page.get("results") or [])
+                merged.append(next_page)
+            next_page += 1
+
+        if len(collected) >= max_results:
+            break
+
+    logger.info(
+        f"Collected {min(len(collected), max_results)} results from "
+        f"{len(merged)} pages of {endpoint}"
+    )
+
+    combined = {key: value for key, value in first.items() if key != "results"}
+    combined.update(
+        {
+            "results": collected[:max_results],
+            "pagesFetched": merged,
+            "errors": errors,
+        }
+    )
+    return combined
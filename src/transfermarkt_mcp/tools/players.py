@@ -1,18 +1,120 @@
 """Player-related MCP tools."""
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
-logger = logging.getLogger(__name__)
+from fastmcp import Context, FastMCP
+
+from transfermarkt_mcp.projection import COMPACT, apply_projection
+from transfermarkt_mcp.tools.pagination import MAX_SEARCH_RESULTS, fetch_search_pages
 
+logger = logging.getLogger(__name__)
 
-def search_players(player_name: str, page_number: int = 1) -> Dict[str, Any]:
+# Compact default projection of each tool, selected with fields=["@compact"]
+COMPACT_FIELDS = {
+    "search_players": [
+        "query",
+        "pageNumber",
+        "lastPageNumber",
+        "pagesFetched",
+        "errors",
+        "results.id",
+        "results.name",
+        "results.position",
+        "results.club.name",
+        "results.age",
+        "results.marketValue",
+    ],
+    "get_player_by_id": ["id", "name", "position", "club", "marketValue"],
+    "get_player_profile": [
+        "id",
+        "name",
+        "dateOfBirth",
+        "age",
+        "height",
+        "foot",
+        "citizenship",
+        "position.main",
+        "club.id",
+        "club.name",
+        "club.contractExpires",
+        "marketValue",
+    ],
+    "get_player_market_value": [
+        "id",
+        "marketValue",
+        "marketValueHistory.date",
+        "marketValueHistory.clubName",
+        "marketValueHistory.value",
+    ],
+    "get_player_transfers": [
+        "id",
+        "transfers.date",
+        "transfers.season",
+        "transfers.clubFrom.name",
+        "transfers.clubTo.name",
+        "transfers.fee",
+        "transfers.marketValue",
+    ],
+    "get_player_jersey_numbers": [
+        "id",
+        "jerseyNumbers.season",
+        "jerseyNumbers.club",
+        "jerseyNumbers.jerseyNumber",
+    ],
+    "get_player_stats": [
+        "id",
+        "stats.seasonId",
+        "stats.competitionName",
+        "stats.clubId",
+        "stats.appearances",
+        "stats.goals",
+        "stats.assists",
+        "stats.minutesPlayed",
+    ],
+    "get_player_injuries": [
+        "id",
+        "injuries.season",
+        "injuries.injury",
+        "injuries.from",
+        "injuries.until",
+        "injuries.days",
+        "injuries.gamesMissed",
+    ],
+    "get_player_achievements": ["id", "achievements.title", "achievements.count"],
+}
+
+# Per-player endpoints available to the batch tool, keyed by facet name
+PLAYER_FACETS = {
+    "profile": "players/{player_id}/profile",
+    "market_value": "players/{player_id}/market_value",
+    "transfers": "players/{player_id}/transfers",
+    "stats": "players/{player_id}/stats",
+    "injuries": "players/{player_id}/injuries",
+    "jersey_numbers": "players/{player_id}/jersey_numbers",
+    "achievements": "players/{player_id}/achievements",
+}
+DEFAULT_BATCH_FACETS = ["profile", "market_value", "transfers", "stats", "injuries"]
+MAX_BATCH_PLAYERS = 50
+
+
+async def search_players(
+    player_name: str,
+    page_number: int = 1,
+    max_results: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    ctx: Optional[Context] = None,
+) -> Dict[str, Any]:
     """
     Search for players by name with pagination support.
 
     Args:
         player_name: Name of the player to search for
         page_number: Page number for pagination (default: 1)
+        max_results: Optional cap; when set, this and the following pages
+            are fetched concurrently until the cap is reached
+        fields: Optional dotted paths to keep (e.g. "results.name");
+            "@compact" selects a compact default
 
     Returns:
         Dictionary containing search results or error information
@@ -25,19 +127,33 @@ def search_players(player_name: str, page_number: int = 1) -> Dict[str, Any]:
     if page_number < 1:
         return {"error": "Page number must be positive"}
 
+    if max_results is not None and not 1 <= max_results <= MAX_SEARCH_RESULTS:
+        return {"error": f"Max results must be between 1 and {MAX_SEARCH_RESULTS}"}
+
     logger.info(f"Searching for players: '{player_name}', page: {page_number}")
 
-    return client.get(
-        f"players/search/{player_name}", params={"page_number": page_number}
-    )
+    if max_results is not None:
+        result = await fetch_search_pages(
+            f"players/search/{player_name}", page_number, max_results, ctx
+        )
+    else:
+        result = await client.aget(
+            f"players/search/{player_name}", params={"page_number": page_number}
+        )
+
+    return apply_projection(result, fields, COMPACT_FIELDS["search_players"])
 
 
-def get_player_by_id(player_id: str) -> Dict[str, Any]:
+async def get_player_by_id(
+    player_id: str, fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get detailed information about a specific player.
 
     Args:
         player_id: Unique identifier of the player
+        fields: Optional dotted paths to keep (e.g. "name");
+            "@compact" selects a compact default
 
     Returns:
         Dictionary containing player data or error information
@@ -49,15 +165,20 @@ def get_player_by_id(player_id: str) -> Dict[str, Any]:
 
     logger.info(f"Getting player details for ID: {player_id}")
 
-    return client.get(f"players/{player_id}")
+    result = await client.aget(f"players/{player_id}")
+    return apply_projection(result, fields, COMPACT_FIELDS["get_player_by_id"])
 
 
-def get_player_profile(player_id: str) -> Dict[str, Any]:
+async def get_player_profile(
+    player_id: str, fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get detailed profile information for a player.
 
     Args:
         player_id: Unique identifier of the player
+        fields: Optional dotted paths to keep (e.g. "club.name");
+            "@compact" selects a compact default
 
     Returns:
         Dictionary containing player profile data or error information
@@ -69,15 +190,20 @@ def get_player_profile(player_id: str) -> Dict[str, Any]:
 
     logger.info(f"Getting player profile for ID: {player_id}")
 
-    return client.get(f"players/{player_id}/profile")
+    result = await client.aget(f"players/{player_id}/profile")
+    return apply_projection(result, fields, COMPACT_FIELDS["get_player_profile"])
 
 
-def get_player_market_value(player_id: str) -> Dict[str, Any]:
+async def get_player_market_value(
+    player_id: str, fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get market value information for a specific player.
 
     Args:
         player_id: Unique identifier of the player
+        fields: Optional dotted paths to keep (e.g. "marketValueHistory.value");
+            "@compact" selects a compact default
 
     Returns:
         Dictionary containing market value data or error information
@@ -89,15 +215,20 @@ def get_player_market_value(player_id: str) -> Dict[str, Any]:
 
     logger.info(f"Getting market value for player ID: {player_id}")
 
-    return client.get(f"players/{player_id}/market_value")
+    result = await client.aget(f"players/{player_id}/market_value")
+    return apply_projection(result, fields, COMPACT_FIELDS["get_player_market_value"])
 
 
-def get_player_transfers(player_id: str) -> Dict[str, Any]:
+async def get_player_transfers(
+    player_id: str, fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get transfer history of a player.
 
     Args:
         player_id: Unique identifier of the player
+        fields: Optional dotted paths to keep (e.g. "transfers.clubTo.name");
+            "@compact" selects a compact default
 
     Returns:
         Dictionary containing transfer history or error information
@@ -109,15 +240,20 @@ def get_player_transfers(player_id: str) -> Dict[str, Any]:
 
     logger.info(f"Getting transfer history for player ID: {player_id}")
 
-    return client.get(f"players/{player_id}/transfers")
+    result = await client.aget(f"players/{player_id}/transfers")
+    return apply_projection(result, fields, COMPACT_FIELDS["get_player_transfers"])
 
 
-def get_player_jersey_numbers(player_id: str) -> Dict[str, Any]:
+async def get_player_jersey_numbers(
+    player_id: str, fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get jersey numbers history for a player.
 
     Args:
         player_id: Unique identifier of the player
+        fields: Optional dotted paths to keep (e.g. "jerseyNumbers.jerseyNumber");
+            "@compact" selects a compact default
 
     Returns:
         Dictionary containing jersey numbers history or error information
@@ -129,16 +265,23 @@ def get_player_jersey_numbers(player_id: str) -> Dict[str, Any]:
 
     logger.info(f"Getting jersey numbers for player ID: {player_id}")
 
-    return client.get(f"players/{player_id}/jersey_numbers")
+    result = await client.aget(f"players/{player_id}/jersey_numbers")
+    return apply_projection(result, fields, COMPACT_FIELDS["get_player_jersey_numbers"])
 
 
-def get_player_stats(player_id: str, season: Optional[str] = None) -> Dict[str, Any]:
+async def get_player_stats(
+    player_id: str,
+    season: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
     """
     Get player statistics with optional season filter.
 
     Args:
         player_id: Unique identifier of the player
         season: Optional season identifier for filtering
+        fields: Optional dotted paths to keep (e.g. "stats.goals");
+            "@compact" selects a compact default
 
     Returns:
         Dictionary containing player statistics or error information
@@ -156,15 +299,20 @@ def get_player_stats(player_id: str, season: Optional[str] = None) -> Dict[str,
     if season:
         params["season"] = season
 
-    return client.get(f"players/{player_id}/stats", params=params)
+    result = await client.aget(f"players/{player_id}/stats", params=params)
+    return apply_projection(result, fields, COMPACT_FIELDS["get_player_stats"])
 
 
-def get_player_injuries(player_id: str) -> Dict[str, Any]:
+async def get_player_injuries(
+    player_id: str, fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get injury history for a player.
 
     Args:
         player_id: Unique identifier of the player
+        fields: Optional dotted paths to keep (e.g. "injuries.injury");
+            "@compact" selects a compact default
 
     Returns:
         Dictionary containing injury history or error information
@@ -176,15 +324,20 @@ def get_player_injuries(player_id: str) -> Dict[str, Any]:
 
     logger.info(f"Getting injury history for player ID: {player_id}")
 
-    return client.get(f"players/{player_id}/injuries")
+    result = await client.aget(f"players/{player_id}/injuries")
+    return apply_projection(result, fields, COMPACT_FIELDS["get_player_injuries"])
 
 
-def get_player_achievements(player_id: str) -> Dict[str, Any]:
+async def get_player_achievements(
+    player_id: str, fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get achievements and trophies for a player.
 
     Args:
         player_id: Unique identifier of the player
+        fields: Optional dotted paths to keep (e.g. "achievements.title");
+            "@compact" selects a compact default
 
     Returns:
         Dictionary containing achievements data or error information
@@ -196,10 +349,94 @@ def get_player_achievements(player_id: str) -> Dict[str, Any]:
 
     logger.info(f"Getting achievements for player ID: {player_id}")
 
-    return client.get(f"players/{player_id}/achievements")
+    result = await client.aget(f"players/{player_id}/achievements")
+    return apply_projection(result, fields, COMPACT_FIELDS["get_player_achievements"])
+
+
+def _facet_fields(facet: str, fields: Optional[List[str]]) -> Optional[List[str]]:
+    """Select the batch ``fields`` addressed to ``facet``, without the prefix."""
+    if fields is None:
+        return None
+    selected = []
+    for field in fields:
+        head, _, rest = field.partition(".")
+        if field in (COMPACT, "*"):
+            selected.append(field)
+        elif head == facet:
+            selected.append(rest or "*")
+    return selected
+
+
+async def get_players_batch(
+    player_ids: List[str],
+    facets: Optional[List[str]] = None,
+    season: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Get several kinds of data for many players in one call.
+
+    Upstream requests run concurrently with a bounded pool. A failed
+    request only affects its own entry, which holds an error dictionary.
 
+    Args:
+        player_ids: Unique identifiers of the players (at most 50)
+        facets: Data to fetch per player: profile, market_value, transfers,
+            stats, injuries, jersey_numbers, achievements
+            (default: profile, market_value, transfers, stats, injuries)
+        season: Optional season identifier for the stats facet
+        fields: Optional dotted paths to keep per player, prefixed by facet
+            (e.g. "profile.name"); "@compact" applies each facet's compact
+            default
 
-def register_player_tools(mcp) -> None:
+    Returns:
+        Dictionary keyed by player ID, then by facet, plus an error count
+    """
+    from transfermarkt_mcp.client import client, is_error
+
+    player_ids = list(dict.fromkeys(pid.strip() for pid in player_ids))
+    if not player_ids or not all(player_ids):
+        return {"error": "Player IDs cannot be empty"}
+
+    if len(player_ids) > MAX_BATCH_PLAYERS:
+        return {"error": f"At most {MAX_BATCH_PLAYERS} players per batch"}
+
+    facets = list(dict.fromkeys(facets or DEFAULT_BATCH_FACETS))
+    unknown = [facet for facet in facets if facet not in PLAYER_FACETS]
+    if unknown:
+        return {
+            "error": f"Unknown facets: {', '.join(unknown)}. "
+            f"Valid facets: {', '.join(PLAYER_FACETS)}"
+        }
+
+    logger.info(f"Getting {', '.join(facets)} for {len(player_ids)} players")
+
+    keys = [(pid, facet) for pid in player_ids for facet in facets]
+    calls = [
+        (
+            PLAYER_FACETS[facet].format(player_id=pid),
+            {"season": season} if facet == "stats" and season else None,
+        )
+        for pid, facet in keys
+    ]
+    results = await client.aget_many(calls)
+
+    players: Dict[str, Dict[str, Any]] = {pid: {} for pid in player_ids}
+    for (pid, facet), result in zip(keys, results):
+        facet_fields = _facet_fields(facet, fields)
+        if facet_fields == [] and not is_error(result):
+            continue
+        players[pid][facet] = apply_projection(
+            result, facet_fields, COMPACT_FIELDS[f"get_player_{facet}"]
+        )
+
+    return {
+        "players": players,
+        "errors": sum(1 for result in results if is_error(result)),
+    }
+
+
+def register_player_tools(mcp: FastMCP) -> None:
     """Register all player tools with the MCP server."""
     # Use the decorator syntax that FastMCP expects
     mcp.tool()(search_players)
@@ -211,9 +448,11 @@ def register_player_tools(mcp) -> None:
     mcp.tool()(get_player_stats)
     mcp.tool()(get_player_injuries)
     mcp.tool()(get_player_achievements)
+    mcp.tool()(get_players_batch)
 
     logger.info(
-        "Registered player tools: search_players, get_player_by_id, get_player_profile, "
-        "get_player_market_value, get_player_transfers, get_player_jersey_numbers, "
-        "get_player_stats, get_player_injuries, get_player_achievements"
+        "Registered player tools: search_players, get_player_by_id, "
+        "get_player_profile, get_player_market_value, get_player_transfers, "
+        "get_player_jersey_numbers, get_player_stats, get_player_injuries, "
+        "get_player_achievements, get_players_batch"
     )
@@ -0,0 +1,88 @@
+"""Name resolution MCP tool backed by the local search index."""
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict
+
+from transfermarkt_mcp.search_index import KINDS, index, rank
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+logger = logging.getLogger(__name__)
+
+# Best local match needed to answer without asking upstream
+MATCH_SCORE = 0.6
+MAX_RESOLVE_RESULTS = 25
+
+
+async def resolve_name(
+    name: str, kind: str = "player", limit: int = 5
+) -> Dict[str, Any]:
+    """
+    Resolve a player, club or competition name to IDs.
+
+    Answers from the names already seen in earlier responses, ignoring
+    case and accents and tolerating typos; only when nothing matches well,
+    or several entities share the exact name, is the upstream search
+    called. Use this before the ID-based tools.
+
+    Args:
+        name: Name to resolve (e.g. "Lewandowski", "Fenerbahce")
+        kind: What the name refers to: player, club or competition
+        limit: Maximum number of matches (default: 5)
+
+    Returns:
+        Dictionary with the ranked "matches" (id, name, score and a few
+        identifying fields) and their "source" ("index" or "upstream"),
+        or error information
+    """
+    from transfermarkt_mcp.client import client, is_error
+
+    if not name.strip():
+        return {"error": "Name cannot be empty"}
+
+    if kind not in KINDS:
+        return {"error": f"Unknown kind: {kind}. Valid kinds: {', '.join(KINDS)}"}
+
+    if not 1 <= limit <= MAX_RESOLVE_RESULTS:
+        return {"error": f"Limit must be between 1 and {MAX_RESOLVE_RESULTS}"}
+
+    # Namesakes, several entities indexed under the exact name, are ranked
+    # by the upstream search rather than by the order they were indexed in;
+    # two matches at least are looked up to tell whether the name is shared
+    matches = index.lookup(kind, name, max(limit, 2))
+    namesakes = sum(match["score"] == 1.0 for match in matches) > 1
+    if matches and matches[0]["score"] >= MATCH_SCORE and not namesakes:
+        return {
+            "query": name,
+            "kind": kind,
+            "source": "index",
+            "matches": matches[:limit],
+        }
+
+    logger.info(f"Resolving {kind} name upstream: '{name}'")
+
+    endpoint = f"{kind}s/search/{name}"
+    result = await client.aget(endpoint, params={"page_number": 1})
+    if is_error(result):
+        return result
+
+    # The client observer has usually indexed these already; adding them
+    # again is idempotent and covers a client without the observer.
+    index.observe(endpoint, result)
+    return {
+        "query": name,
+        "kind": kind,
+        "source": "upstream",
+        "matches": rank(kind, name, result.get("results"), limit),
+    }
+
+
+def register_search_tools(mcp: "FastMCP") -> None:
+    """Register the name resolution tool and feed the index from the client."""
+    from transfermarkt_mcp.client import on_client
+
+    on_client(lambda client: client.add_observer(index.observe))
+    mcp.tool()(resolve_name)
+
+    logger.info("Registered search tools: resolve_name")
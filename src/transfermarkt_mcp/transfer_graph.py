@@ -0,0 +1,312 @@
+"""In-process graph of transfers between clubs."""
+
+import logging
+import threading
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from transfermarkt_mcp.config import config
+from transfermarkt_mcp.parsing import parse_date, parse_money
+
+logger = logging.getLogger(__name__)
+
+# Responses holding a player's transfer history
+SOURCE = "players/*/transfers"
+
+Adjacency = Dict[str, Dict[str, List["TransferEdge"]]]
+
+
+@dataclass(frozen=True, slots=True)
+class TransferEdge:
+    """One player's move from one club to another."""
+
+    player_id: str
+    from_id: str
+    to_id: str
+    date: Optional[str]
+    season: Optional[str]
+    fee: Optional[float]
+    fee_text: Optional[str]
+
+    @property
+    def loan(self) -> bool:
+        """True for loans and returns from loan."""
+        return "loan" in (self.fee_text or "").lower()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "player_id": self.player_id,
+            "from": self.from_id,
+            "to": self.to_id,
+            "date": self.date,
+            "fee": self.fee_text,
+        }
+
+
+def in_window(
+    edges: List[TransferEdge], since: Optional[str], until: Optional[str]
+) -> List[TransferEdge]:
+    """
+    Edges dated within [since, until]; undated edges only when unbounded,
+    in which case ``edges`` itself is returned.
+    """
+    if since is None and until is None:
+        return edges
+    return [
+        edge
+        for edge in edges
+        if edge.date is not None
+        and (since is None or edge.date >= since)
+        and (until is None or edge.date <= until)
+    ]
+
+
+def _fees(edges: Iterable[TransferEdge]) -> float:
+    return sum(edge.fee for edge in edges if edge.fee is not None)
+
+
+class TransferGraph:
+    """
+    Adjacency index of clubs (nodes) and transfers (edges) between them.
+
+    ``observe`` is a client observer that replaces a player's edges with
+    every transfer history response seen, so neighbour, path and flow
+    queries answer from memory in milliseconds. The graph only knows the
+    histories seen so far; the least recently seen players are dropped
+    beyond ``max_players``.
+    """
+
+    def __init__(self, max_players: int = 100000) -> None:
+        self.max_players = max_players
+        self._histories: "OrderedDict[str, List[TransferEdge]]" = OrderedDict()
+        self._out: Adjacency = {}
+        self._in: Adjacency = {}
+        self._names: Dict[str, str] = {}
+        # Edges per club, so clubs drop out with their last transfer
+        self._degrees: Counter[str] = Counter()
+        self._transfers = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._histories)
+
+    def add_history(self, player_id: Any, transfers: Iterable[Any]) -> None:
+        """Replace what is known about a player's moves with ``transfers``."""
+        if not player_id:
+            return
+        player_id = str(player_id)
+        edges = []
+        names = {}
+        for transfer in transfers:
+            if not isinstance(transfer, dict):
+                continue
+            clubs: List[Optional[str]] = []
+            for side in ("clubFrom", "clubTo"):
+                club = transfer.get(side)
+                if not isinstance(club, dict) or not club.get("id"):
+                    clubs.append(None)
+                    continue
+                clubs.append(str(club["id"]))
+                if isinstance(club.get("name"), str):
+                    names[str(club["id"])] = club["name"]
+            from_id, to_id = clubs
+            if from_id is None or to_id is None or from_id == to_id:
+                continue
+            day = parse_date(transfer.get("date"))
+            fee = transfer.get("fee")
+            edges.append(
+                TransferEdge(
+                    player_id,
+                    from_id,
+                    to_id,
+                    day.isoformat() if day else None,
+                    transfer.get("season"),
+                    parse_money(fee),
+                    fee if isinstance(fee, str) else None,
+                )
+            )
+
+        with self._lock:
+            self._names.update(names)
+            previous = self._histories.pop(player_id, None)
+            if previous is not None:
+                self._unlink(previous)
+            self._histories[player_id] = edges
+            for edge in edges:
+                outgoing = self._out.setdefault(edge.from_id, {})
+                outgoing.setdefault(edge.to_id, []).append(edge)
+                incoming = self._in.setdefault(edge.to_id, {})
+                incoming.setdefault(edge.from_id, []).append(edge)
+                self._degrees.update((edge.from_id, edge.to_id))
+            self._transfers += len(edges)
+            while len(self._histories) > self.max_players:
+                _, evicted = self._histories.popitem(last=False)
+                self._unlink(evicted)
+
+    def _unlink(self, edges: List[TransferEdge]) -> None:
+        self._transfers -= len(edges)
+        for edge in edges:
+            for club_id in (edge.from_id, edge.to_id):
+                self._degrees[club_id] -= 1
+                if not self._degrees[club_id]:
+                    del self._degrees[club_id]
+            for adjacency, node, other in (
+                (self._out, edge.from_id, edge.to_id),
+                (self._in, edge.to_id, edge.from_id),
+            ):
+                partners = adjacency[node]
+                partners[other].remove(edge)
+                if not partners[other]:
+                    del partners[other]
+                if not partners:
+                    del adjacency[node]
+
+    def observe(self, endpoint: str, result: Any) -> None:
+        """Add the transfer history in a successful response from ``endpoint``."""
+        endpoint = endpoint.strip("/")
+        if not isinstance(result, dict) or not fnmatchcase(endpoint, SOURCE):
+            return
+        transfers = result.get("transfers")
+        if isinstance(transfers, list):
+            self.add_history(result.get("id") or endpoint.split("/")[1], transfers)
+
+    def club(self, club_id: str) -> Dict[str, Any]:
+        """A club's ID and the name it was last seen with."""
+        return {"id": club_id, "name": self._names.get(club_id)}
+
+    def neighbors(
+        self,
+        club_id: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Clubs that traded players with ``club_id``, most moves first."""
+        with self._lock:
+            bought = {
+                other: in_window(edges, since, until)
+                for other, edges in self._in.get(club_id, {}).items()
+            }
+            sold = {
+                other: in_window(edges, since, until)
+                for other, edges in self._out.get(club_id, {}).items()
+            }
+            rows = []
+            for other in bought.keys() | sold.keys():
+                moves_in = bought.get(other, [])
+                moves_out = sold.get(other, [])
+                if not moves_in and not moves_out:
+                    continue
+                rows.append(
+                    {
+                        **self.club(other),
+                        "moves": len(moves_in) + len(moves_out),
+                        "players_in": len(moves_in),
+                        "players_out": len(moves_out),
+                        "fees_paid": _fees(moves_in),
+                        "fees_received": _fees(moves_out),
+                    }
+                )
+        rows.sort(key=lambda row: (-row["moves"], row["name"] or row["id"]))
+        return rows[:limit]
+
+    def path(
+        self, from_id: str, to_id: str, max_hops: int = 3, directed: bool = True
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Shortest chain of transfers from ``from_id`` to ``to_id``; with
+        ``directed`` false, moves count in either direction. Each hop names
+        its clubs and the most recent move between them. None if no chain
+        of at most ``max_hops`` moves is known.
+        """
+        with self._lock:
+            parents: Dict[str, Optional[str]] = {from_id: None}
+            frontier = deque([(from_id, 0)])
+            while frontier and to_id not in parents:
+                node, depth = frontier.popleft()
+                if depth == max_hops:
+                    continue
+                for other in self._partners(node, directed):
+                    if other not in parents:
+                        parents[other] = node
+                        frontier.append((other, depth + 1))
+            if to_id not in parents:
+                return None
+
+            chain = [to_id]
+            parent = parents[to_id]
+            while parent is not None:
+                chain.append(parent)
+                parent = parents[parent]
+            chain.reverse()
+            steps = []
+            for node, other in zip(chain, chain[1:]):
+                edges = list(self._out.get(node, {}).get(other, []))
+                if not directed:
+                    edges += self._out.get(other, {}).get(node, [])
+                latest = max(edges, key=lambda edge: edge.date or "")
+                steps.append(
+                    {
+                        "from": self.club(node),
+                        "to": self.club(other),
+                        "moves": len(edges),
+                        "latest": latest.to_dict(),
+                    }
+                )
+        return steps
+
+    def _partners(self, club_id: str, directed: bool) -> Set[str]:
+        partners = set(self._out.get(club_id, ()))
+        if not directed:
+            partners.update(self._in.get(club_id, ()))
+        return partners
+
+    def flow(
+        self,
+        club_id: str,
+        other_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Aggregate moves into and out of ``club_id``, optionally only those
+        with ``other_id``: counts, loans, fees paid and received, net spend.
+        """
+        with self._lock:
+            incoming = self._in.get(club_id, {})
+            outgoing = self._out.get(club_id, {})
+            if other_id is not None:
+                moves_in = incoming.get(other_id, [])
+                moves_out = outgoing.get(other_id, [])
+            else:
+                moves_in = [edge for edges in incoming.values() for edge in edges]
+                moves_out = [edge for edges in outgoing.values() for edge in edges]
+            moves_in = in_window(moves_in, since, until)
+            moves_out = in_window(moves_out, since, until)
+            paid, received = _fees(moves_in), _fees(moves_out)
+            return {
+                "club": self.club(club_id),
+                "other_club": self.club(other_id) if other_id else None,
+                "moves_in": len(moves_in),
+                "moves_out": len(moves_out),
+                "loans_in": sum(edge.loan for edge in moves_in),
+                "loans_out": sum(edge.loan for edge in moves_out),
+                "players": len({edge.player_id for edge in moves_in + moves_out}),
+                "fees_paid": paid,
+                "fees_received": received,
+                "net_spend": paid - received,
+            }
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of players, clubs and transfers in the graph."""
+        with self._lock:
+            return {
+                "players": len(self._histories),
+                "clubs": len(self._degrees),
+                "transfers": self._transfers,
+            }
+
+
+graph = TransferGraph(max_players=config.transfer_graph_max_players)
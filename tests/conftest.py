@@ -1,5 +1,6 @@
 """Test configuration and fixtures."""
 
+import httpx
 import pytest
 from unittest.mock import Mock
 from transfermarkt_mcp.client import TransfermarktClient
@@ -12,6 +13,21 @@ def mock_client():
     return client
 
 
+@pytest.fixture
+def make_client():
+    """Factory for clients whose async path is served by an httpx mock transport."""
+
+    def make(handler):
+        client = TransfermarktClient()
+        client.base_url = "http://api.test"
+        client._create_async_session = lambda: httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return client
+
+    return make
+
+
 @pytest.fixture
 def sample_club_data():
     """Sample club data for testing."""
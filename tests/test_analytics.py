@@ -0,0 +1,283 @@
+"""Tests for analytics tools."""
+
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock
+from transfermarkt_mcp.tools import analytics
+from transfermarkt_mcp.tools.analytics import (
+    analyze_market_values,
+    get_club_squad_stats,
+    interpolate,
+    market_value_rows,
+    percentile_ranks,
+    season_totals,
+    summarize_market_values,
+)
+
+
+def history(*points):
+    """Market value response from (date, age, value) tuples."""
+    return {
+        "marketValue": points[-1][2] if points else None,
+        "marketValueHistory": [
+            {"date": date, "age": age, "value": value} for date, age, value in points
+        ],
+    }
+
+
+RISING = history(
+    ("2019-07-01", 19, "€1.00m"),
+    ("2021-07-01", 21, "€4.00m"),
+    ("2023-07-01", 23, "€16.00m"),
+    ("2024-07-01", 24, "€12.00m"),
+)
+
+
+class TestInterpolate:
+    """Test cases for interpolate function."""
+
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_interpolate(self, numpy):
+        """Test both the NumPy and the pure Python path."""
+        if numpy and analytics._numpy() is None:
+            pytest.skip("NumPy is not installed")
+        with patch.object(analytics, "np", analytics._numpy() if numpy else None):
+            found = interpolate([0, 1, 1.5, 3, 4], [1, 2, 3], [10, 20, 40])
+
+        assert found == [None, 10, 15, 40, None]
+
+    def test_interpolate_empty_curve(self):
+        """Test interpolating a curve without points."""
+        assert interpolate([1, 2], [], []) == [None, None]
+
+
+class TestPercentileRanks:
+    """Test cases for percentile_ranks function."""
+
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_percentile_ranks(self, numpy):
+        """Test ties counting half below, on both paths."""
+        if numpy and analytics._numpy() is None:
+            pytest.skip("NumPy is not installed")
+        with patch.object(analytics, "np", analytics._numpy() if numpy else None):
+            ranks = percentile_ranks([3, 1, 3, 0])
+
+        assert ranks == [75.0, 37.5, 75.0, 12.5]
+
+    def test_percentile_ranks_empty(self):
+        """Test no values."""
+        assert percentile_ranks([]) == []
+
+
+class TestSummarizeMarketValues:
+    """Test cases for summarize_market_values function."""
+
+    def test_summary(self):
+        """Test peak, growth, change and age-aligned values."""
+        row = summarize_market_values(RISING, 12, [21, 22])
+        current, peak, peak_date, peak_age, vs_peak, cagr, change = row[:7]
+
+        assert (current, peak, peak_date) == (12_000_000, 16_000_000, "2023-07-01")
+        assert 23 <= peak_age < 24
+        assert vs_peak == 0.75
+        assert cagr == pytest.approx(12 ** (1 / 5) - 1, abs=1e-3)
+        assert change == pytest.approx(-0.25, abs=1e-3)
+        assert row[7] == pytest.approx(4_000_000, rel=0.2)
+        assert 4_000_000 < row[8] < 16_000_000
+
+    def test_window_before_history(self):
+        """Test a window reaching back past the first valuation."""
+        row = summarize_market_values(RISING, 120, [])
+        assert row[6] is None
+
+    def test_unusable_history(self):
+        """Test points without dates or values."""
+        data = {
+            "marketValue": "€5.00m",
+            "marketValueHistory": [{"value": "-"}, {"date": "?"}],
+        }
+
+        row = summarize_market_values(data, 12, [21])
+
+        assert row == [5_000_000, None, None, None, None, None, None, None]
+
+
+class TestMarketValueRows:
+    """Test cases for market_value_rows function."""
+
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_rows_match_per_player_summaries(self, numpy):
+        """Test the stacked NumPy columns equal the per-player rows."""
+        if numpy and analytics._numpy() is None:
+            pytest.skip("NumPy is not installed")
+        results = [
+            RISING,
+            history(("2022-01-01", 20, "€2.00m"), ("2023-01-01", 21, "€3.00m")),
+            history(("2023-07-01", None, "€1.00m")),
+            {"marketValue": "€5.00m", "marketValueHistory": [{"value": "-"}]},
+            history(("2020-01-01", 30, "€0"), ("2021-01-01", 31, "€0")),
+        ]
+        expected = [
+            summarize_market_values(data, 12, [19.5, 21, 30]) for data in results
+        ]
+
+        with patch.object(analytics, "np", analytics._numpy() if numpy else None):
+            rows = market_value_rows(results, 12, [19.5, 21, 30])
+
+        assert rows == expected
+
+    def test_no_results(self):
+        """Test an empty table."""
+        assert market_value_rows([], 12, [21]) == []
+
+
+class TestAnalyzeMarketValues:
+    """Test cases for analyze_market_values function."""
+
+    def test_no_players(self):
+        """Test an empty player list."""
+        result = asyncio.run(analyze_market_values([" "]))
+        assert "At least one" in result["error"]
+
+    def test_too_many_players(self):
+        """Test the player limit."""
+        ids = [str(i) for i in range(analytics.MAX_ANALYTICS_PLAYERS + 1)]
+        result = asyncio.run(analyze_market_values(ids))
+        assert "At most" in result["error"]
+
+    def test_invalid_sort_column(self):
+        """Test sorting by an unknown column."""
+        result = asyncio.run(analyze_market_values(["1"], sort_by="name"))
+        assert "Unknown sort column" in result["error"]
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_table(self, mock_client):
+        """Test one row per player, sorted, with errors listed apart."""
+        mock_client.aget_many.return_value = [
+            history(("2022-01-01", 20, "€2.00m"), ("2023-01-01", 21, "€3.00m")),
+            {"error": "HTTP error 404: Not Found"},
+            RISING,
+        ]
+
+        result = asyncio.run(
+            analyze_market_values(["1", "2", "3", "1"], ages=[21], sort_by="current")
+        )
+
+        mock_client.aget_many.assert_called_once_with(
+            [
+                ("players/1/market_value", None),
+                ("players/2/market_value", None),
+                ("players/3/market_value", None),
+            ]
+        )
+        assert result["columns"][-1] == "value_at_21"
+        assert [row[0] for row in result["rows"]] == ["3", "1"]
+        assert result["rows"][1][:3] == ["1", 3_000_000, 3_000_000]
+        assert result["errors"] == [{"id": "2", "error": "HTTP error 404: Not Found"}]
+
+
+def stats(*entries):
+    """Player stats response from (season, club, apps, minutes, goals, assists)."""
+    return {
+        "stats": [
+            {
+                "seasonId": season,
+                "clubId": club,
+                "appearances": apps,
+                "minutesPlayed": minutes,
+                "goals": goals,
+                "assists": assists,
+            }
+            for season, club, apps, minutes, goals, assists in entries
+        ]
+    }
+
+
+ROSTER = {
+    "id": "27",
+    "players": [
+        {"id": "1", "name": "Harry Kane", "position": "Centre-Forward"},
+        {"id": "2", "name": "Leroy Sané", "position": "Right Winger"},
+        {"id": "3", "name": "Jamal Musiala", "position": "Attacking Midfield"},
+        {"id": "4", "name": "Sven Ulreich", "position": "Goalkeeper"},
+    ],
+}
+
+
+class TestSeasonTotals:
+    """Test cases for season_totals function."""
+
+    def test_totals_across_competitions(self):
+        """Test summing one season's entries for the club only."""
+        entries = stats(
+            ("23/24", "27", "32", "2.800'", 36, 8),
+            ("23/24", "27", 12, "1.000'", 8, 2),
+            ("23/24", "985", 5, 400, 3, 0),
+            ("22/23", "27", 40, 3500, 30, 10),
+        )["stats"]
+
+        assert season_totals(entries, 2023, "27") == [44, 3800, 44, 10, 0, 0]
+
+
+class TestGetClubSquadStats:
+    """Test cases for get_club_squad_stats function."""
+
+    def test_empty_club_id(self):
+        """Test an empty club ID."""
+        result = asyncio.run(get_club_squad_stats(""))
+        assert "cannot be empty" in result["error"]
+
+    def test_invalid_rank_column(self):
+        """Test ranking by an unknown column."""
+        result = asyncio.run(get_club_squad_stats("27", rank_by="xg"))
+        assert "Unknown rank column" in result["error"]
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_ranking(self, mock_client):
+        """Test the ranked rows, per-90 rates, ties and squad totals."""
+        mock_client.aget.return_value = ROSTER
+        mock_client.aget_many.return_value = [
+            stats(("23/24", "27", 45, 3900, 44, 12), ("22/23", "31", 40, 3600, 30, 3)),
+            stats(("23/24", "27", 37, 2100, 10, 12)),
+            stats(("23/24", "27", 38, 2600, 10, 8)),
+            {"error": "HTTP error 500: Internal Server Error"},
+        ]
+
+        result = asyncio.run(get_club_squad_stats("27", limit=2))
+
+        mock_client.aget.assert_called_once_with("clubs/27/players", params={})
+        assert mock_client.aget_many.call_args.args[0][0] == ("players/1/stats", None)
+        assert result["season"] == 2023
+        assert (result["players"], result["ranked"]) == (3, 3)
+        columns = result["columns"]
+        kane, second = (dict(zip(columns, row)) for row in result["rows"])
+        assert (kane["rank"], kane["name"], kane["goals"]) == (1, "Harry Kane", 44)
+        assert kane["goals_per_90"] == round(44 * 90 / 3900, 2)
+        assert kane["percentile"] == round(250 / 3, 1)
+        # Sané and Musiala tie on goals; both rank second, by name
+        assert (second["rank"], second["name"]) == (2, "Jamal Musiala")
+        assert result["totals"]["goals"] == 64
+        assert result["totals"]["assists"] == 32
+        assert result["errors"][0]["id"] == "4"
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_per_90_needs_minutes(self, mock_client):
+        """Test players under min_minutes are left out of per-90 rankings."""
+        mock_client.aget.return_value = ROSTER
+        mock_client.aget_many.return_value = [
+            stats(("2023", "27", 1, 30, 1, 0)),
+            stats(("2023", "27", 10, 900, 2, 0)),
+            stats(),
+            stats(),
+        ]
+
+        result = asyncio.run(
+            get_club_squad_stats("27", season_id="2023", rank_by="goals_per_90")
+        )
+
+        assert mock_client.aget_many.call_args.args[0][0] == (
+            "players/1/stats",
+            {"season": "2023"},
+        )
+        assert result["ranked"] == 1
+        assert result["rows"][0][2] == "Leroy Sané"
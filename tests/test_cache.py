@@ -0,0 +1,136 @@
+"""Tests for the response cache."""
+
+from unittest.mock import patch
+from transfermarkt_mcp.cache import ResponseCache, make_cache_key
+from transfermarkt_mcp.models import ClubSquad
+
+
+class TestMakeCacheKey:
+    """Test cases for make_cache_key function."""
+
+    def test_key_without_params(self):
+        """Test keys ignore surrounding slashes."""
+        assert make_cache_key("/players/8198/") == "players/8198"
+
+    def test_key_params_are_sorted_and_skip_none(self):
+        """Test parameter order and None values do not change the key."""
+        first = make_cache_key("clubs/27/players", {"b": 2, "a": "x", "c": None})
+        second = make_cache_key("clubs/27/players", {"a": "x", "b": "2"})
+        assert first == second == "clubs/27/players?a=x&b=2"
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache class."""
+
+    def test_ttl_for_first_matching_pattern(self):
+        """Test per-endpoint TTL patterns are matched in order."""
+        cache = ResponseCache(
+            ttls=[("players/*/achievements", 86400), ("players/*", 60)],
+            default_ttl=5,
+        )
+        assert cache.ttl_for("players/8198/achievements") == 86400
+        assert cache.ttl_for("players/8198/stats") == 60
+        assert cache.ttl_for("clubs/27/profile") == 5
+
+    def test_hit_and_miss_counters(self):
+        """Test hits and misses are counted."""
+        cache = ResponseCache()
+        assert cache.get("players/8198/profile") is None
+        cache.set("players/8198/profile", "players/8198/profile", {"id": "8198"})
+        assert cache.get("players/8198/profile") == {"id": "8198"}
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    @patch("transfermarkt_mcp.cache.time.monotonic")
+    def test_entry_expires_after_ttl(self, mock_monotonic):
+        """Test entries stop being served once their TTL elapses."""
+        cache = ResponseCache(ttls=[("players/*/market_value", 3600)])
+        mock_monotonic.return_value = 1000.0
+        cache.set("players/1/market_value", "players/1/market_value", {"v": 1})
+
+        mock_monotonic.return_value = 1000.0 + 3599
+        assert cache.get("players/1/market_value") == {"v": 1}
+        mock_monotonic.return_value = 1000.0 + 3600
+        assert cache.get("players/1/market_value") is None
+        assert cache.stats()["entries"] == 0
+
+    @patch("transfermarkt_mcp.cache.time.monotonic")
+    def test_expired_entries_kept_for_stale_reads(self, mock_monotonic):
+        """Test expired entries stay readable through get_stale for stale_ttl."""
+        cache = ResponseCache(ttls=[("players/*", 60)], stale_ttl=600)
+        mock_monotonic.return_value = 1000.0
+        cache.set("players/1/stats", "players/1/stats", {"v": 1})
+
+        mock_monotonic.return_value = 1000.0 + 90
+        assert cache.get("players/1/stats") is None
+        assert cache.get_stale("players/1/stats", 10) is None
+        assert cache.get_stale("players/1/stats", 60) == ({"v": 1}, 90)
+
+        mock_monotonic.return_value = 1000.0 + 660
+        assert cache.get("players/1/stats") is None
+        assert cache.get_stale("players/1/stats", 3600) is None
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["stale_hits"] == 1
+
+    def test_zero_ttl_is_not_cached(self):
+        """Test a zero TTL disables caching for matching endpoints."""
+        cache = ResponseCache(ttls=[("players/*/stats", 0)])
+        cache.set("players/1/stats", "players/1/stats", {"stats": []})
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_by_entry_count(self):
+        """Test the least recently used entry is evicted first."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", "a", {"a": 1})
+        cache.set("b", "b", {"b": 1})
+        cache.get("a")
+        cache.set("c", "c", {"c": 1})
+
+        assert cache.get("a") == {"a": 1}
+        assert cache.get("b") is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_lru_eviction_by_bytes(self):
+        """Test the cache stays within its byte budget."""
+        cache = ResponseCache(max_bytes=100)
+        cache.set("a", "a", {"a": 1}, size=60)
+        cache.set("b", "b", {"b": 1}, size=60)
+
+        assert cache.get("a") is None
+        assert cache.stats()["bytes"] == 60
+
+    def test_oversized_value_is_not_cached(self):
+        """Test a single value larger than the budget is skipped."""
+        cache = ResponseCache(max_bytes=10)
+        cache.set("a", "a", {"name": "a long value"})
+        assert cache.stats()["entries"] == 0
+
+
+class TestModelStorage:
+    """Test cases for holding responses as models in the cache."""
+
+    def test_modelled_response_round_trips(self):
+        """Test a squad is stored as a model and read back unchanged."""
+        squad = {
+            "id": "27",
+            "players": [{"id": "8198", "name": "Robert Lewandowski", "rank": 1}],
+        }
+        cache = ResponseCache(models=True)
+        cache.set("clubs/27/players", "clubs/27/players", squad)
+
+        assert isinstance(cache._entries["clubs/27/players"].value, ClubSquad)
+        assert cache.get("clubs/27/players") == squad
+        assert cache.get_entry("clubs/27/players").value == squad
+
+    def test_invalid_or_unmodelled_responses_stay_dicts(self):
+        """Test values without a matching model are stored as given."""
+        cache = ResponseCache(models=True)
+        invalid = {"players": "none"}
+        cache.set("clubs/27/players", "clubs/27/players", invalid)
+        cache.set("players/8198/stats", "players/8198/stats", {"stats": []})
+
+        assert cache._entries["clubs/27/players"].value is invalid
+        assert cache.get("players/8198/stats") == {"stats": []}
@@ -0,0 +1,590 @@
+"""Tests for the Transfermarkt HTTP client."""
+
+import asyncio
+import gc
+import httpx
+import logging
+import pytest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch, AsyncMock, Mock
+from transfermarkt_mcp.cache import ResponseCache
+from transfermarkt_mcp.client import TransfermarktClient
+
+
+class TestAsyncGet:
+    """Test cases for the asyncio-native request path."""
+
+    def test_aget_success(self, sample_player_data, make_client):
+        """Test a successful async GET returns the decoded body."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json=sample_player_data)
+
+        client = make_client(handler)
+        result = asyncio.run(client.aget("players/8198", params={"page_number": 2}))
+
+        assert result == sample_player_data
+        assert seen[0].url.path == "/players/8198"
+        assert seen[0].url.params["page_number"] == "2"
+
+    def test_aget_keeps_raw_body(self, make_client):
+        """Test decoded responses carry their body for pass-through."""
+        body = b'{"id": "8198", "name": "Robert Lewandowski"}'
+        client = make_client(lambda request: httpx.Response(200, content=body))
+
+        result = asyncio.run(client.aget("players/8198/profile"))
+
+        assert result == {"id": "8198", "name": "Robert Lewandowski"}
+        assert result.raw == body
+
+    def test_aget_http_error(self, make_client):
+        """Test a non-retryable HTTP error maps to an error dictionary."""
+        client = make_client(lambda request: httpx.Response(404))
+
+        result = asyncio.run(client.aget("players/0"))
+
+        assert result == {"error": "HTTP error 404: Not Found"}
+
+    def test_aget_invalid_json(self, make_client):
+        """Test an unparsable body maps to an error dictionary."""
+        client = make_client(lambda request: httpx.Response(200, text="<html>"))
+
+        result = asyncio.run(client.aget("players/8198"))
+
+        assert "Invalid JSON response" in result["error"]
+
+    @patch("transfermarkt_mcp.client.asyncio.sleep", new_callable=AsyncMock)
+    def test_aget_retries_retryable_status(self, mock_sleep, make_client):
+        """Test retryable statuses are retried with urllib3-style backoff."""
+        responses = [
+            httpx.Response(503),
+            httpx.Response(502),
+            httpx.Response(200, json={}),
+        ]
+        client = make_client(lambda request: responses.pop(0))
+
+        result = asyncio.run(client.aget("players/8198"))
+
+        assert result == {}
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [0.0, 2]
+
+    @patch("transfermarkt_mcp.client.asyncio.sleep", new_callable=AsyncMock)
+    def test_aget_honours_retry_after(self, mock_sleep, make_client):
+        """Test a 429 with Retry-After waits for the advertised delay."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "5"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+        client = make_client(lambda request: responses.pop(0))
+
+        result = asyncio.run(client.aget("players/8198"))
+
+        assert result == {"ok": True}
+        # The retry waits out Retry-After; with sleep mocked no time passes,
+        # so the shared bucket's pause is still pending for the next attempt
+        assert mock_sleep.await_args_list[0].args == (5.0,)
+
+    @patch("transfermarkt_mcp.client.asyncio.sleep", new_callable=AsyncMock)
+    def test_aget_throttles_after_rate_limit_response(self, mock_sleep, make_client):
+        """Test a 429 pauses the shared bucket and shrinks the in-flight limit."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "5"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+        client = make_client(lambda request: responses.pop(0))
+        limit = client.concurrency.stats()["limit"]
+
+        asyncio.run(client.aget("players/8198"))
+
+        assert client.concurrency.stats()["limit"] < limit
+        assert client.rate_limiter.reserve() > 4
+
+    @patch("transfermarkt_mcp.client.asyncio.sleep", new_callable=AsyncMock)
+    def test_aget_retries_exhausted(self, mock_sleep, make_client):
+        """Test the final retryable status is reported once retries run out."""
+        client = make_client(lambda request: httpx.Response(500))
+
+        result = asyncio.run(client.aget("players/8198"))
+
+        assert result == {"error": "HTTP error 500: Internal Server Error"}
+        assert mock_sleep.await_count == 3
+
+    @patch("transfermarkt_mcp.client.asyncio.sleep", new_callable=AsyncMock)
+    def test_aget_connection_error(self, mock_sleep, make_client):
+        """Test connection failures map to the sync path's error message."""
+
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        client = make_client(handler)
+        result = asyncio.run(client.aget("players/8198"))
+
+        assert result == {"error": "Failed to connect to the API"}
+
+    @patch("transfermarkt_mcp.client.asyncio.sleep", new_callable=AsyncMock)
+    def test_aget_timeout(self, mock_sleep, make_client):
+        """Test timeouts map to the sync path's error message."""
+
+        def handler(request):
+            raise httpx.ReadTimeout("slow", request=request)
+
+        client = make_client(handler)
+        result = asyncio.run(client.aget("players/8198"))
+
+        assert result == {"error": f"Request timed out after {client.timeout} seconds"}
+
+    @pytest.mark.parametrize("name", ["a\x00b", "a\nb", "a" * 70000])
+    def test_aget_invalid_url_returns_error(self, name, make_client):
+        """Test a URL httpx refuses becomes an error result, not an exception."""
+        client = make_client(lambda request: httpx.Response(200, json={}))
+
+        result = asyncio.run(client.aget(f"players/search/{name}"))
+
+        assert result["error"].startswith("Request failed: ")
+
+
+class TestResponseCaching:
+    """Test cases for the cache layer under get/aget."""
+
+    def test_aget_serves_repeat_calls_from_cache(self, make_client):
+        """Test identical GETs only reach upstream once."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"id": "8198"})
+
+        client = make_client(handler)
+
+        async def fetch_twice():
+            first = await client.aget("players/8198/profile")
+            second = await client.aget("players/8198/profile")
+            return first, second
+
+        first, second = asyncio.run(fetch_twice())
+
+        assert first == second == {"id": "8198"}
+        assert len(calls) == 1
+        assert client.cache.stats()["hits"] == 1
+
+    def test_aget_does_not_cache_errors(self, make_client):
+        """Test error responses are retried on the next call."""
+        responses = [httpx.Response(404), httpx.Response(200, json={"id": "1"})]
+        client = make_client(lambda request: responses.pop(0))
+
+        async def fetch_twice():
+            return [await client.aget("players/1"), await client.aget("players/1")]
+
+        first, second = asyncio.run(fetch_twice())
+
+        assert "error" in first
+        assert second == {"id": "1"}
+
+    def test_get_serves_repeat_calls_from_cache(self):
+        """Test the sync path reads through the same cache."""
+        client = TransfermarktClient()
+        with patch.object(
+            client, "_make_request", return_value=({"id": "27"}, None)
+        ) as mock_request:
+            assert client.get("clubs/27/profile") == {"id": "27"}
+            assert client.get("clubs/27/profile") == {"id": "27"}
+
+        mock_request.assert_called_once()
+
+    def test_unusable_disk_cache_falls_back_to_memory(self, tmp_path):
+        """Test a disk cache that cannot be opened leaves a memory cache."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        with patch.multiple(
+            "transfermarkt_mcp.client.config",
+            cache_backend="sqlite",
+            cache_path=str(blocker / "cache.sqlite3"),
+        ):
+            client = TransfermarktClient()
+
+        assert isinstance(client.cache, ResponseCache)
+
+    def test_observers_see_fetched_responses_only(self, make_client):
+        """Test observers get upstream responses but not errors or cache hits."""
+        responses = [httpx.Response(404), httpx.Response(200, json={"id": "1"})]
+        client = make_client(lambda request: responses.pop(0))
+        seen = []
+        client.add_observer(lambda endpoint, result: seen.append((endpoint, result)))
+        client.add_observer(Mock(side_effect=RuntimeError("boom")))
+
+        async def fetch():
+            for _ in range(3):
+                await client.aget("players/1")
+
+        asyncio.run(fetch())
+
+        assert seen == [("players/1", {"id": "1"})]
+
+
+class TestStaleResponses:
+    """Test cases for serving expired cache entries."""
+
+    def expire(self, client, key):
+        """Age a cached entry past its TTL."""
+        entry = client.cache._entries[key]
+        entry.stored_at -= entry.ttl + 30
+
+    def test_stale_while_revalidate(self, make_client):
+        """Test an expired entry is served at once and refreshed in the background."""
+        bodies = [{"id": "1", "v": 1}, {"id": "1", "v": 2}]
+        client = make_client(lambda request: httpx.Response(200, json=bodies.pop(0)))
+        client.stale_while_revalidate = 300
+
+        async def run():
+            await client.aget("players/1/stats")
+            self.expire(client, "players/1/stats")
+            stale = await client.aget("players/1/stats")
+            await asyncio.gather(*client._refreshing)
+            return stale, await client.aget("players/1/stats")
+
+        stale, refreshed = asyncio.run(run())
+
+        assert stale == {"id": "1", "v": 1, "stale": True, "cacheAge": 3630.0}
+        assert refreshed == {"id": "1", "v": 2}
+
+    @patch("transfermarkt_mcp.client.asyncio.sleep", new_callable=AsyncMock)
+    def test_stale_if_error(self, mock_sleep, make_client):
+        """Test an upstream failure falls back to the last good response."""
+        responses = [httpx.Response(200, json={"id": "1"})] + [httpx.Response(503)] * 4
+        client = make_client(lambda request: responses.pop(0))
+        client.stale_while_revalidate = 0
+
+        async def run():
+            await client.aget("players/1/stats")
+            self.expire(client, "players/1/stats")
+            return await client.aget("players/1/stats")
+
+        result = asyncio.run(run())
+
+        assert result == {
+            "id": "1",
+            "stale": True,
+            "cacheAge": 3630.0,
+            "upstreamError": "HTTP error 503: Service Unavailable",
+        }
+
+    @patch("transfermarkt_mcp.client.asyncio.sleep", new_callable=AsyncMock)
+    def test_error_without_cached_entry(self, mock_sleep, make_client):
+        """Test errors pass through when nothing was cached before."""
+        client = make_client(lambda request: httpx.Response(503))
+
+        result = asyncio.run(client.aget("players/1/stats"))
+
+        assert result == {"error": "HTTP error 503: Service Unavailable"}
+
+
+class TestConditionalRequests:
+    """Test cases for ETag / Last-Modified revalidation."""
+
+    def test_expired_entry_revalidated_with_validators(self, make_client):
+        """Test a refresh sends the stored validators and reuses the body on 304."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if len(seen) == 1:
+                return httpx.Response(
+                    200,
+                    json={"id": "27", "players": []},
+                    headers={
+                        "ETag": '"v1"',
+                        "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+                    },
+                )
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+
+        client = make_client(handler)
+
+        async def run():
+            first = await client.aget("clubs/27/players")
+            client.cache._entries["clubs/27/players"].stored_at -= 7200
+            second = await client.aget("clubs/27/players")
+            third = await client.aget("clubs/27/players")
+            return first, second, third
+
+        first, second, third = asyncio.run(run())
+
+        assert first == second == third == {"id": "27", "players": []}
+        assert "If-None-Match" not in seen[0].headers
+        assert seen[1].headers["If-None-Match"] == '"v1"'
+        assert seen[1].headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert len(seen) == 2
+        assert client.revalidations == 1
+
+    def test_changed_resource_replaces_entry(self, make_client):
+        """Test a 200 to a conditional request stores the new body and validators."""
+        responses = [
+            httpx.Response(200, json={"v": 1}, headers={"ETag": '"v1"'}),
+            httpx.Response(200, json={"v": 2}, headers={"ETag": '"v2"'}),
+        ]
+        client = make_client(lambda request: responses.pop(0))
+
+        async def run():
+            await client.aget("players/1/stats")
+            client.cache._entries["players/1/stats"].stored_at -= 7200
+            return await client.aget("players/1/stats")
+
+        assert asyncio.run(run()) == {"v": 2}
+        assert client.cache.get_entry("players/1/stats").validators == {"etag": '"v2"'}
+        assert client.revalidations == 0
+
+    def test_sync_get_revalidates(self):
+        """Test the sync path sends validators and treats 304 as a hit."""
+        client = TransfermarktClient()
+        client.cache.set(
+            "players/1/stats",
+            "players/1/stats",
+            {"v": 1},
+            ttl=0.001,
+            validators={"etag": '"v1"'},
+        )
+        client.cache._entries["players/1/stats"].stored_at -= 1
+
+        with patch.object(client.session, "request") as mock_request:
+            mock_request.return_value.status_code = 304
+            assert client.get("players/1/stats") == {"v": 1}
+
+        headers = mock_request.call_args.kwargs["headers"]
+        assert headers == {"If-None-Match": '"v1"'}
+        assert client.cache.get("players/1/stats") == {"v": 1}
+
+
+class TestRequestCoalescing:
+    """Test cases for single-flight coalescing in the client."""
+
+    def test_concurrent_identical_agets_share_one_request(self, make_client):
+        """Test identical in-flight async GETs reach upstream once."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"players": []})
+
+        client = make_client(handler)
+        client.cache = None
+
+        async def fetch_many():
+            return await asyncio.gather(
+                *(client.aget("clubs/27/players", params={}) for _ in range(10))
+            )
+
+        results = asyncio.run(fetch_many())
+
+        assert results == [{"players": []}] * 10
+        assert len(calls) == 1
+
+
+class TestAgetMany:
+    """Test cases for bounded concurrent GETs."""
+
+    def test_aget_many_preserves_order_and_bounds_concurrency(self):
+        """Test results follow request order and in-flight calls are capped."""
+        client = TransfermarktClient()
+        client.cache = None
+        in_flight = []
+        peak = []
+
+        async def fake_aget(endpoint, params=None):
+            in_flight.append(endpoint)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.001)
+            in_flight.remove(endpoint)
+            return {"endpoint": endpoint, "params": params}
+
+        client.aget = fake_aget
+        calls = [(f"players/{i}/profile", None) for i in range(10)]
+        results = asyncio.run(client.aget_many(calls, concurrency=3))
+
+        assert [r["endpoint"] for r in results] == [c[0] for c in calls]
+        assert max(peak) == 3
+
+    def test_aiter_many_yields_in_completion_order_and_cancels_rest(self):
+        """Test results stream as they finish and leftovers are cancelled."""
+        client = TransfermarktClient()
+        cancelled = []
+
+        async def fake_aget(endpoint, params=None):
+            try:
+                await asyncio.sleep(params["delay"])
+            except asyncio.CancelledError:
+                cancelled.append(endpoint)
+                raise
+            return {"endpoint": endpoint}
+
+        client.aget = fake_aget
+        calls = [("slow", {"delay": 1}), ("fast", {"delay": 0})]
+
+        async def first_result():
+            async for index, result in client.aiter_many(calls, concurrency=2):
+                return index, result
+
+        async def run():
+            first = await first_result()
+            await asyncio.sleep(0)
+            return first
+
+        assert asyncio.run(run()) == (1, {"endpoint": "fast"})
+        assert cancelled == ["slow"]
+
+
+class TestConnectionPool:
+    """Test cases for pool, keep-alive and timeout configuration."""
+
+    @patch.multiple(
+        "transfermarkt_mcp.client.config",
+        pool_connections=4,
+        pool_maxsize=64,
+        connect_timeout=3.0,
+        read_timeout=20.0,
+    )
+    def test_sync_session_uses_configured_pool(self):
+        """Test the requests adapter is sized from the config."""
+        client = TransfermarktClient()
+        adapter = client.session.get_adapter("https://api.test")
+
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 64
+        assert client.session.headers["Connection"] == "keep-alive"
+
+        with patch.object(client.session, "request") as mock_request:
+            mock_request.return_value.json.return_value = {}
+            client._make_request("GET", "players/8198")
+        assert mock_request.call_args.kwargs["timeout"] == (3.0, 20.0)
+
+    @patch.multiple(
+        "transfermarkt_mcp.client.config",
+        pool_maxsize=64,
+        max_keepalive=16,
+        keepalive_expiry=30.0,
+        connect_timeout=3.0,
+        read_timeout=20.0,
+    )
+    def test_async_session_uses_configured_limits(self):
+        """Test the httpx client gets the configured limits and timeouts."""
+        client = TransfermarktClient()
+        session = client._create_async_session()
+
+        assert client.limits == httpx.Limits(
+            max_connections=64, max_keepalive_connections=16, keepalive_expiry=30.0
+        )
+        assert session.timeout == httpx.Timeout(20.0, connect=3.0)
+        asyncio.run(session.aclose())
+
+    def test_session_of_a_finished_loop_is_dropped(self, make_client):
+        """Test a new event loop's session replaces the old loop's one."""
+        client = make_client(lambda request: httpx.Response(200, json={}))
+
+        async def fetch(endpoint):
+            await client.aget(endpoint)
+            return client._get_async_session()
+
+        async def run():
+            second = await fetch("players/2")
+            sessions = list(client._async_sessions.values())
+            await client.aclose()
+            return second, sessions
+
+        first = asyncio.run(fetch("players/1"))
+        second, sessions = asyncio.run(run())
+
+        assert second is not first
+        assert sessions == [second]
+        assert second.is_closed
+
+    def test_requests_across_event_loops_log_nothing(self, caplog):
+        """Test real connections left on a finished loop are not closed late."""
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = TransfermarktClient()
+        client.base_url = f"http://127.0.0.1:{server.server_port}"
+        try:
+            with caplog.at_level(logging.WARNING, logger="asyncio"):
+
+                async def fetch(*endpoints):
+                    return [await client.aget(endpoint) for endpoint in endpoints]
+
+                assert asyncio.run(fetch("players/1")) == [{}]
+                assert asyncio.run(fetch("players/2", "players/3")) == [{}, {}]
+                asyncio.run(client.aclose())
+                gc.collect()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert [r for r in caplog.records if r.name == "asyncio"] == []
+
+    @patch.multiple("transfermarkt_mcp.client.config", keepalive=False)
+    def test_keepalive_disabled(self):
+        """Test HTTP_KEEPALIVE=false closes connections after each request."""
+        client = TransfermarktClient()
+
+        assert client.session.headers["Connection"] == "close"
+        assert client.limits.max_keepalive_connections == 0
+
+    @patch.multiple("transfermarkt_mcp.client.config", http2=True)
+    def test_http2_requires_h2(self):
+        """Test HTTP/2 is only enabled when the h2 package imports."""
+        with patch.dict("sys.modules", {"h2": None}):
+            assert TransfermarktClient().http2 is False
+        with patch.dict("sys.modules", {"h2": object()}):
+            assert TransfermarktClient().http2 is True
+
+
+class TestLazySetup:
+    """Test cases for deferring session and client construction."""
+
+    def test_session_is_created_on_first_use(self):
+        """Test the requests session only exists once the blocking path needs it."""
+        client = TransfermarktClient()
+        client.close()
+        assert client._session is None
+
+        session = client.session
+        assert client.session is session
+        client.close()
+
+    def test_global_client_is_built_on_first_access(self):
+        """Test the module-level client is created once, when first used."""
+        import transfermarkt_mcp.client as module
+
+        with patch.object(module, "_client", None):
+            first = module.client
+            assert module.client is first
+            assert isinstance(first, TransfermarktClient)
+
+    def test_hooks_run_when_the_client_is_built(self):
+        """Test on_client defers hooks until the first access, then runs them once."""
+        import transfermarkt_mcp.client as module
+
+        seen = []
+        with patch.multiple(module, _client=None, _client_hooks=[]):
+            module.on_client(seen.append)
+            assert seen == []
+
+            built = module.client
+            module.client
+            assert seen == [built]
+
+            module.on_client(seen.append)
+            assert seen == [built, built]
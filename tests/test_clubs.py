@@ -1,8 +1,11 @@
 """Tests for club-related tools."""
 
+import asyncio
 import pytest
-from unittest.mock import patch, MagicMock
-from transfermarkt_mcp.tools.clubs import search_clubs, get_club_profile, get_club_players
+from unittest.mock import patch, AsyncMock
+from transfermarkt_mcp.tools.clubs import (
+    search_clubs, get_club_profile, get_club_players, get_club_squad_details
+)
 
 
 class TestSearchClubs:
@@ -10,35 +13,35 @@ class TestSearchClubs:
 
     def test_search_clubs_empty_name(self):
         """Test search with empty club name."""
-        result = search_clubs("")
+        result = asyncio.run(search_clubs(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
     def test_search_clubs_invalid_page(self):
         """Test search with invalid page number."""
-        result = search_clubs("Bayern", page_number=0)
+        result = asyncio.run(search_clubs("Bayern", page_number=0))
         assert "error" in result
         assert "must be positive" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_search_clubs_success(self, mock_client, sample_club_data):
         """Test successful club search."""
-        mock_client.get.return_value = {"clubs": [sample_club_data]}
+        mock_client.aget.return_value = {"clubs": [sample_club_data]}
 
-        result = search_clubs("Bayern", page_number=1)
+        result = asyncio.run(search_clubs("Bayern", page_number=1))
 
-        mock_client.get.assert_called_once_with(
+        mock_client.aget.assert_called_once_with(
             "clubs/search/Bayern",
             params={"page_number": 1}
         )
         assert "clubs" in result
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_search_clubs_api_error(self, mock_client):
         """Test search with API error."""
-        mock_client.get.return_value = {"error": "API unavailable"}
+        mock_client.aget.return_value = {"error": "API unavailable"}
 
-        result = search_clubs("Bayern")
+        result = asyncio.run(search_clubs("Bayern"))
 
         assert "error" in result
         assert result["error"] == "API unavailable"
@@ -49,26 +52,26 @@ class TestGetClubProfile:
 
     def test_get_club_profile_empty_id(self):
         """Test getting profile with empty club ID."""
-        result = get_club_profile("")
+        result = asyncio.run(get_club_profile(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_club_profile_success(self, mock_client, sample_club_data):
         """Test successful club profile retrieval."""
-        mock_client.get.return_value = sample_club_data
+        mock_client.aget.return_value = sample_club_data
 
-        result = get_club_profile("27")
+        result = asyncio.run(get_club_profile("27"))
 
-        mock_client.get.assert_called_once_with("clubs/27/profile")
+        mock_client.aget.assert_called_once_with("clubs/27/profile")
         assert result == sample_club_data
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_club_profile_not_found(self, mock_client):
         """Test club profile not found."""
-        mock_client.get.return_value = {"error": "Club not found"}
+        mock_client.aget.return_value = {"error": "Club not found"}
 
-        result = get_club_profile("999")
+        result = asyncio.run(get_club_profile("999"))
 
         assert "error" in result
         assert result["error"] == "Club not found"
@@ -79,42 +82,42 @@ class TestGetClubPlayers:
 
     def test_get_club_players_empty_id(self):
         """Test getting players with empty club ID."""
-        result = get_club_players("")
+        result = asyncio.run(get_club_players(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_club_players_success(self, mock_client, sample_players_data):
         """Test successful club players retrieval."""
-        mock_client.get.return_value = sample_players_data
+        mock_client.aget.return_value = sample_players_data
 
-        result = get_club_players("27")
+        result = asyncio.run(get_club_players("27"))
 
-        mock_client.get.assert_called_once_with(
+        mock_client.aget.assert_called_once_with(
             "clubs/27/players",
             params={}
         )
         assert result == sample_players_data
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_club_players_with_season(self, mock_client, sample_players_data):
         """Test club players retrieval with season filter."""
-        mock_client.get.return_value = sample_players_data
+        mock_client.aget.return_value = sample_players_data
 
-        result = get_club_players("27", season_id="2023")
+        result = asyncio.run(get_club_players("27", season_id="2023"))
 
-        mock_client.get.assert_called_once_with(
+        mock_client.aget.assert_called_once_with(
             "clubs/27/players",
             params={"season_id": "2023"}
         )
         assert result == sample_players_data
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_club_players_no_players(self, mock_client):
         """Test club with no players."""
-        mock_client.get.return_value = {"players": []}
+        mock_client.aget.return_value = {"players": []}
 
-        result = get_club_players("27")
+        result = asyncio.run(get_club_players("27"))
 
         assert "players" in result
         assert result["players"] == []
@@ -128,23 +131,143 @@ class TestClubToolsIntegration:
     def test_search_and_get_profile_flow(self, mock_client_class, sample_club_data):
         """Test typical user flow: search then get profile."""
         # Setup mock client instance
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client_class.return_value = mock_client
 
         # Mock search response
-        mock_client.get.side_effect = [
+        mock_client.aget.side_effect = [
             {"clubs": [{"id": "27", "name": "Bayern Munich"}]},  # search result
             sample_club_data  # profile result
         ]
 
         # Test search
         with patch('transfermarkt_mcp.client.client', mock_client):
-            search_result = search_clubs("Bayern")
+            search_result = asyncio.run(search_clubs("Bayern"))
             assert "clubs" in search_result
 
             # Test get profile using ID from search
-            profile_result = get_club_profile("27")
+            profile_result = asyncio.run(get_club_profile("27"))
             assert profile_result == sample_club_data
 
         # Verify calls
-        assert mock_client.get.call_count == 2
\ No newline at end of file
+        assert mock_client.aget.call_count == 2
+
+
+class TestGetClubSquadDetails:
+    """Test cases for get_club_squad_details function."""
+
+    def test_get_club_squad_details_empty_id(self):
+        """Test squad details with empty club ID."""
+        result = asyncio.run(get_club_squad_details(""))
+        assert "error" in result
+        assert "cannot be empty" in result["error"]
+
+    def test_get_club_squad_details_unknown_facet(self):
+        """Test squad details with an unsupported facet."""
+        result = asyncio.run(get_club_squad_details("27", facets=["salary"]))
+        assert "error" in result
+        assert "salary" in result["error"]
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_get_club_squad_details_roster_error(self, mock_client):
+        """Test a failed roster lookup is returned as-is."""
+        mock_client.aget.return_value = {"error": "Club not found"}
+
+        result = asyncio.run(get_club_squad_details("999"))
+
+        assert result == {"error": "Club not found"}
+        mock_client.aget_many.assert_not_called()
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_get_club_squad_details_success(self, mock_client):
+        """Test roster and per-player data merge into one table."""
+        mock_client.aget.return_value = {
+            "players": [
+                {"id": "8198", "name": "Robert Lewandowski",
+                 "position": "Centre-Forward", "age": 35, "marketValue": "€15.00m"},
+                {"id": "28003", "name": "Lionel Messi", "position": "Right Winger",
+                 "age": 36, "marketValue": 35000000},
+            ]
+        }
+        mock_client.aget_many.return_value = [
+            {"marketValueHistory": [{"value": "€120.00m"}, {"value": "€15.00m"}]},
+            {"stats": [
+                {"seasonId": "23/24", "appearances": "30", "goals": 19,
+                 "assists": 8, "minutesPlayed": "2.500'"},
+                {"seasonId": "23/24", "appearances": 10, "goals": 5},
+                {"seasonId": "22/23", "appearances": 46, "goals": 33},
+            ]},
+            {"error": "HTTP error 500: Internal Server Error"},
+            {"stats": []},
+        ]
+
+        result = asyncio.run(get_club_squad_details(
+            "131", season_id="2023", facets=["market_value", "stats"]
+        ))
+
+        mock_client.aget.assert_called_once_with(
+            "clubs/131/players", params={"season_id": "2023"}
+        )
+        mock_client.aget_many.assert_called_once_with([
+            ("players/8198/market_value", None),
+            ("players/8198/stats", {"season": "2023"}),
+            ("players/28003/market_value", None),
+            ("players/28003/stats", {"season": "2023"}),
+        ])
+        assert result["columns"] == [
+            "id", "name", "position", "age", "market_value", "peak_market_value",
+            "appearances", "goals", "assists", "minutes",
+        ]
+        assert result["rows"][0] == [
+            "8198", "Robert Lewandowski", "Centre-Forward", 35, 15e6, 120e6,
+            40, 24, 8, 2500,
+        ]
+        assert result["rows"][1][4:] == [35e6, None, 0, 0, 0, 0]
+        assert result["errors"] == [{
+            "player_id": "28003", "facet": "market_value",
+            "error": "HTTP error 500: Internal Server Error",
+        }]
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_get_club_squad_details_squad_season(self, mock_client):
+        """Test stats total one squad-wide season at this club only."""
+        mock_client.aget.return_value = {
+            "players": [{"id": "1", "name": "A"}, {"id": "2", "name": "B"}]
+        }
+        mock_client.aget_many.return_value = [
+            {"stats": [
+                {"seasonId": "24/25", "clubId": "131", "appearances": 5, "goals": 2},
+                {"seasonId": "24/25", "clubId": "27", "appearances": 9, "goals": 4},
+            ]},
+            {"stats": [{"seasonId": "23/24", "appearances": 30, "goals": 10}]},
+        ]
+
+        result = asyncio.run(get_club_squad_details("131", facets=["stats"]))
+
+        assert result["season"] == 2024
+        assert result["rows"][0][5:] == [5, 2, 0, 0]
+        assert result["rows"][1][5:] == [0, 0, 0, 0]
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_get_club_squad_details_fields(self, mock_client):
+        """Test the table is projected to the requested keys."""
+        mock_client.aget.return_value = {"players": [{"id": "1", "name": "A"}]}
+        mock_client.aget_many.return_value = [{"stats": []}]
+
+        result = asyncio.run(get_club_squad_details(
+            "131", facets=["stats"], fields=["@compact"]
+        ))
+
+        assert list(result) == ["club_id", "season", "columns", "rows", "errors"]
+        assert result["rows"] == [["1", "A", None, None, None, 0, 0, 0, 0]]
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_get_club_squad_details_invalid_roster(self, mock_client):
+        """Test a malformed roster is reported instead of raising."""
+        mock_client.aget.return_value = {"players": [{"id": "8198"}, "8198"]}
+
+        result = asyncio.run(get_club_squad_details("27"))
+
+        assert "error" in result
+        assert "ClubSquad.players[1]" in result["error"]
+        mock_client.aget_many.assert_not_called()
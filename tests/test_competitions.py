@@ -1,8 +1,12 @@
 """Tests for competition-related tools."""
 
+import asyncio
 import pytest
-from unittest.mock import patch
-from transfermarkt_mcp.tools.competitions import search_competitions, get_competition_clubs, get_competition_details
+from unittest.mock import patch, AsyncMock, Mock
+from transfermarkt_mcp.tools.competitions import (
+    search_competitions, get_competition_clubs, get_competition_details,
+    crawl_competition,
+)
 
 
 class TestSearchCompetitions:
@@ -10,35 +14,35 @@ class TestSearchCompetitions:
 
     def test_search_competitions_empty_name(self):
         """Test search with empty competition name."""
-        result = search_competitions("")
+        result = asyncio.run(search_competitions(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
     def test_search_competitions_invalid_page(self):
         """Test search with invalid page number."""
-        result = search_competitions("Premier League", page_number=0)
+        result = asyncio.run(search_competitions("Premier League", page_number=0))
         assert "error" in result
         assert "must be positive" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_search_competitions_success(self, mock_client, sample_competition_data):
         """Test successful competition search."""
-        mock_client.get.return_value = {"competitions": [sample_competition_data]}
+        mock_client.aget.return_value = {"competitions": [sample_competition_data]}
 
-        result = search_competitions("Premier League", page_number=1)
+        result = asyncio.run(search_competitions("Premier League", page_number=1))
 
-        mock_client.get.assert_called_once_with(
+        mock_client.aget.assert_called_once_with(
             "competitions/search/Premier League",
             params={"page_number": 1}
         )
         assert "competitions" in result
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_search_competitions_api_error(self, mock_client):
         """Test search with API error."""
-        mock_client.get.return_value = {"error": "API unavailable"}
+        mock_client.aget.return_value = {"error": "API unavailable"}
 
-        result = search_competitions("Premier League")
+        result = asyncio.run(search_competitions("Premier League"))
 
         assert "error" in result
         assert result["error"] == "API unavailable"
@@ -49,26 +53,26 @@ class TestGetCompetitionClubs:
 
     def test_get_competition_clubs_empty_id(self):
         """Test getting clubs with empty competition ID."""
-        result = get_competition_clubs("")
+        result = asyncio.run(get_competition_clubs(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_competition_clubs_success(self, mock_client, sample_clubs_data):
         """Test successful competition clubs retrieval."""
-        mock_client.get.return_value = sample_clubs_data
+        mock_client.aget.return_value = sample_clubs_data
 
-        result = get_competition_clubs("TR1")
+        result = asyncio.run(get_competition_clubs("TR1"))
 
-        mock_client.get.assert_called_once_with("competitions/TR1/clubs")
+        mock_client.aget.assert_called_once_with("competitions/TR1/clubs")
         assert result == sample_clubs_data
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_competition_clubs_not_found(self, mock_client):
         """Test competition clubs not found."""
-        mock_client.get.return_value = {"error": "Competition not found"}
+        mock_client.aget.return_value = {"error": "Competition not found"}
 
-        result = get_competition_clubs("INVALID")
+        result = asyncio.run(get_competition_clubs("INVALID"))
 
         assert "error" in result
         assert result["error"] == "Competition not found"
@@ -79,26 +83,158 @@ class TestGetCompetitionDetails:
 
     def test_get_competition_details_empty_id(self):
         """Test getting details with empty competition ID."""
-        result = get_competition_details("")
+        result = asyncio.run(get_competition_details(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_competition_details_success(self, mock_client, sample_competition_data):
         """Test successful competition details retrieval."""
-        mock_client.get.return_value = sample_competition_data
+        mock_client.aget.return_value = sample_competition_data
 
-        result = get_competition_details("TR1")
+        result = asyncio.run(get_competition_details("TR1"))
 
-        mock_client.get.assert_called_once_with("competitions/TR1")
+        mock_client.aget.assert_called_once_with("competitions/TR1")
         assert result == sample_competition_data
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_competition_details_not_found(self, mock_client):
         """Test competition details not found."""
-        mock_client.get.return_value = {"error": "Competition not found"}
+        mock_client.aget.return_value = {"error": "Competition not found"}
 
-        result = get_competition_details("INVALID")
+        result = asyncio.run(get_competition_details("INVALID"))
 
         assert "error" in result
         assert result["error"] == "Competition not found"
+
+
+def fake_aiter_many(results_by_endpoint, order=None):
+    """Build an aiter_many stand-in that yields results in a chosen order."""
+
+    async def aiter_many(calls, concurrency=None):
+        indexes = order if order is not None else range(len(calls))
+        for index in indexes:
+            yield index, results_by_endpoint[calls[index][0]]
+
+    return aiter_many
+
+
+class TestCrawlCompetition:
+    """Test cases for crawl_competition function."""
+
+    def test_crawl_competition_empty_id(self):
+        """Test crawling with empty competition ID."""
+        result = asyncio.run(crawl_competition(""))
+        assert "error" in result
+        assert "cannot be empty" in result["error"]
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_crawl_competition_clubs_error(self, mock_client):
+        """Test a failed club lookup is returned as-is."""
+        mock_client.aget.return_value = {"error": "Competition not found"}
+
+        result = asyncio.run(crawl_competition("INVALID"))
+
+        assert result == {"error": "Competition not found"}
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_crawl_competition_success(self, mock_client, sample_clubs_data):
+        """Test squads are collected per club and progress is reported."""
+        mock_client.aget.return_value = dict(sample_clubs_data, seasonId="2023")
+        mock_client.aiter_many = fake_aiter_many(
+            {
+                "clubs/114/players": {"players": [
+                    {"id": "1", "name": "Mauro Icardi", "position": "Centre-Forward",
+                     "age": 30, "marketValue": 9000000, "height": "1,81 m"},
+                ]},
+                "clubs/610/players": {"error": "HTTP error 503: Service Unavailable"},
+            },
+            order=[1, 0],
+        )
+        ctx = AsyncMock()
+
+        result = asyncio.run(crawl_competition("TR1", season_id="2023", ctx=ctx))
+
+        mock_client.aget.assert_called_once_with(
+            "competitions/TR1/clubs", params={"season_id": "2023"}
+        )
+        assert result["season_id"] == "2023"
+        assert result["clubs"] == [{
+            "id": "114", "name": "Galatasaray",
+            "players": [{"id": "1", "name": "Mauro Icardi",
+                         "position": "Centre-Forward", "age": 30,
+                         "marketValue": 9000000}],
+        }]
+        assert result["errors"] == [
+            {"club_id": "610", "error": "HTTP error 503: Service Unavailable"}
+        ]
+        assert [c.args for c in ctx.report_progress.await_args_list] == [
+            (0, 2, "Found 2 clubs"),
+            (1, 2, "Fenerbahçe: HTTP error 503: Service Unavailable"),
+            (2, 2, "Galatasaray: 1 players"),
+        ]
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_crawl_competition_fields(self, mock_client, sample_clubs_data):
+        """Test the crawl result is projected to the requested fields."""
+        mock_client.aget.return_value = sample_clubs_data
+        mock_client.aiter_many = fake_aiter_many({
+            "clubs/114/players": {"players": [{"id": "1", "name": "Mauro Icardi"}]},
+            "clubs/610/players": {"players": []},
+        })
+
+        result = asyncio.run(
+            crawl_competition("TR1", fields=["clubs.name", "clubs.players.name"])
+        )
+
+        assert result == {"clubs": [
+            {"name": "Galatasaray", "players": [{"name": "Mauro Icardi"}]},
+            {"name": "Fenerbahçe", "players": []},
+        ]}
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_crawl_competition_skips_malformed_items(self, mock_client):
+        """Test clubs and players that are not objects are skipped."""
+        mock_client.aget.return_value = {
+            "clubs": ["114", None, {"id": "610", "name": "Fenerbahçe"}]
+        }
+        mock_client.aiter_many = fake_aiter_many({
+            "clubs/610/players": {"players": [None, {"id": "1", "name": "Dzeko"}]},
+        })
+
+        result = asyncio.run(
+            crawl_competition("TR1", fields=["clubs.id", "clubs.players.name"])
+        )
+
+        assert result == {"clubs": [{"id": "610", "players": [{"name": "Dzeko"}]}]}
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_crawl_competition_progress_reaches_mcp_client(
+        self, mock_client, sample_clubs_data
+    ):
+        """Test progress notifications stream to an MCP client during the crawl."""
+        from fastmcp import Client
+        from transfermarkt_mcp.server import create_mcp_server
+
+        mock_client.aget.return_value = sample_clubs_data
+        mock_client.add_observer = Mock()
+        mock_client.aiter_many = fake_aiter_many({
+            "clubs/114/players": {"players": []},
+            "clubs/610/players": {"players": []},
+        })
+        progress = []
+
+        async def on_progress(value, total, message):
+            progress.append((value, total))
+
+        async def run():
+            async with Client(create_mcp_server()) as mcp_client:
+                return await mcp_client.call_tool(
+                    "crawl_competition", {"competition_id": "TR1"},
+                    progress_handler=on_progress,
+                )
+
+        result = asyncio.run(run())
+
+        assert progress == [(0, 2), (1, 2), (2, 2)]
+        assert len(result.data["clubs"]) == 2
@@ -0,0 +1,221 @@
+"""Tests for the SQLite disk cache and the tiered cache."""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import pytest
+from unittest.mock import patch
+from transfermarkt_mcp.cache import ResponseCache, TieredCache
+from transfermarkt_mcp.disk_cache import SQLiteCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Path of a fresh cache database."""
+    return str(tmp_path / "cache" / "responses.sqlite3")
+
+
+class TestSQLiteCache:
+    """Test cases for SQLiteCache class."""
+
+    def test_set_and_get(self, cache_path, sample_club_data):
+        """Test a stored value round-trips through the database."""
+        cache = SQLiteCache(cache_path)
+        cache.set("clubs/27/profile", "clubs/27/profile", sample_club_data)
+
+        assert cache.get("clubs/27/profile") == sample_club_data
+        assert cache.get("clubs/28/profile") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entries_shared_between_instances(self, cache_path, sample_club_data):
+        """Test a second process opening the file sees earlier writes."""
+        SQLiteCache(cache_path).set(
+            "clubs/27/profile", "clubs/27/profile", sample_club_data
+        )
+
+        assert SQLiteCache(cache_path).get("clubs/27/profile") == sample_club_data
+
+    @patch("transfermarkt_mcp.disk_cache.time.time")
+    def test_entry_expires_after_ttl(self, mock_time, cache_path):
+        """Test entries stop being served once their TTL elapses."""
+        cache = SQLiteCache(cache_path, ttls=[("players/*/stats", 3600)])
+        mock_time.return_value = 1000.0
+        cache.set("players/1/stats", "players/1/stats", {"stats": []})
+
+        mock_time.return_value = 1000.0 + 1800
+        value, remaining, endpoint, validators = cache.lookup("players/1/stats")
+        assert value == {"stats": []}
+        assert remaining == 1800
+        assert (endpoint, validators) == ("players/1/stats", None)
+        mock_time.return_value = 1000.0 + 3600
+        assert cache.get("players/1/stats") is None
+
+    @patch("transfermarkt_mcp.disk_cache.time.time")
+    def test_compact_removes_expired_then_least_recently_used(
+        self, mock_time, cache_path
+    ):
+        """Test compaction drops expired rows before evicting live ones."""
+        cache = SQLiteCache(cache_path, ttls=[("old", 10), ("*", 3600)], max_bytes=100)
+        mock_time.return_value = 0.0
+        cache.set("old", "old", "x" * 20)
+        mock_time.return_value = 1.0
+        cache.set("a", "a", "x" * 30)
+        mock_time.return_value = 2.0
+        cache.set("b", "b", "x" * 30)
+        mock_time.return_value = 3.0
+        cache.set("c", "c", "x" * 30)
+
+        mock_time.return_value = 100.0
+        deleted = cache.compact(target_ratio=0.7)
+
+        assert deleted == 2
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("c") is not None
+
+    @patch("transfermarkt_mcp.disk_cache.time.time")
+    def test_stale_entries_survive_until_stale_ttl(self, mock_time, cache_path):
+        """Test expired rows remain servable stale until compaction may drop them."""
+        cache = SQLiteCache(cache_path, ttls=[("*", 60)], stale_ttl=600)
+        mock_time.return_value = 1000.0
+        cache.set("players/1/stats", "players/1/stats", {"v": 1})
+
+        mock_time.return_value = 1000.0 + 90
+        assert cache.get("players/1/stats") is None
+        assert cache.get_stale("players/1/stats", 60) == ({"v": 1}, 90)
+        assert cache.compact() == 0
+
+        mock_time.return_value = 1000.0 + 700
+        assert cache.get_stale("players/1/stats", 3600) is None
+        assert cache.compact() == 1
+
+    @patch("transfermarkt_mcp.disk_cache.time.time")
+    def test_backdated_entry(self, mock_time, cache_path):
+        """Test an entry stored with an age expires that much sooner."""
+        cache = SQLiteCache(cache_path, ttls=[("*", 60)], stale_ttl=600)
+        mock_time.return_value = 1000.0
+        cache.set("players/1/stats", "players/1/stats", {"v": 1}, age=90)
+
+        assert cache.get("players/1/stats") is None
+        assert cache.get_stale("players/1/stats", 60) == ({"v": 1}, 90)
+
+    def test_validators_round_trip(self, cache_path):
+        """Test ETag/Last-Modified validators are stored with the entry."""
+        cache = SQLiteCache(cache_path)
+        cache.set(
+            "clubs/27/players",
+            "clubs/27/players",
+            {"id": "27"},
+            validators={"etag": '"abc"'},
+        )
+
+        entry = SQLiteCache(cache_path).get_entry("clubs/27/players")
+        assert entry.value == {"id": "27"}
+        assert entry.validators == {"etag": '"abc"'}
+
+    def test_database_without_validators_column_is_migrated(self, cache_path):
+        """Test databases created by older versions gain the validators column."""
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        conn = sqlite3.connect(cache_path)
+        conn.execute(
+            "CREATE TABLE responses (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "stored_at REAL NOT NULL, expires_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        conn.commit()
+        conn.close()
+
+        cache = SQLiteCache(cache_path)
+        cache.set("a", "a", {"a": 1}, validators={"etag": '"x"'})
+        assert cache.get_entry("a").validators == {"etag": '"x"'}
+
+    def test_concurrent_writers(self, cache_path):
+        """Test writes from several threads all land."""
+        cache = SQLiteCache(cache_path)
+
+        def write(n):
+            for i in range(20):
+                cache.set(f"players/{n}-{i}", f"players/{n}-{i}", {"i": i})
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.stats()["entries"] == 80
+
+    def test_clear(self, cache_path):
+        """Test clear empties the database."""
+        cache = SQLiteCache(cache_path)
+        cache.set("a", "a", {"a": 1})
+        cache.clear()
+        assert cache.get("a") is None
+
+
+class TestTieredCache:
+    """Test cases for TieredCache class."""
+
+    def test_disk_hit_is_promoted_to_memory(self, cache_path, sample_club_data):
+        """Test a cold process warms its memory tier from disk."""
+        SQLiteCache(cache_path).set(
+            "clubs/27/profile", "clubs/27/profile", sample_club_data
+        )
+        cache = TieredCache(ResponseCache(), SQLiteCache(cache_path))
+
+        assert cache.get("clubs/27/profile") == sample_club_data
+        assert cache.get("clubs/27/profile") == sample_club_data
+
+        stats = cache.stats()
+        assert stats["disk"]["hits"] == 1
+        assert stats["memory"]["hits"] == 1
+        assert stats["hits"] == 2
+
+    def test_promotion_keeps_endpoint_and_validators(self, cache_path):
+        """Test a promoted entry is stored under its endpoint with its validators."""
+        key = "clubs/27/players?season_id=2023"
+        SQLiteCache(cache_path).set(
+            key, "/clubs/27/players/", {"players": []}, validators={"etag": '"v1"'}
+        )
+        cache = TieredCache(ResponseCache(), SQLiteCache(cache_path))
+
+        with patch.object(cache.memory, "set", wraps=cache.memory.set) as memory_set:
+            assert cache.get(key) == {"players": []}
+        assert memory_set.call_args.args[:2] == (key, "clubs/27/players")
+        assert cache.memory.get_entry(key).validators == {"etag": '"v1"'}
+
+    def test_set_writes_both_tiers(self, cache_path):
+        """Test stores reach memory and disk."""
+        disk = SQLiteCache(cache_path)
+        cache = TieredCache(ResponseCache(), disk)
+        cache.set("players/1/profile", "players/1/profile", {"id": "1"})
+
+        assert cache.memory.get("players/1/profile") == {"id": "1"}
+        assert disk.get("players/1/profile") == {"id": "1"}
+
+    def test_async_methods_use_disk_off_the_loop(self, cache_path):
+        """Test the event loop's calls reach the disk tier from worker threads."""
+        disk = SQLiteCache(cache_path)
+        cache = TieredCache(ResponseCache(), disk)
+        threads = []
+        for name in ("lookup", "set", "get_entry"):
+            method = getattr(disk, name)
+
+            def record(*args, method=method, **kwargs):
+                threads.append(threading.get_ident())
+                return method(*args, **kwargs)
+
+            setattr(disk, name, record)
+
+        async def run():
+            await cache.aset("players/1/profile", "players/1/profile", {"id": "1"})
+            cache.memory.clear()
+            value = await cache.aget("players/1/profile")
+            entry = await cache.aget_entry("players/1/profile")
+            return value, entry.value
+
+        assert asyncio.run(run()) == ({"id": "1"}, {"id": "1"})
+        assert len(threads) == 3
+        assert threading.get_ident() not in threads
@@ -0,0 +1,72 @@
+"""Tests for the JSON backend and raw-body pass-through."""
+
+import pytest
+from unittest.mock import patch
+from transfermarkt_mcp import jsonlib
+from transfermarkt_mcp.cache import estimate_size
+from transfermarkt_mcp.projection import apply_projection
+
+
+class TestBackends:
+    """Test cases for backend selection."""
+
+    def test_auto_prefers_installed_fast_backend(self):
+        """Test "auto" falls through missing backends to the stdlib."""
+        with patch.dict("sys.modules", {"orjson": None, "msgspec": None}):
+            name, loads, dumps = jsonlib.select_backend("auto")
+
+        assert name == "json"
+        assert loads(dumps({"a": "ö"})) == {"a": "ö"}
+
+    def test_explicit_backend_falls_back_to_stdlib(self):
+        """Test a requested backend that is missing degrades to json."""
+        with patch.dict("sys.modules", {"msgspec": None}):
+            assert jsonlib.select_backend("msgspec")[0] == "json"
+
+    def test_malformed_input_raises_value_error(self):
+        """Test decode errors surface as ValueError for the client's handler."""
+        with pytest.raises(ValueError):
+            jsonlib.loads(b"<html>")
+
+    def test_dumps_is_compact_utf8(self, sample_clubs_data):
+        """Test encoded output round-trips and keeps non-ASCII characters."""
+        encoded = jsonlib.dumps(sample_clubs_data)
+
+        assert jsonlib.loads(encoded) == sample_clubs_data
+        assert "Fenerbahçe".encode() in encoded
+        assert b", " not in encoded
+
+
+class TestRawJSON:
+    """Test cases for pass-through of response bytes."""
+
+    def test_decode_body_keeps_raw_bytes(self, sample_player_data):
+        """Test decoded objects remember their body when asked to."""
+        body = jsonlib.dumps(sample_player_data)
+
+        value = jsonlib.decode_body(body, keep_raw=True)
+
+        assert value == sample_player_data
+        assert value.raw is body
+        assert jsonlib.dumps(value) is body
+        assert not isinstance(jsonlib.decode_body(body), jsonlib.RawJSON)
+
+    def test_unprojected_tool_result_is_passed_through(self, sample_player_data):
+        """Test the tool serializer reuses the body unless the result changed."""
+        body = b'{"id": "8198",  "name": "Robert Lewandowski"}'
+        value = jsonlib.decode_body(body, keep_raw=True)
+
+        assert jsonlib.serialize_tool_result(apply_projection(value, None, [])) == (
+            body.decode()
+        )
+        projected = apply_projection(value, ["id"], [])
+        assert jsonlib.serialize_tool_result(projected) == '{"id":"8198"}'
+
+    def test_size_estimate_uses_raw_length(self, sample_player_data):
+        """Test cache sizing does not re-encode responses with a raw body."""
+        body = jsonlib.dumps(sample_player_data)
+        value = jsonlib.decode_body(body, keep_raw=True)
+
+        with patch.object(jsonlib, "_dumps") as mock_dumps:
+            assert estimate_size(value) == 2 * len(body)
+        mock_dumps.assert_not_called()
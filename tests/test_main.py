@@ -0,0 +1,111 @@
+"""Tests for the entry point."""
+
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+from transfermarkt_mcp.main import build_parser, serve_http
+
+# Which heavy modules are loaded after importing the entry point, and after
+# creating the server through the attribute fastmcp run looks up; and
+# whether creating it built the client
+PROBE = """
+import asyncio, json, sys
+import transfermarkt_mcp.main as main
+import transfermarkt_mcp.client as client_module
+imported = sorted(m for m in ("fastmcp", "requests", "numpy") if m in sys.modules)
+tools = len(asyncio.run(main.mcp.get_tools()))
+created = sorted(m for m in ("fastmcp", "requests", "numpy") if m in sys.modules)
+print(json.dumps([imported, tools, created, client_module._client is None]))
+"""
+
+# Which of those modules fastmcp loads on its own (2.14 imports requests)
+FASTMCP_PROBE = """
+import json, sys
+import fastmcp
+print(json.dumps(sorted(m for m in ("requests", "numpy") if m in sys.modules)))
+"""
+
+# Whether building the client, as the snapshot commands do, loads fastmcp
+CLIENT_PROBE = """
+import sys
+import transfermarkt_mcp.metrics
+from transfermarkt_mcp.client import client
+client.cache
+print("fastmcp" in sys.modules)
+"""
+
+
+def test_startup_defers_heavy_imports():
+    """Test importing main builds nothing, nor does creating the server."""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], capture_output=True, text=True, check=True
+    ).stdout
+    imported, tools, created, lazy = json.loads(output.strip().splitlines()[-1])
+    output = subprocess.run(
+        [sys.executable, "-c", FASTMCP_PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    from_fastmcp = json.loads(output.strip().splitlines()[-1])
+
+    assert imported == []
+    assert tools > 0
+    assert sorted(set(created) - set(from_fastmcp)) == ["fastmcp"]
+    assert lazy
+
+
+def test_client_does_not_import_fastmcp():
+    """Test the client and metrics can be used without the MCP framework."""
+    output = subprocess.run(
+        [sys.executable, "-c", CLIENT_PROBE], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip().splitlines()[-1] == "False"
+
+
+@patch.multiple(
+    "transfermarkt_mcp.main.config",
+    transport="stdio",
+    http_stateless=False,
+    rate_limit_shared=False,
+    cache_enabled=True,
+    cache_backend="memory",
+)
+@patch("uvicorn.run")
+def test_workers_share_cache_and_rate_limit(mock_run):
+    """Test several workers get stateless HTTP, the SQLite cache and one budget."""
+    args = build_parser().parse_args(["--transport", "http", "--workers", "4"])
+    environ = {k: v for k, v in os.environ.items() if k != "CACHE_BACKEND"}
+    with patch.dict(os.environ, environ, clear=True):
+        assert serve_http(args) == 0
+        settings = {
+            name: os.environ[name]
+            for name in (
+                "MCP_TRANSPORT",
+                "HTTP_STATELESS",
+                "RATE_LIMIT_SHARED",
+                "CACHE_BACKEND",
+            )
+        }
+
+    assert settings == {
+        "MCP_TRANSPORT": "http",
+        "HTTP_STATELESS": "true",
+        "RATE_LIMIT_SHARED": "true",
+        "CACHE_BACKEND": "sqlite",
+    }
+    assert mock_run.call_args.args == ("transfermarkt_mcp.main:http_app",)
+    assert mock_run.call_args.kwargs["workers"] == 4
+    assert mock_run.call_args.kwargs["factory"] is True
+
+
+@patch("uvicorn.run")
+def test_sse_needs_one_worker(mock_run):
+    """Test SSE, whose sessions live in one process, refuses several workers."""
+    args = build_parser().parse_args(["--transport", "sse", "--workers", "2"])
+
+    assert serve_http(args) == 2
+    mock_run.assert_not_called()
@@ -0,0 +1,164 @@
+"""Tests for Prometheus metrics and the tool metrics middleware."""
+
+import asyncio
+import httpx
+from fastmcp import Client, FastMCP
+from transfermarkt_mcp import metrics
+from transfermarkt_mcp.metrics import Counter, Histogram, Registry, endpoint_template
+from transfermarkt_mcp.server import ToolMetricsMiddleware
+
+
+class TestRegistry:
+    """Test cases for metric types and the text format."""
+
+    def test_counter_samples(self):
+        """Test counters render one sample per label set."""
+        counter = Counter("requests_total", "Requests.", ["endpoint"])
+        counter.inc(endpoint="players/{id}")
+        counter.inc(2, endpoint="players/{id}")
+        counter.inc(endpoint='say "hi"')
+
+        assert counter.value(endpoint="players/{id}") == 3
+        assert counter.samples() == [
+            'requests_total{endpoint="players/{id}"} 3',
+            'requests_total{endpoint="say \\"hi\\""} 1',
+        ]
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test observations land in the first bucket bounding them."""
+        histogram = Histogram("duration_seconds", "Duration.", buckets=[0.1, 1])
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value)
+
+        assert histogram.samples() == [
+            'duration_seconds_bucket{le="0.1"} 2',
+            'duration_seconds_bucket{le="1"} 3',
+            'duration_seconds_bucket{le="+Inf"} 4',
+            "duration_seconds_sum 3.65",
+            "duration_seconds_count 4",
+        ]
+
+    def test_render_with_stats(self):
+        """Test stats are exported as counters or gauges, skipping failures."""
+        registry = Registry()
+        registry.counter("calls_total", "Calls.").inc()
+        registry.add_stats(
+            "cache",
+            "Cache stats.",
+            lambda: {"hits": 3, "memory": {"size": 2, "hits": 1}},
+            counters=["hits"],
+        )
+        registry.add_stats("broken", "Broken.", lambda: 1 / 0)
+
+        assert registry.render() == (
+            "# HELP calls_total Calls.\n"
+            "# TYPE calls_total counter\n"
+            "calls_total 1\n"
+            "# HELP cache_hits_total Cache stats.\n"
+            "# TYPE cache_hits_total counter\n"
+            "cache_hits_total 3\n"
+            "# HELP cache_memory_size Cache stats.\n"
+            "# TYPE cache_memory_size gauge\n"
+            "cache_memory_size 2\n"
+            "# HELP cache_memory_hits_total Cache stats.\n"
+            "# TYPE cache_memory_hits_total counter\n"
+            "cache_memory_hits_total 1\n"
+        )
+
+    def test_endpoint_template(self):
+        """Test IDs and search queries are replaced."""
+        assert endpoint_template("players/8198/stats") == "players/{id}/stats"
+        assert endpoint_template("/clubs/27/players") == "clubs/{id}/players"
+        assert endpoint_template("players/search/Messi") == "players/search/{query}"
+        assert endpoint_template("competitions/GB1") == "competitions/{id}"
+
+
+class TestToolMetricsMiddleware:
+    """Test cases for the tool call middleware."""
+
+    def test_outcomes(self):
+        """Test calls are timed by outcome and result bytes counted."""
+        mcp = FastMCP("test")
+        mcp.add_middleware(ToolMetricsMiddleware())
+
+        @mcp.tool
+        async def metrics_ok() -> dict:
+            return {"id": "8198"}
+
+        @mcp.tool
+        async def metrics_error() -> dict:
+            return {"error": "Player ID cannot be empty"}
+
+        @mcp.tool
+        async def metrics_raises() -> dict:
+            raise RuntimeError("boom")
+
+        async def run():
+            async with Client(mcp) as client:
+                for name in ("metrics_ok", "metrics_error", "metrics_raises"):
+                    await client.call_tool(name, {}, raise_on_error=False)
+
+        asyncio.run(run())
+
+        duration = metrics.TOOL_DURATION
+        assert duration.count(tool="metrics_ok", outcome="ok") == 1
+        assert duration.count(tool="metrics_error", outcome="error") == 1
+        assert duration.count(tool="metrics_raises", outcome="exception") == 1
+        assert metrics.TOOL_RESULT_BYTES.value(tool="metrics_ok") == len(
+            '{"id":"8198"}'
+        )
+
+
+class TestUpstreamMetrics:
+    """Test cases for upstream request recording in the client."""
+
+    def test_success_and_retries(self, make_client):
+        """Test requests are recorded by endpoint template and status."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"id": "1"})
+
+        client = make_client(handler)
+        client._backoff_time = lambda attempt: 0.0
+        endpoint = "injuries/{id}"
+        before = metrics.UPSTREAM_RETRIES.value(endpoint=endpoint)
+
+        asyncio.run(client.aget("injuries/1"))
+
+        assert metrics.UPSTREAM_DURATION.count(endpoint=endpoint, status="200") >= 1
+        assert metrics.UPSTREAM_RETRIES.value(endpoint=endpoint) == before + 1
+        assert metrics.UPSTREAM_BYTES.value(endpoint=endpoint) >= len('{"id":"1"}')
+
+    def test_errors_by_type(self, make_client):
+        """Test failed requests count an error of their type."""
+
+        def handler(request):
+            if request.url.path.endswith("/down"):
+                raise httpx.ConnectError("refused")
+            return httpx.Response(404)
+
+        client = make_client(handler)
+        client._backoff_time = lambda attempt: 0.0
+        errors = metrics.UPSTREAM_ERRORS
+        before = (
+            errors.value(endpoint="outages/{id}/down", type="connection"),
+            errors.value(endpoint="outages/{id}", type="http"),
+        )
+
+        asyncio.run(client.aget("outages/1/down"))
+        asyncio.run(client.aget("outages/2"))
+
+        assert errors.value(endpoint="outages/{id}/down", type="connection") == (
+            before[0] + 1
+        )
+        assert errors.value(endpoint="outages/{id}", type="http") == before[1] + 1
+        assert (
+            metrics.UPSTREAM_DURATION.count(
+                endpoint="outages/{id}/down", status="connection"
+            )
+            >= 1
+        )
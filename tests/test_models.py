@@ -0,0 +1,90 @@
+"""Tests for the typed response models."""
+
+import pytest
+from transfermarkt_mcp.models import (
+    MISSING,
+    ClubSquad,
+    Competition,
+    ModelValidationError,
+    PlayerProfile,
+    TransferHistory,
+    compact,
+    expand,
+    model_for,
+)
+
+
+class TestModels:
+    """Test cases for building and rebuilding models."""
+
+    def test_round_trip_keeps_unknown_and_absent_keys(self):
+        """Test to_dict rebuilds the original object exactly."""
+        data = {
+            "id": "8198",
+            "name": "Robert Lewandowski",
+            "position": {"main": "Centre-Forward", "other": []},
+            "shirtNumber": None,
+            "newField": [1, 2],
+        }
+        profile = PlayerProfile.from_dict(data)
+
+        assert profile.name == "Robert Lewandowski"
+        assert profile.shirt_number is None
+        assert profile.foot is MISSING
+        assert profile.get("foot") is None
+        assert profile.extra == {"newField": [1, 2]}
+        assert profile.to_dict() == data
+
+    def test_nested_models(self):
+        """Test lists of entries and nested club references are typed."""
+        data = {
+            "id": "8198",
+            "transfers": [
+                {
+                    "clubFrom": {"id": "16", "name": "Dortmund"},
+                    "clubTo": {"id": "27", "name": "Bayern"},
+                    "fee": "free",
+                },
+            ],
+        }
+        history = TransferHistory.from_dict(data)
+
+        assert history.transfers[0].club_to.name == "Bayern"
+        assert history.to_dict() == data
+
+    def test_missing_required_field(self):
+        """Test a missing id is reported with its path."""
+        with pytest.raises(ModelValidationError) as exc:
+            PlayerProfile.from_dict({"name": "Robert Lewandowski"})
+        assert exc.value.path == "PlayerProfile.id"
+
+    def test_wrong_shape_names_the_path(self):
+        """Test shape errors point at the offending field."""
+        with pytest.raises(ModelValidationError) as exc:
+            Competition.from_dict({"clubs": [{"id": "27"}, {"id": {"x": 1}}]})
+        assert exc.value.path == "Competition.clubs[1].id"
+
+        with pytest.raises(ModelValidationError) as exc:
+            ClubSquad.from_dict({"players": {"id": "8198"}})
+        assert "expected an array" in str(exc.value)
+
+    def test_from_json(self):
+        """Test models decode straight from response bytes."""
+        squad = ClubSquad.from_json(b'{"id": "27", "players": [{"id": "8198"}]}')
+        assert squad.players[0].id == "8198"
+
+        with pytest.raises(ModelValidationError, match="invalid JSON"):
+            ClubSquad.from_json(b"{")
+
+    def test_model_for_endpoint(self):
+        """Test endpoints map to their models."""
+        assert model_for("/clubs/27/players/") is ClubSquad
+        assert model_for("players/8198/profile") is PlayerProfile
+        assert model_for("players/8198/stats") is None
+
+    def test_compact_and_expand(self):
+        """Test compact falls back to the dict when validation fails."""
+        assert isinstance(compact("clubs/27/players", {"players": []}), ClubSquad)
+        invalid = {"players": 1}
+        assert compact("clubs/27/players", invalid) is invalid
+        assert expand(compact("clubs/27/players", {"id": "27"})) == {"id": "27"}
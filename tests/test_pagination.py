@@ -0,0 +1,151 @@
+"""Tests for multi-page search fetching."""
+
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock
+from transfermarkt_mcp.tools.pagination import fetch_search_pages
+from transfermarkt_mcp.tools.players import search_players
+from transfermarkt_mcp.tools.clubs import search_clubs
+from transfermarkt_mcp.tools.competitions import search_competitions
+
+
+def search_page(page, last_page=4, size=2):
+    """Build one upstream search page."""
+    return {
+        "query": "Silva",
+        "pageNumber": page,
+        "lastPageNumber": last_page,
+        "results": [{"id": f"{page}-{i}"} for i in range(size)],
+    }
+
+
+def fake_aiter_many(pages, order=None):
+    """Build an aiter_many stand-in yielding pages in a chosen order."""
+    requested = []
+
+    async def aiter_many(calls, concurrency=None):
+        requested.extend(calls)
+        for index in (order if order is not None else range(len(calls))):
+            yield index, pages[calls[index][1]["page_number"]]
+
+    aiter_many.requested = requested
+    return aiter_many
+
+
+class TestFetchSearchPages:
+    """Test cases for fetch_search_pages function."""
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_fetches_only_pages_needed_for_cap(self, mock_client):
+        """Test the page size from page one bounds the prefetch."""
+        mock_client.aget.return_value = search_page(1)
+        mock_client.aiter_many = fake_aiter_many(
+            {page: search_page(page) for page in range(2, 5)}
+        )
+
+        result = asyncio.run(fetch_search_pages("players/search/Silva", 1, 5))
+
+        assert mock_client.aiter_many.requested == [
+            ("players/search/Silva", {"page_number": 2}),
+            ("players/search/Silva", {"page_number": 3}),
+        ]
+        assert [r["id"] for r in result["results"]] == [
+            "1-0",
+            "1-1",
+            "2-0",
+            "2-1",
+            "3-0",
+        ]
+        assert result["pagesFetched"] == [1, 2, 3]
+        assert result["query"] == "Silva"
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_out_of_order_pages_are_merged_in_page_order(self, mock_client):
+        """Test results keep page order whatever order pages arrive in."""
+        mock_client.aget.return_value = search_page(1)
+        mock_client.aiter_many = fake_aiter_many(
+            {page: search_page(page) for page in range(2, 5)}, order=[2, 0, 1]
+        )
+        ctx = AsyncMock()
+
+        result = asyncio.run(fetch_search_pages("players/search/Silva", 1, 100, ctx))
+
+        assert result["pagesFetched"] == [1, 2, 3, 4]
+        assert [r["id"] for r in result["results"]][::2] == ["1-0", "2-0", "3-0", "4-0"]
+        assert [c.args[:2] for c in ctx.report_progress.await_args_list] == [
+            (1, 4),
+            (2, 4),
+            (3, 4),
+            (4, 4),
+        ]
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_page_errors_are_reported(self, mock_client):
+        """Test a failed page is skipped and listed in errors."""
+        mock_client.aget.return_value = search_page(1, last_page=3)
+        mock_client.aiter_many = fake_aiter_many(
+            {
+                2: {"error": "HTTP error 502: Bad Gateway"},
+                3: search_page(3, last_page=3),
+            }
+        )
+
+        result = asyncio.run(fetch_search_pages("clubs/search/Silva", 1, 100))
+
+        assert result["pagesFetched"] == [1, 3]
+        assert result["errors"] == [{"page": 2, "error": "HTTP error 502: Bad Gateway"}]
+        assert len(result["results"]) == 4
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_single_page_result(self, mock_client):
+        """Test no prefetch happens when the first page is the last."""
+        mock_client.aget.return_value = search_page(1, last_page=1)
+        mock_client.aiter_many = fake_aiter_many({})
+
+        result = asyncio.run(fetch_search_pages("clubs/search/Silva", 1, 10))
+
+        assert mock_client.aiter_many.requested == []
+        assert result["pagesFetched"] == [1]
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_first_page_error(self, mock_client):
+        """Test a failed first page is returned as-is."""
+        mock_client.aget.return_value = {"error": "API unavailable"}
+
+        result = asyncio.run(fetch_search_pages("clubs/search/Silva", 1, 10))
+
+        assert result == {"error": "API unavailable"}
+
+
+class TestSearchMaxResults:
+    """Test cases for the max_results option of the search tools."""
+
+    @pytest.mark.parametrize(
+        "search", [search_players, search_clubs, search_competitions]
+    )
+    @pytest.mark.parametrize("max_results", [0, 501])
+    def test_max_results_out_of_range(self, search, max_results):
+        """Test the result cap is validated."""
+        result = asyncio.run(search("Silva", max_results=max_results))
+        assert "error" in result
+        assert "Max results" in result["error"]
+
+    @pytest.mark.parametrize(
+        "search, endpoint",
+        [
+            (search_players, "players/search/Silva"),
+            (search_clubs, "clubs/search/Silva"),
+            (search_competitions, "competitions/search/Silva"),
+        ],
+    )
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_max_results_uses_multi_page_fetch(self, mock_client, search, endpoint):
+        """Test each search tool prefetches pages when a cap is given."""
+        mock_client.aget.return_value = search_page(2)
+        mock_client.aiter_many = fake_aiter_many({3: search_page(3)})
+
+        result = asyncio.run(search("Silva", page_number=2, max_results=3))
+
+        mock_client.aget.assert_called_once_with(endpoint, params={"page_number": 2})
+        assert result["pagesFetched"] == [2, 3]
+        assert len(result["results"]) == 3
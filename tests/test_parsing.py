@@ -0,0 +1,115 @@
+"""Tests for upstream value parsing helpers."""
+
+from datetime import date
+
+import pytest
+from transfermarkt_mcp.parsing import (
+    parse_date,
+    parse_int,
+    parse_money,
+    season_start_year,
+)
+
+
+class TestParseMoney:
+    """Test cases for parse_money function."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (45000000, 45e6),
+            ("€45.00m", 45e6),
+            ("€500k", 500e3),
+            ("€1.20bn", 1.2e9),
+            ("€750Th.", 750e3),
+            ("Loan fee: €2.50m", 2.5e6),
+            ("€1,500,000", 1.5e6),
+            ("€1.500.000", 1.5e6),
+            ("€1,500", 1500),
+            ("€1,5m", 1.5e6),
+            ("€1,250,000.50", 1250000.5),
+            ("€1.250.000,50", 1250000.5),
+        ],
+    )
+    def test_parse_money_values(self, value, expected):
+        """Test numeric and formatted amounts."""
+        assert parse_money(value) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        "value", [None, "-", "?", "free transfer", True, "€1,50,000"]
+    )
+    def test_parse_money_missing(self, value):
+        """Test missing or non-numeric amounts."""
+        assert parse_money(value) is None
+
+
+class TestParseInt:
+    """Test cases for parse_int function."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (12, 12),
+            ("12", 12),
+            ("1.234", 1234),
+            ("1,234", 1234),
+            ("2.500'", 2500),
+            ("90'", 90),
+            (3.0, 3),
+        ],
+    )
+    def test_parse_int_values(self, value, expected):
+        """Test counts in the formats the API uses."""
+        assert parse_int(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "-", "", "12.5", "1.5", 2.5])
+    def test_parse_int_missing(self, value):
+        """Test missing and fractional counts."""
+        assert parse_int(value) is None
+
+
+class TestSeasonStartYear:
+    """Test cases for season_start_year function."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2023", 2023),
+            (2023, 2023),
+            ("23/24", 2023),
+            ("2023/24", 2023),
+            ("99/00", 1999),
+        ],
+    )
+    def test_season_formats(self, value, expected):
+        """Test the season formats used by the API."""
+        assert season_start_year(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "", "current"])
+    def test_invalid_season(self, value):
+        """Test unparseable seasons."""
+        assert season_start_year(value) is None
+
+
+class TestParseDate:
+    """Test cases for parse_date function."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2023-12-19",
+            "2023-12-19T10:00:00",
+            "Dec 19, 2023",
+            "19.12.2023",
+            "19/12/2023",
+            date(2023, 12, 19),
+        ],
+    )
+    def test_date_formats(self, value):
+        """Test the date formats used by the API."""
+        assert parse_date(value) == date(2023, 12, 19)
+
+    @pytest.mark.parametrize("value", [None, "", "-", "2023-13-40"])
+    def test_invalid_date(self, value):
+        """Test unparseable dates."""
+        assert parse_date(value) is None
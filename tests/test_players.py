@@ -1,11 +1,12 @@
 """Tests for player-related tools."""
 
+import asyncio
 import pytest
-from unittest.mock import patch
+from unittest.mock import patch, AsyncMock
 from transfermarkt_mcp.tools.players import (
     search_players, get_player_by_id, get_player_profile, get_player_market_value,
     get_player_transfers, get_player_jersey_numbers, get_player_stats,
-    get_player_injuries, get_player_achievements
+    get_player_injuries, get_player_achievements, get_players_batch
 )
 
 
@@ -14,35 +15,35 @@ class TestSearchPlayers:
 
     def test_search_players_empty_name(self):
         """Test search with empty player name."""
-        result = search_players("")
+        result = asyncio.run(search_players(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
     def test_search_players_invalid_page(self):
         """Test search with invalid page number."""
-        result = search_players("Messi", page_number=0)
+        result = asyncio.run(search_players("Messi", page_number=0))
         assert "error" in result
         assert "must be positive" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_search_players_success(self, mock_client, sample_player_data):
         """Test successful player search."""
-        mock_client.get.return_value = {"players": [sample_player_data]}
+        mock_client.aget.return_value = {"players": [sample_player_data]}
 
-        result = search_players("Messi", page_number=1)
+        result = asyncio.run(search_players("Messi", page_number=1))
 
-        mock_client.get.assert_called_once_with(
+        mock_client.aget.assert_called_once_with(
             "players/search/Messi",
             params={"page_number": 1}
         )
         assert "players" in result
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_search_players_api_error(self, mock_client):
         """Test search with API error."""
-        mock_client.get.return_value = {"error": "API unavailable"}
+        mock_client.aget.return_value = {"error": "API unavailable"}
 
-        result = search_players("Messi")
+        result = asyncio.run(search_players("Messi"))
 
         assert "error" in result
         assert result["error"] == "API unavailable"
@@ -53,26 +54,26 @@ class TestGetPlayerById:
 
     def test_get_player_by_id_empty_id(self):
         """Test getting player with empty ID."""
-        result = get_player_by_id("")
+        result = asyncio.run(get_player_by_id(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_player_by_id_success(self, mock_client, sample_player_data):
         """Test successful player retrieval by ID."""
-        mock_client.get.return_value = sample_player_data
+        mock_client.aget.return_value = sample_player_data
 
-        result = get_player_by_id("8198")
+        result = asyncio.run(get_player_by_id("8198"))
 
-        mock_client.get.assert_called_once_with("players/8198")
+        mock_client.aget.assert_called_once_with("players/8198")
         assert result == sample_player_data
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_player_by_id_not_found(self, mock_client):
         """Test player not found."""
-        mock_client.get.return_value = {"error": "Player not found"}
+        mock_client.aget.return_value = {"error": "Player not found"}
 
-        result = get_player_by_id("999999")
+        result = asyncio.run(get_player_by_id("999999"))
 
         assert "error" in result
         assert result["error"] == "Player not found"
@@ -83,18 +84,18 @@ class TestGetPlayerProfile:
 
     def test_get_player_profile_empty_id(self):
         """Test getting profile with empty player ID."""
-        result = get_player_profile("")
+        result = asyncio.run(get_player_profile(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_player_profile_success(self, mock_client, sample_player_data):
         """Test successful player profile retrieval."""
-        mock_client.get.return_value = sample_player_data
+        mock_client.aget.return_value = sample_player_data
 
-        result = get_player_profile("8198")
+        result = asyncio.run(get_player_profile("8198"))
 
-        mock_client.get.assert_called_once_with("players/8198/profile")
+        mock_client.aget.assert_called_once_with("players/8198/profile")
         assert result == sample_player_data
 
 
@@ -103,19 +104,19 @@ class TestGetPlayerMarketValue:
 
     def test_get_player_market_value_empty_id(self):
         """Test getting market value with empty player ID."""
-        result = get_player_market_value("")
+        result = asyncio.run(get_player_market_value(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_player_market_value_success(self, mock_client):
         """Test successful player market value retrieval."""
         market_value_data = {"market_value": "€45.00m", "history": []}
-        mock_client.get.return_value = market_value_data
+        mock_client.aget.return_value = market_value_data
 
-        result = get_player_market_value("8198")
+        result = asyncio.run(get_player_market_value("8198"))
 
-        mock_client.get.assert_called_once_with("players/8198/market_value")
+        mock_client.aget.assert_called_once_with("players/8198/market_value")
         assert result == market_value_data
 
 
@@ -124,40 +125,73 @@ class TestGetPlayerTransfers:
 
     def test_get_player_transfers_empty_id(self):
         """Test getting transfers with empty player ID."""
-        result = get_player_transfers("")
+        result = asyncio.run(get_player_transfers(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_player_transfers_success(self, mock_client):
         """Test successful player transfers retrieval."""
         transfers_data = {"transfers": []}
-        mock_client.get.return_value = transfers_data
+        mock_client.aget.return_value = transfers_data
 
-        result = get_player_transfers("8198")
+        result = asyncio.run(get_player_transfers("8198"))
 
-        mock_client.get.assert_called_once_with("players/8198/transfers")
+        mock_client.aget.assert_called_once_with("players/8198/transfers")
         assert result == transfers_data
 
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_get_player_transfers_with_fields(self, mock_client):
+        """Test player transfers projected to the requested fields."""
+        mock_client.aget.return_value = {
+            "id": "8198",
+            "transfers": [{"date": "2022-07-19", "fee": "€45.00m",
+                           "clubTo": {"id": "131", "name": "FC Barcelona"}}],
+            "youthClubs": ["Varsovia Warszawa"],
+        }
+
+        result = asyncio.run(
+            get_player_transfers("8198", fields=["transfers.clubTo.name"])
+        )
+
+        assert result == {"transfers": [{"clubTo": {"name": "FC Barcelona"}}]}
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_get_player_transfers_compact(self, mock_client):
+        """Test the compact projection of player transfers."""
+        mock_client.aget.return_value = {
+            "id": "8198",
+            "transfers": [{"date": "2022-07-19", "upcoming": False,
+                           "clubTo": {"id": "131", "name": "FC Barcelona"}}],
+            "youthClubs": ["Varsovia Warszawa"],
+        }
+
+        result = asyncio.run(get_player_transfers("8198", fields=["@compact"]))
+
+        assert result == {
+            "id": "8198",
+            "transfers": [{"date": "2022-07-19", "clubTo": {"name": "FC Barcelona"}}],
+        }
+
 
 class TestGetPlayerJerseyNumbers:
     """Test cases for get_player_jersey_numbers function."""
 
     def test_get_player_jersey_numbers_empty_id(self):
         """Test getting jersey numbers with empty player ID."""
-        result = get_player_jersey_numbers("")
+        result = asyncio.run(get_player_jersey_numbers(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_player_jersey_numbers_success(self, mock_client):
         """Test successful player jersey numbers retrieval."""
         jersey_data = {"jersey_numbers": []}
-        mock_client.get.return_value = jersey_data
+        mock_client.aget.return_value = jersey_data
 
-        result = get_player_jersey_numbers("8198")
+        result = asyncio.run(get_player_jersey_numbers("8198"))
 
-        mock_client.get.assert_called_once_with("players/8198/jersey_numbers")
+        mock_client.aget.assert_called_once_with("players/8198/jersey_numbers")
         assert result == jersey_data
 
 
@@ -166,30 +200,32 @@ class TestGetPlayerStats:
 
     def test_get_player_stats_empty_id(self):
         """Test getting stats with empty player ID."""
-        result = get_player_stats("")
+        result = asyncio.run(get_player_stats(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_player_stats_success(self, mock_client):
         """Test successful player stats retrieval."""
         stats_data = {"stats": []}
-        mock_client.get.return_value = stats_data
+        mock_client.aget.return_value = stats_data
 
-        result = get_player_stats("8198")
+        result = asyncio.run(get_player_stats("8198"))
 
-        mock_client.get.assert_called_once_with("players/8198/stats", params={})
+        mock_client.aget.assert_called_once_with("players/8198/stats", params={})
         assert result == stats_data
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_player_stats_with_season(self, mock_client):
         """Test player stats retrieval with season filter."""
         stats_data = {"stats": []}
-        mock_client.get.return_value = stats_data
+        mock_client.aget.return_value = stats_data
 
-        result = get_player_stats("8198", season="2023")
+        result = asyncio.run(get_player_stats("8198", season="2023"))
 
-        mock_client.get.assert_called_once_with("players/8198/stats", params={"season": "2023"})
+        mock_client.aget.assert_called_once_with(
+            "players/8198/stats", params={"season": "2023"}
+        )
         assert result == stats_data
 
 
@@ -198,19 +234,19 @@ class TestGetPlayerInjuries:
 
     def test_get_player_injuries_empty_id(self):
         """Test getting injuries with empty player ID."""
-        result = get_player_injuries("")
+        result = asyncio.run(get_player_injuries(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_player_injuries_success(self, mock_client):
         """Test successful player injuries retrieval."""
         injuries_data = {"injuries": []}
-        mock_client.get.return_value = injuries_data
+        mock_client.aget.return_value = injuries_data
 
-        result = get_player_injuries("8198")
+        result = asyncio.run(get_player_injuries("8198"))
 
-        mock_client.get.assert_called_once_with("players/8198/injuries")
+        mock_client.aget.assert_called_once_with("players/8198/injuries")
         assert result == injuries_data
 
 
@@ -219,17 +255,108 @@ class TestGetPlayerAchievements:
 
     def test_get_player_achievements_empty_id(self):
         """Test getting achievements with empty player ID."""
-        result = get_player_achievements("")
+        result = asyncio.run(get_player_achievements(""))
         assert "error" in result
         assert "cannot be empty" in result["error"]
 
-    @patch('transfermarkt_mcp.client.client')
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
     def test_get_player_achievements_success(self, mock_client):
         """Test successful player achievements retrieval."""
         achievements_data = {"achievements": []}
-        mock_client.get.return_value = achievements_data
+        mock_client.aget.return_value = achievements_data
 
-        result = get_player_achievements("8198")
+        result = asyncio.run(get_player_achievements("8198"))
 
-        mock_client.get.assert_called_once_with("players/8198/achievements")
+        mock_client.aget.assert_called_once_with("players/8198/achievements")
         assert result == achievements_data
+
+
+class TestGetPlayersBatch:
+    """Test cases for get_players_batch function."""
+
+    def test_get_players_batch_empty_ids(self):
+        """Test batch with no player IDs."""
+        result = asyncio.run(get_players_batch([]))
+        assert "error" in result
+        assert "cannot be empty" in result["error"]
+
+    def test_get_players_batch_blank_id(self):
+        """Test batch containing a blank player ID."""
+        result = asyncio.run(get_players_batch(["8198", " "]))
+        assert "error" in result
+        assert "cannot be empty" in result["error"]
+
+    def test_get_players_batch_too_many_ids(self):
+        """Test batch above the player limit."""
+        result = asyncio.run(get_players_batch([str(i) for i in range(51)]))
+        assert "error" in result
+        assert "At most 50" in result["error"]
+
+    def test_get_players_batch_unknown_facet(self):
+        """Test batch with an unsupported facet."""
+        result = asyncio.run(get_players_batch(["8198"], facets=["profile", "salary"]))
+        assert "error" in result
+        assert "salary" in result["error"]
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_get_players_batch_success(self, mock_client, sample_player_data):
+        """Test results are keyed by player and facet with per-item errors."""
+        mock_client.aget_many.return_value = [
+            sample_player_data,
+            {"error": "HTTP error 404: Not Found"},
+            {"id": "28003"},
+            {"stats": []},
+        ]
+
+        result = asyncio.run(get_players_batch(
+            ["8198", "28003", "8198"], facets=["profile", "stats"], season="2023"
+        ))
+
+        mock_client.aget_many.assert_called_once_with([
+            ("players/8198/profile", None),
+            ("players/8198/stats", {"season": "2023"}),
+            ("players/28003/profile", None),
+            ("players/28003/stats", {"season": "2023"}),
+        ])
+        assert result["players"]["8198"]["profile"] == sample_player_data
+        assert result["players"]["8198"]["stats"] == {
+            "error": "HTTP error 404: Not Found"
+        }
+        assert result["players"]["28003"] == {
+            "profile": {"id": "28003"}, "stats": {"stats": []}
+        }
+        assert result["errors"] == 1
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_get_players_batch_with_fields(self, mock_client, sample_player_data):
+        """Test batch fields are addressed per facet and keep errors."""
+        mock_client.aget_many.return_value = [
+            sample_player_data,
+            {"stats": [{"goals": 19, "assists": 8}]},
+            {"error": "HTTP error 404: Not Found"},
+        ]
+
+        result = asyncio.run(get_players_batch(
+            ["8198"], facets=["profile", "stats", "injuries"],
+            fields=["profile.name", "stats.stats.goals"],
+        ))
+
+        assert result["players"]["8198"] == {
+            "profile": {"name": "Robert Lewandowski"},
+            "stats": {"stats": [{"goals": 19}]},
+            "injuries": {"error": "HTTP error 404: Not Found"},
+        }
+
+    @patch('transfermarkt_mcp.client.client', new_callable=AsyncMock)
+    def test_get_players_batch_default_facets(self, mock_client):
+        """Test the default facets cover a scouting summary."""
+        mock_client.aget_many.return_value = [{}] * 5
+
+        result = asyncio.run(get_players_batch(["8198"]))
+
+        endpoints = [call[0] for call in mock_client.aget_many.call_args.args[0]]
+        assert endpoints == [
+            "players/8198/profile", "players/8198/market_value",
+            "players/8198/transfers", "players/8198/stats", "players/8198/injuries",
+        ]
+        assert result["errors"] == 0
@@ -0,0 +1,127 @@
+"""Tests for speculative prefetching."""
+
+import asyncio
+import httpx
+from transfermarkt_mcp.prefetch import Prefetcher, follow_ups
+
+SEARCH = {"results": [{"id": "8198", "name": "Robert Lewandowski"}, {"id": "1"}]}
+
+
+def serve(paths):
+    """Mock upstream that records request paths and answers every one."""
+
+    def handler(request):
+        paths.append(request.url.path)
+        if "/search/" in request.url.path:
+            return httpx.Response(200, json=SEARCH)
+        return httpx.Response(200, json={"id": request.url.path.split("/")[2]})
+
+    return handler
+
+
+class TestFollowUps:
+    """Test cases for follow_ups function."""
+
+    def test_search_follow_ups_use_top_results(self):
+        """Test a search leads to its top results' profile and history."""
+        assert follow_ups("players/search/Lewandowski", SEARCH) == [
+            "players/8198/profile",
+            "players/8198/market_value",
+            "players/8198/transfers",
+        ]
+        assert len(follow_ups("players/search/x", SEARCH, top_results=2)) == 6
+
+    def test_profile_and_unknown_endpoints(self):
+        """Test profiles use their own ID and other endpoints have none."""
+        assert follow_ups("/clubs/27/profile", {}) == ["clubs/27/players"]
+        assert follow_ups("players/8198/stats", {"id": "8198"}) == []
+        assert follow_ups("clubs/search/x", {"error": "boom"}) == []
+
+
+class TestPrefetcher:
+    """Test cases for Prefetcher class."""
+
+    def test_search_warms_follow_ups(self, make_client):
+        """Test follow-ups are fetched in the background and served cached."""
+        paths = []
+        client = make_client(serve(paths))
+        prefetcher = Prefetcher(client, budget=600, concurrency=4)
+        client.add_observer(prefetcher.observe)
+
+        async def chain():
+            await client.aget("players/search/Lewandowski")
+            await prefetcher.wait()
+            return await client.aget("players/8198/profile")
+
+        assert asyncio.run(chain()) == {"id": "8198"}
+        assert sorted(paths) == [
+            "/players/8198/market_value",
+            "/players/8198/profile",
+            "/players/8198/transfers",
+            "/players/search/Lewandowski",
+        ]
+        assert prefetcher.stats()["fetched"] == 3
+        assert client.cache.stats()["hits"] == 1
+
+    def test_budget_and_concurrency_limit_prefetches(self, make_client):
+        """Test prefetches beyond the budget or in-flight cap are dropped."""
+        paths = []
+        client = make_client(serve(paths))
+        prefetcher = Prefetcher(client, budget=6, concurrency=4)
+        client.add_observer(prefetcher.observe)
+
+        async def run():
+            await client.aget("players/search/Lewandowski")
+            await prefetcher.wait()
+
+        asyncio.run(run())
+
+        assert prefetcher.stats()["fetched"] == 1
+        assert prefetcher.stats()["over_budget"] == 2
+        assert len(paths) == 2
+
+    def test_skips_cached_and_busy_upstream(self, make_client):
+        """Test nothing is prefetched when cached or when foreground is busy."""
+        paths = []
+        client = make_client(serve(paths))
+        prefetcher = Prefetcher(client, budget=600)
+        client.cache.set("clubs/27/players", "clubs/27/players", {"players": []})
+
+        async def run():
+            prefetcher.observe("clubs/27/profile", {"id": "27"})
+            client.concurrency.in_flight = client.concurrency.stats()["limit"]
+            prefetcher.observe("clubs/28/profile", {"id": "28"})
+            client.concurrency.in_flight = 0
+            await prefetcher.wait()
+
+        asyncio.run(run())
+
+        assert paths == []
+        assert prefetcher.stats()["cached"] == 1
+        assert prefetcher.stats()["busy"] == 1
+
+    def test_prefetched_responses_do_not_chain(self, make_client):
+        """Test a prefetched profile does not prefetch its own follow-ups."""
+        paths = []
+        client = make_client(serve(paths))
+        prefetcher = Prefetcher(client, budget=600, concurrency=4)
+        client.add_observer(prefetcher.observe)
+
+        async def run():
+            await client.aget("clubs/search/Bayern")
+            await prefetcher.wait()
+
+        asyncio.run(run())
+
+        # clubs/8198/profile would otherwise queue clubs/8198/players again
+        assert sorted(paths) == [
+            "/clubs/8198/players",
+            "/clubs/8198/profile",
+            "/clubs/search/Bayern",
+        ]
+
+    def test_blocking_path_does_not_prefetch(self, make_client):
+        """Test responses seen outside an event loop are ignored."""
+        prefetcher = Prefetcher(make_client(serve([])), budget=600)
+        prefetcher.observe("players/search/x", SEARCH)
+        assert prefetcher.stats()["fetched"] == 0
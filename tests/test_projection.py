@@ -0,0 +1,124 @@
+"""Tests for server-side field projection."""
+
+import pytest
+from unittest.mock import patch
+from transfermarkt_mcp.projection import apply_projection, compile_fields, project
+
+
+@pytest.fixture
+def transfers_data():
+    """Sample transfer history in the upstream shape."""
+    return {
+        "id": "8198",
+        "updatedAt": "2024-01-01T00:00:00",
+        "transfers": [
+            {
+                "date": "2022-07-19",
+                "clubFrom": {"id": "27", "name": "Bayern Munich"},
+                "clubTo": {"id": "131", "name": "FC Barcelona"},
+                "fee": "€45.00m",
+            },
+            {
+                "date": "2014-07-01",
+                "clubFrom": {"id": "16", "name": "Borussia Dortmund"},
+                "clubTo": {"id": "27", "name": "Bayern Munich"},
+                "fee": "free transfer",
+            },
+        ],
+    }
+
+
+class TestCompileFields:
+    """Test cases for compile_fields function."""
+
+    def test_shorter_path_wins(self):
+        """Test a parent path keeps its whole subtree regardless of order."""
+        assert compile_fields(["a.b", "a"]) == {"a": True}
+        assert compile_fields(["a", "a.b"]) == {"a": True}
+
+    def test_blank_segments_are_ignored(self):
+        """Test stray dots and blank paths are tolerated."""
+        assert compile_fields(["", " a..b "]) == {"a": {"b": True}}
+
+
+class TestProject:
+    """Test cases for project function."""
+
+    def test_top_level_fields(self, transfers_data):
+        """Test selecting top-level keys."""
+        assert project(transfers_data, ["id"]) == {"id": "8198"}
+
+    def test_paths_step_into_lists(self, transfers_data):
+        """Test nested paths apply to every list item."""
+        result = project(transfers_data, ["transfers.clubTo.name", "transfers.fee"])
+        assert result == {
+            "transfers": [
+                {"clubTo": {"name": "FC Barcelona"}, "fee": "€45.00m"},
+                {"clubTo": {"name": "Bayern Munich"}, "fee": "free transfer"},
+            ]
+        }
+
+    def test_explicit_list_wildcard(self, transfers_data):
+        """Test "*" as a list index is equivalent to the implicit form."""
+        assert project(transfers_data, ["transfers.*.date"]) == project(
+            transfers_data, ["transfers.date"]
+        )
+
+    def test_key_wildcard(self):
+        """Test "*" matches every key of a mapping."""
+        data = {
+            "clubFrom": {"id": "27", "name": "Bayern Munich"},
+            "clubTo": {"id": "131", "name": "FC Barcelona"},
+        }
+        assert project(data, ["*.name"]) == {
+            "clubFrom": {"name": "Bayern Munich"},
+            "clubTo": {"name": "FC Barcelona"},
+        }
+
+    def test_bare_wildcard_keeps_everything(self, transfers_data):
+        """Test "*" on its own returns the full payload."""
+        assert project(transfers_data, ["*"]) == transfers_data
+
+    def test_missing_paths_are_skipped(self, transfers_data):
+        """Test unknown paths do not raise or add keys."""
+        assert project(transfers_data, ["id", "nope.deeper"]) == {"id": "8198"}
+
+    def test_path_through_scalar_keeps_scalar(self):
+        """Test a path continuing past a scalar keeps the scalar."""
+        assert project({"club": "FC Barcelona"}, ["club.name"]) == {
+            "club": "FC Barcelona"
+        }
+
+
+class TestApplyProjection:
+    """Test cases for apply_projection function."""
+
+    def test_no_fields_returns_full_payload(self, transfers_data):
+        """Test the default server setting leaves results untouched."""
+        assert apply_projection(transfers_data, None, ["id"]) is transfers_data
+
+    def test_compact_alias_expands(self, transfers_data):
+        """Test "@compact" expands to the tool's compact paths."""
+        result = apply_projection(transfers_data, ["@compact", "updatedAt"], ["id"])
+        assert result == {"id": "8198", "updatedAt": "2024-01-01T00:00:00"}
+
+    def test_errors_are_not_projected(self):
+        """Test error dictionaries pass through."""
+        error = {"error": "Player not found"}
+        assert apply_projection(error, ["id"], ["id"]) == error
+
+    def test_stale_markers_are_kept(self, transfers_data):
+        """Test a stale response stays recognisable after projection."""
+        stale = dict(transfers_data, stale=True, cacheAge=42.0)
+        assert apply_projection(stale, ["id"], ["id"]) == {
+            "id": "8198",
+            "stale": True,
+            "cacheAge": 42.0,
+        }
+
+    @patch("transfermarkt_mcp.projection.config")
+    def test_compact_server_default(self, mock_config, transfers_data):
+        """Test DEFAULT_PROJECTION=compact applies when no fields are given."""
+        mock_config.default_projection = "compact"
+        assert apply_projection(transfers_data, None, ["id"]) == {"id": "8198"}
+        assert apply_projection(transfers_data, ["*"], ["id"]) == transfers_data
@@ -0,0 +1,268 @@
+"""Tests for the rate limiter and adaptive concurrency limit."""
+
+import asyncio
+import threading
+import pytest
+from unittest.mock import patch
+from transfermarkt_mcp.ratelimit import (
+    AdaptiveConcurrency,
+    SharedTokenBucket,
+    TokenBucket,
+)
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket class."""
+
+    @patch("transfermarkt_mcp.ratelimit.time.monotonic", return_value=100.0)
+    def test_burst_then_spaced_delays(self, mock_monotonic):
+        """Test tokens beyond the burst are spaced at the configured rate."""
+        bucket = TokenBucket(rate=10, burst=2)
+
+        delays = [bucket.reserve() for _ in range(4)]
+
+        assert delays == pytest.approx([0.0, 0.0, 0.1, 0.2])
+
+    @patch("transfermarkt_mcp.ratelimit.time.monotonic")
+    def test_tokens_refill_over_time(self, mock_monotonic):
+        """Test the bucket refills up to its burst size."""
+        mock_monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=10, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+
+        mock_monotonic.return_value = 200.0
+        assert [bucket.reserve() for _ in range(3)] == pytest.approx([0.0, 0.0, 0.1])
+
+    @patch("transfermarkt_mcp.ratelimit.time.monotonic", return_value=100.0)
+    def test_pause_holds_requests(self, mock_monotonic):
+        """Test a pause delays requests even with tokens available."""
+        bucket = TokenBucket(rate=10, burst=5)
+        bucket.pause(3)
+
+        assert bucket.reserve() == pytest.approx(3.0)
+
+    def test_zero_rate_disables_limit(self):
+        """Test a rate of 0 never delays."""
+        bucket = TokenBucket(rate=0)
+        assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+    @patch("transfermarkt_mcp.ratelimit.time.monotonic", return_value=100.0)
+    def test_try_acquire_never_borrows(self, mock_monotonic):
+        """Test try_acquire only takes tokens that are there."""
+        bucket = TokenBucket(rate=10, burst=2)
+
+        assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+        assert bucket.available() == 0.0
+        assert bucket.reserve() == pytest.approx(0.1)
+
+        bucket.pause(1)
+        mock_monotonic.return_value = 100.5
+        assert bucket.try_acquire() is False
+
+
+class TestSharedTokenBucket:
+    """Test cases for SharedTokenBucket class."""
+
+    @patch("transfermarkt_mcp.ratelimit.time.time", return_value=100.0)
+    def test_processes_draw_from_one_budget(self, mock_time, tmp_path):
+        """Test buckets opened on the same file share their tokens."""
+        path = str(tmp_path / "limits" / "ratelimit.sqlite3")
+        first = SharedTokenBucket(path, rate=10, burst=2)
+        second = SharedTokenBucket(path, rate=10, burst=2)
+
+        delays = [first.reserve(), second.reserve(), first.reserve(), second.reserve()]
+
+        assert delays == pytest.approx([0.0, 0.0, 0.1, 0.2])
+
+    @patch("transfermarkt_mcp.ratelimit.time.time", return_value=100.0)
+    def test_pause_holds_every_process(self, mock_time, tmp_path):
+        """Test a Retry-After pause taken by one bucket delays the others."""
+        path = str(tmp_path / "ratelimit.sqlite3")
+        first = SharedTokenBucket(path, rate=10, burst=5)
+        second = SharedTokenBucket(path, rate=10, burst=5)
+        first.pause(3)
+
+        assert second.reserve() == pytest.approx(3.0)
+        assert second.try_acquire() is False
+
+    @patch("transfermarkt_mcp.ratelimit.time.time", return_value=100.0)
+    def test_database_failure_limits_locally(self, mock_time, tmp_path):
+        """Test a broken database leaves a working per-process bucket."""
+        bucket = SharedTokenBucket(str(tmp_path / "ratelimit.sqlite3"), rate=10)
+        bucket._conn.close()
+
+        assert [bucket.reserve() for _ in range(2)] == pytest.approx([0.0, 0.1])
+
+    @patch("transfermarkt_mcp.ratelimit.time.time", return_value=100.0)
+    def test_zero_rate_only_reads_pauses(self, mock_time, tmp_path):
+        """Test an unlimited bucket checks for pauses without a write lock."""
+        path = str(tmp_path / "ratelimit.sqlite3")
+        first = SharedTokenBucket(path, rate=0, busy_timeout=0.1)
+        second = SharedTokenBucket(path, rate=0)
+        second.pause(3)
+
+        # Another process holding the write lock does not hold up a read
+        second._conn.execute("BEGIN IMMEDIATE")
+        assert first.reserve() == pytest.approx(3.0)
+        assert first.available() == 0.0
+        assert first._failed is False
+        second._conn.execute("ROLLBACK")
+
+    def test_async_methods_run_in_a_thread(self, tmp_path):
+        """Test the event loop's calls reach the database from a worker thread."""
+        bucket = SharedTokenBucket(str(tmp_path / "ratelimit.sqlite3"), rate=10)
+        threads = []
+        reserve = bucket.reserve
+
+        def record():
+            threads.append(threading.get_ident())
+            return reserve()
+
+        bucket.reserve = record
+
+        assert asyncio.run(bucket.areserve()) == 0.0
+        assert threads and threads[0] != threading.get_ident()
+
+
+class TestAdaptiveConcurrency:
+    """Test cases for AdaptiveConcurrency class."""
+
+    def test_successes_grow_limit_additively(self):
+        """Test a full window of successes adds about one slot."""
+        limiter = AdaptiveConcurrency(initial=4, max_limit=10)
+        for _ in range(4):
+            limiter.acquire()
+            limiter.release(latency=0.1)
+
+        assert limiter.limit == pytest.approx(4.9, abs=0.05)
+
+    def test_overload_halves_limit_once_per_window(self):
+        """Test a burst of 429s shrinks the limit once."""
+        limiter = AdaptiveConcurrency(initial=16)
+        for _ in range(3):
+            limiter.acquire()
+        for _ in range(3):
+            limiter.release(latency=0.5, overloaded=True)
+
+        assert limiter.stats()["limit"] == 8
+
+    def test_latency_rise_counts_as_overload(self):
+        """Test a sustained latency rise above the baseline shrinks the limit."""
+        limiter = AdaptiveConcurrency(initial=16, latency_factor=2.0)
+        for latency in [0.1] * 5 + [2.0] * 5:
+            limiter.acquire()
+            limiter.release(latency=latency)
+
+        assert limiter.stats()["limit"] < 16
+
+    def test_latency_ignored_by_default(self):
+        """Test latency alone never shrinks the limit unless opted in."""
+        limiter = AdaptiveConcurrency(initial=16)
+        for latency in [0.1] * 5 + [2.0] * 5:
+            limiter.acquire()
+            limiter.release(latency=latency)
+
+        assert limiter.stats()["limit"] >= 16
+
+    def test_mixed_endpoint_latencies_keep_limit(self):
+        """Test steady fast and slow endpoints are not mistaken for congestion."""
+        limiter = AdaptiveConcurrency(initial=16, latency_factor=2.0)
+        endpoints = {
+            "players/search/{name}": 0.03,
+            "clubs/search/{name}": 0.05,
+            "clubs/{id}/players": 0.4,
+            "players/{id}/stats": 0.6,
+        }
+        for _ in range(50):
+            for endpoint, latency in endpoints.items():
+                for jitter in (0.8, 1.0, 1.3):
+                    limiter.acquire()
+                    limiter.release(latency=latency * jitter, endpoint=endpoint)
+
+        assert limiter.stats()["limit"] >= 16
+
+    def test_limit_stays_within_bounds(self):
+        """Test the limit never leaves [min_limit, max_limit]."""
+        limiter = AdaptiveConcurrency(initial=2, min_limit=2, max_limit=3)
+        limiter.acquire()
+        limiter.release(latency=0.1, overloaded=True)
+        assert limiter.stats()["limit"] == 2
+        for _ in range(50):
+            limiter.acquire()
+            limiter.release(latency=0.1)
+        assert limiter.stats()["limit"] == 3
+
+    def test_threads_wait_for_a_slot(self):
+        """Test acquire blocks while the limit is reached."""
+        limiter = AdaptiveConcurrency(initial=1, max_limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def waiter():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        assert not acquired.wait(0.05)
+        limiter.release()
+        assert acquired.wait(1)
+        thread.join()
+
+    def test_coroutines_bounded_by_limit(self):
+        """Test at most ``limit`` coroutines hold a slot at once."""
+        limiter = AdaptiveConcurrency(initial=3, max_limit=3)
+        peak = 0
+
+        async def worker():
+            nonlocal peak
+            await limiter.aacquire()
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.001)
+            limiter.release()
+
+        async def run():
+            await asyncio.gather(*(worker() for _ in range(20)))
+
+        asyncio.run(run())
+
+        assert peak == 3
+        assert limiter.in_flight == 0
+
+    def test_cancelled_waiter_does_not_leak_slot(self):
+        """Test cancelling a waiting coroutine leaves the slot count intact."""
+        limiter = AdaptiveConcurrency(initial=1, max_limit=1)
+
+        async def run():
+            await limiter.aacquire()
+            waiter = asyncio.ensure_future(limiter.aacquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            limiter.release()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+
+        assert limiter.in_flight == 0
+        assert limiter.stats()["waiting"] == 0
+
+    def test_waiter_cancelled_after_handoff_returns_slot(self):
+        """Test a slot handed to a waiter that is then cancelled is released."""
+        limiter = AdaptiveConcurrency(initial=1, max_limit=1)
+
+        async def run():
+            await limiter.aacquire()
+            waiter = asyncio.ensure_future(limiter.aacquire())
+            await asyncio.sleep(0)
+            limiter.release()
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+
+        assert limiter.in_flight == 0
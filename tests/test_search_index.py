@@ -0,0 +1,182 @@
+"""Tests for the local search index and the resolve_name tool."""
+
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock
+from transfermarkt_mcp.search_index import SearchIndex, fold
+from transfermarkt_mcp.tools.search import resolve_name
+
+
+class TestFold:
+    """Test cases for name folding."""
+
+    def test_fold_strips_case_accents_and_punctuation(self):
+        """Test folded names compare equal across spellings."""
+        assert fold("Fenerbahçe") == "fenerbahce"
+        assert fold("Martin Ødegaard") == "martin odegaard"
+        assert fold("  Paris Saint-Germain ") == "paris saint germain"
+        assert fold("Ľudovít Štúr") == "ludovit stur"
+
+
+class TestSearchIndex:
+    """Test cases for SearchIndex class."""
+
+    @pytest.fixture
+    def index(self):
+        index = SearchIndex()
+        index.add("player", "8198", "Robert Lewandowski", position="Centre-Forward")
+        index.add("player", "28003", "Lionel Messi")
+        index.add("club", "610", "Fenerbahçe", country="Turkey")
+        index.add("club", "418", "Real Madrid")
+        return index
+
+    def test_exact_and_accent_folded_match(self, index):
+        """Test an exact folded name scores 1 and carries its info."""
+        assert index.lookup("club", "fenerbahce") == [
+            {"id": "610", "name": "Fenerbahçe", "score": 1.0, "country": "Turkey"}
+        ]
+
+    def test_surname_prefix_and_typo(self, index):
+        """Test surnames and misspellings still find the player."""
+        assert index.lookup("player", "messi")[0]["id"] == "28003"
+        assert index.lookup("player", "Lewandowsky")[0]["id"] == "8198"
+        assert index.lookup("club", "real mad")[0]["id"] == "418"
+
+    def test_kinds_are_separate(self, index):
+        """Test a lookup only returns entities of the requested kind."""
+        assert index.lookup("competition", "Real Madrid") == []
+
+    def test_unrelated_query_has_no_matches(self, index):
+        """Test weak matches are not returned."""
+        assert index.lookup("player", "zzzz") == []
+
+    def test_readding_replaces_name(self, index):
+        """Test re-indexing an entity drops its old name."""
+        index.add("club", "418", "Real Madrid CF")
+        assert [m["name"] for m in index.lookup("club", "real madrid")] == [
+            "Real Madrid CF"
+        ]
+        assert len(index) == 4
+
+    def test_oldest_entries_are_evicted(self):
+        """Test the index stays within max_entries."""
+        index = SearchIndex(max_entries=2)
+        index.add("club", "1", "Galatasaray")
+        index.add("club", "2", "Besiktas")
+        index.add("club", "3", "Trabzonspor")
+
+        assert index.lookup("club", "Galatasaray") == []
+        assert index.stats() == {"player": 0, "club": 2, "competition": 0}
+
+    def test_observe_indexes_searches_rosters_and_profiles(self):
+        """Test names are picked up from every kind of response."""
+        index = SearchIndex()
+        index.observe(
+            "players/search/Lewandowski",
+            {
+                "results": [
+                    {
+                        "id": "8198",
+                        "name": "Robert Lewandowski",
+                        "club": {"id": "131", "name": "Barcelona"},
+                    }
+                ]
+            },
+        )
+        index.observe(
+            "/clubs/27/players/", {"players": [{"id": "1", "name": "Harry Kane"}]}
+        )
+        index.observe(
+            "competitions/TR1/clubs", {"clubs": [{"id": "114", "name": "Galatasaray"}]}
+        )
+        index.observe("clubs/27/profile", {"id": "27", "name": "Bayern Munich"})
+        index.observe("players/1/stats", {"id": "1", "name": "Not indexed"})
+
+        assert index.lookup("player", "lewandowski")[0]["club"] == "Barcelona"
+        assert index.stats() == {"player": 2, "club": 2, "competition": 0}
+
+
+class TestResolveName:
+    """Test cases for resolve_name function."""
+
+    def test_resolve_name_validation(self):
+        """Test empty names, unknown kinds and bad limits are rejected."""
+        assert "cannot be empty" in asyncio.run(resolve_name(" "))["error"]
+        assert (
+            "Unknown kind" in asyncio.run(resolve_name("Messi", kind="coach"))["error"]
+        )
+        assert "Limit" in asyncio.run(resolve_name("Messi", limit=0))["error"]
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_resolve_name_from_index(self, mock_client):
+        """Test a known name is answered without an upstream call."""
+        index = SearchIndex()
+        index.add("club", "610", "Fenerbahçe")
+        with patch("transfermarkt_mcp.tools.search.index", index):
+            result = asyncio.run(resolve_name("Fenerbahce", kind="club"))
+
+        assert result["source"] == "index"
+        assert result["matches"][0]["id"] == "610"
+        mock_client.aget.assert_not_called()
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_resolve_name_falls_back_to_upstream(self, mock_client):
+        """Test a miss searches upstream and indexes the results."""
+        mock_client.aget.return_value = {
+            "results": [{"id": "28003", "name": "Lionel Messi"}]
+        }
+        index = SearchIndex()
+        with patch("transfermarkt_mcp.tools.search.index", index):
+            result = asyncio.run(resolve_name("Messi"))
+            again = asyncio.run(resolve_name("Messi"))
+
+        mock_client.aget.assert_called_once_with(
+            "players/search/Messi", params={"page_number": 1}
+        )
+        assert result["source"] == "upstream"
+        assert result["matches"][0]["id"] == "28003"
+        assert again["source"] == "index"
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_resolve_name_keeps_weak_upstream_matches(self, mock_client):
+        """Test upstream hits are ranked but never filtered out."""
+        mock_client.aget.return_value = {
+            "results": [
+                {"id": "28003", "name": "Lionel Messi", "position": "Right Winger"},
+                {"id": "102", "name": "Leonardo"},
+            ]
+        }
+        with patch("transfermarkt_mcp.tools.search.index", SearchIndex()):
+            result = asyncio.run(resolve_name("Leo"))
+
+        assert result["source"] == "upstream"
+        assert [match["id"] for match in result["matches"]] == ["102", "28003"]
+        assert result["matches"][1]["position"] == "Right Winger"
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_resolve_name_upstream_error(self, mock_client):
+        """Test an upstream error is returned as-is."""
+        mock_client.aget.return_value = {"error": "HTTP error 503"}
+        with patch("transfermarkt_mcp.tools.search.index", SearchIndex()):
+            result = asyncio.run(resolve_name("Messi"))
+
+        assert result == {"error": "HTTP error 503"}
+
+    @patch("transfermarkt_mcp.client.client", new_callable=AsyncMock)
+    def test_resolve_name_ranks_namesakes_upstream(self, mock_client):
+        """Test a name shared by indexed players is ranked by the upstream search."""
+        mock_client.aget.return_value = {
+            "results": [
+                {"id": "2", "name": "Ronaldo", "club": {"name": "Al-Nassr"}},
+                {"id": "1", "name": "Ronaldo", "club": {"name": "Retired"}},
+            ]
+        }
+        index = SearchIndex()
+        index.add("player", "1", "Ronaldo")
+        index.add("player", "2", "Ronaldo")
+        with patch("transfermarkt_mcp.tools.search.index", index):
+            result = asyncio.run(resolve_name("Ronaldo", limit=1))
+
+        assert [m["id"] for m in index.lookup("player", "Ronaldo")] == ["1", "2"]
+        assert result["source"] == "upstream"
+        assert [match["id"] for match in result["matches"]] == ["2"]
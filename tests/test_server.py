@@ -0,0 +1,17 @@
+"""Tests for MCP server setup."""
+
+import asyncio
+from fastmcp import Client
+from transfermarkt_mcp.server import create_mcp_server
+
+
+def test_create_mcp_server():
+    """Test the installed fastmcp accepts the server setup and lists the tools."""
+
+    async def run():
+        async with Client(create_mcp_server()) as mcp_client:
+            return await mcp_client.list_tools()
+
+    names = {tool.name for tool in asyncio.run(run())}
+
+    assert {"get_player_profile", "get_club_profile", "crawl_competition"} <= names
@@ -0,0 +1,117 @@
+"""Tests for request coalescing."""
+
+import asyncio
+import threading
+import pytest
+from transfermarkt_mcp.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for the thread-based SingleFlight class."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test callers arriving while a call is in flight share its result."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return {"id": "27"}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", fetch)))
+        leader.start()
+        started.wait()
+        followers = [
+            threading.Thread(target=lambda: results.append(flight.do("k", fetch)))
+            for _ in range(4)
+        ]
+        for follower in followers:
+            follower.start()
+        while flight.coalesced < 4:
+            pass
+        release.set()
+        for thread in [leader] + followers:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"id": "27"}] * 5
+
+    def test_sequential_calls_run_again(self):
+        """Test a finished call is not reused for later callers."""
+        flight = SingleFlight()
+        calls = []
+        flight.do("k", lambda: calls.append(1))
+        flight.do("k", lambda: calls.append(1))
+        assert len(calls) == 2
+
+    def test_errors_propagate_and_release_key(self):
+        """Test an exception reaches the caller and the key is freed."""
+        flight = SingleFlight()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            flight.do("k", fail)
+        assert flight.do("k", lambda: "ok") == "ok"
+
+
+class TestAsyncSingleFlight:
+    """Test cases for the asyncio-based AsyncSingleFlight class."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test concurrent awaits of one key run the coroutine once."""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"id": "27"}
+
+        async def run():
+            return await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert results == [{"id": "27"}] * 5
+        assert flight.coalesced == 4
+
+    def test_different_keys_run_independently(self):
+        """Test distinct keys are not coalesced."""
+        flight = AsyncSingleFlight()
+
+        async def fetch(value):
+            await asyncio.sleep(0)
+            return value
+
+        async def run():
+            return await asyncio.gather(
+                flight.do("a", lambda: fetch("a")), flight.do("b", lambda: fetch("b"))
+            )
+
+        assert asyncio.run(run()) == ["a", "b"]
+        assert flight.coalesced == 0
+
+    def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """Test cancelling one waiter leaves the others with a result."""
+        flight = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        async def run():
+            first = asyncio.create_task(flight.do("k", fetch))
+            second = asyncio.create_task(flight.do("k", fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()) == "done"
@@ -0,0 +1,173 @@
+"""Tests for snapshot export and import."""
+
+import asyncio
+import gzip
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+from transfermarkt_mcp.client import TransfermarktClient
+from transfermarkt_mcp.main import main
+from transfermarkt_mcp.search_index import SearchIndex
+from transfermarkt_mcp.snapshot import (
+    SnapshotRecord,
+    crawl,
+    load_snapshot,
+    read_snapshot,
+    write_snapshot,
+)
+
+RESPONSES = {
+    "competitions/TR1/clubs": {
+        "id": "TR1",
+        "name": "Süper Lig",
+        "clubs": [
+            {"id": "114", "name": "Galatasaray"},
+            {"id": "610", "name": "Fenerbahçe"},
+        ],
+    },
+    "clubs/114/profile": {"id": "114", "name": "Galatasaray"},
+    "clubs/114/players": {"players": [{"id": "1", "name": "Mauro Icardi"}]},
+    "clubs/610/profile": {"id": "610", "name": "Fenerbahçe"},
+    "clubs/610/players": {"error": "HTTP error 503: Service Unavailable"},
+    "players/1/market_value": {"id": "1", "marketValue": 10000000},
+}
+
+
+def fake_aget_many(calls):
+    return [RESPONSES[endpoint] for endpoint, _ in calls]
+
+
+class TestCrawl:
+    """Test cases for crawling competitions."""
+
+    def test_crawl_collects_competitions_clubs_and_players(self):
+        """Test every level is fetched and failures are reported."""
+        client = AsyncMock()
+        client.aget_many.side_effect = fake_aget_many
+
+        records, errors = asyncio.run(
+            crawl(client, ["TR1"], season_id="2024", player_facets=["market_value"])
+        )
+
+        assert [r.key for r in records] == [
+            "competitions/TR1/clubs?season_id=2024",
+            "clubs/114/profile",
+            "clubs/114/players?season_id=2024",
+            "clubs/610/profile",
+            "players/1/market_value",
+        ]
+        assert errors == [
+            {
+                "endpoint": "clubs/610/players",
+                "error": "HTTP error 503: Service Unavailable",
+            }
+        ]
+
+
+class TestSnapshotFile:
+    """Test cases for writing, reading and loading snapshot files."""
+
+    def test_round_trip(self, tmp_path):
+        """Test records survive a write and read unchanged."""
+        path = str(tmp_path / "snap.jsonl.gz")
+        records = [
+            SnapshotRecord(
+                "clubs/114/profile",
+                "clubs/114/profile",
+                1.5,
+                RESPONSES["clubs/114/profile"],
+            )
+        ]
+        write_snapshot(path, records, {"competitions": ["TR1"]})
+
+        header, read = read_snapshot(path)
+
+        assert header["competitions"] == ["TR1"]
+        assert header["records"] == 1
+        assert list(read) == records
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test plain and foreign files are refused."""
+        plain = tmp_path / "plain.json"
+        plain.write_text("{}")
+        foreign = tmp_path / "foreign.jsonl.gz"
+        with gzip.open(foreign, "wb") as out:
+            out.write(b'{"format": "other"}\n')
+
+        for path in (plain, foreign):
+            with pytest.raises(ValueError):
+                read_snapshot(str(path))
+
+    def test_load_warms_cache_and_index(self, tmp_path):
+        """Test fresh responses are cached, old ones kept stale or skipped."""
+        now = time.time()
+        path = str(tmp_path / "snap.jsonl.gz")
+        write_snapshot(
+            path,
+            [
+                SnapshotRecord(
+                    "clubs/114/profile",
+                    "clubs/114/profile",
+                    now - 60,
+                    {"id": "114", "name": "Galatasaray"},
+                ),
+                SnapshotRecord(
+                    "clubs/610/profile",
+                    "clubs/610/profile",
+                    now - 129600,
+                    {"id": "610", "name": "Fenerbahçe"},
+                ),
+                SnapshotRecord(
+                    "clubs/27/profile",
+                    "clubs/27/profile",
+                    now - 86400 * 30,
+                    {"id": "27", "name": "Bayern Munich"},
+                ),
+            ],
+        )
+        client = TransfermarktClient()
+        index = SearchIndex()
+
+        summary = load_snapshot(client, path, [index.observe])
+
+        assert summary["loaded"] == 2
+        assert summary["skipped"] == 1
+        assert client.cache.get("clubs/114/profile") == {
+            "id": "114",
+            "name": "Galatasaray",
+        }
+        # Club profiles live a day; a day and a half later only stale serving
+        # applies, and a month later they are beyond CACHE_STALE_IF_ERROR
+        assert client.cache.get("clubs/610/profile") is None
+        value, age = client.cache.get_stale("clubs/610/profile", 86400 * 7)
+        assert value["name"] == "Fenerbahçe"
+        assert age == pytest.approx(129600, abs=5)
+        assert index.lookup("club", "fenerbahce")[0]["id"] == "610"
+        assert index.lookup("club", "bayern")[0]["id"] == "27"
+
+
+class TestSnapshotCommand:
+    """Test cases for the snapshot subcommands."""
+
+    def test_export_then_import(self, tmp_path):
+        """Test the CLI writes a snapshot that import loads back."""
+        path = str(tmp_path / "tr1.jsonl.gz")
+        with patch("transfermarkt_mcp.client.client") as client:
+            client.aget_many = AsyncMock(side_effect=fake_aget_many)
+            client.aclose = AsyncMock()
+            with pytest.raises(SystemExit) as exit_code:
+                main(["snapshot", "export", path, "--competitions", "TR1"])
+        assert exit_code.value.code == 0
+        assert read_snapshot(path)[0]["competitions"] == ["TR1"]
+
+        with patch("transfermarkt_mcp.client.client", TransfermarktClient()) as client:
+            with pytest.raises(SystemExit) as exit_code:
+                main(["snapshot", "import", path])
+            assert exit_code.value.code == 0
+            assert client.cache.get("clubs/114/profile")["name"] == "Galatasaray"
+
+    def test_export_rejects_unknown_facets(self, tmp_path):
+        """Test unknown player facets fail before crawling."""
+        with pytest.raises(SystemExit) as exit_code:
+            main(["snapshot", "export", str(tmp_path / "x.gz"), "--players", "salary"])
+        assert exit_code.value.code == 2
@@ -0,0 +1,161 @@
+"""Tests for the transfer graph and the transfer network tool."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+from transfermarkt_mcp.transfer_graph import TransferGraph
+from transfermarkt_mcp.tools.network import query_transfer_network
+
+CLUBS = {
+    "36": "Fenerbahçe",
+    "141": "Galatasaray",
+    "114": "Beşiktaş",
+    "27": "Bayern Munich",
+    "31": "Liverpool",
+}
+
+
+def move(date, club_from, club_to, fee=None):
+    """One transfer history entry."""
+    return {
+        "date": date,
+        "clubFrom": {"id": club_from, "name": CLUBS[club_from]},
+        "clubTo": {"id": club_to, "name": CLUBS[club_to]},
+        "fee": fee,
+    }
+
+
+@pytest.fixture
+def graph():
+    graph = TransferGraph()
+    graph.add_history(
+        "1",
+        [
+            move("2018-07-01", "36", "141", "€10.00m"),
+            move("2021-07-01", "141", "27", "€30.00m"),
+        ],
+    )
+    graph.add_history(
+        "2",
+        [
+            move("2019-01-15", "141", "36", "loan transfer"),
+            move("2019-06-30", "36", "141", "End of loan"),
+        ],
+    )
+    graph.add_history("3", [move("2022-08-01", "114", "141", "€5.00m")])
+    graph.add_history("4", [move("2023-07-01", "27", "31", "?")])
+    return graph
+
+
+class TestTransferGraph:
+    """Test cases for the TransferGraph class."""
+
+    def test_neighbors(self, graph):
+        """Test partners are ranked by moves in both directions."""
+        neighbors = graph.neighbors("141")
+
+        assert [n["name"] for n in neighbors] == [
+            "Fenerbahçe",
+            "Bayern Munich",
+            "Beşiktaş",
+        ]
+        fenerbahce = neighbors[0]
+        assert (fenerbahce["players_in"], fenerbahce["players_out"]) == (2, 1)
+        assert fenerbahce["fees_paid"] == 10_000_000
+
+    def test_neighbors_in_window(self, graph):
+        """Test moves outside the date window are left out."""
+        neighbors = graph.neighbors("141", since="2021-01-01")
+        assert [n["id"] for n in neighbors] == ["27", "114"]
+
+    def test_directed_and_undirected_path(self, graph):
+        """Test chains of moves follow their direction unless told not to."""
+        hops = graph.path("114", "31")
+        assert [(hop["from"]["id"], hop["to"]["id"]) for hop in hops] == [
+            ("114", "141"),
+            ("141", "27"),
+            ("27", "31"),
+        ]
+        assert hops[1]["latest"]["fee"] == "€30.00m"
+
+        assert graph.path("31", "114") is None
+        assert graph.path("114", "31", max_hops=2) is None
+        assert len(graph.path("31", "114", directed=False)) == 3
+
+    def test_flow(self, graph):
+        """Test moves, loans and fees in and out of a club."""
+        flow = graph.flow("141")
+        assert (flow["moves_in"], flow["moves_out"]) == (3, 2)
+        assert (flow["loans_in"], flow["loans_out"]) == (1, 1)
+        assert flow["fees_paid"] == 15_000_000
+        assert flow["fees_received"] == 30_000_000
+        assert flow["net_spend"] == -15_000_000
+        assert flow["players"] == 3
+
+        between = graph.flow("141", "36")
+        assert (between["moves_in"], between["moves_out"]) == (2, 1)
+
+    def test_history_is_replaced(self, graph):
+        """Test a player's history seen again replaces its old edges."""
+        graph.add_history("4", [move("2023-07-01", "27", "36", "€1.00m")])
+
+        assert graph.neighbors("31") == []
+        assert graph.stats() == {"players": 4, "clubs": 4, "transfers": 6}
+
+    def test_oldest_players_are_evicted(self):
+        """Test the graph holds at most max_players histories."""
+        graph = TransferGraph(max_players=1)
+        graph.add_history("1", [move("2018-07-01", "36", "141")])
+        graph.add_history("2", [move("2019-07-01", "27", "31")])
+
+        assert graph.neighbors("36") == []
+        assert len(graph) == 1
+
+    def test_observe_transfer_histories(self):
+        """Test only transfer history responses are added."""
+        graph = TransferGraph()
+        history = {"id": "8198", "transfers": [move("2018-07-01", "36", "141")]}
+        graph.observe("players/8198/transfers", history)
+        graph.observe("players/8198/profile", history)
+
+        assert graph.stats()["transfers"] == 1
+
+
+class TestQueryTransferNetwork:
+    """Test cases for query_transfer_network function."""
+
+    def test_validation(self):
+        """Test unknown queries, missing clubs and bad arguments."""
+        assert (
+            "Unknown query"
+            in asyncio.run(query_transfer_network("cycles", "141"))["error"]
+        )
+        assert (
+            "cannot be empty"
+            in asyncio.run(query_transfer_network("flow", " "))["error"]
+        )
+        assert (
+            "other_club_id"
+            in asyncio.run(query_transfer_network("path", "141"))["error"]
+        )
+        assert (
+            "Invalid since"
+            in asyncio.run(query_transfer_network("flow", "141", since="last year"))[
+                "error"
+            ]
+        )
+
+    def test_queries(self, graph):
+        """Test each query answers from the graph."""
+        with patch("transfermarkt_mcp.tools.network.graph", graph):
+            neighbors = asyncio.run(query_transfer_network("neighbors", "141", limit=1))
+            path = asyncio.run(query_transfer_network("path", "36", "31"))
+            flow = asyncio.run(
+                query_transfer_network("flow", "141", since="Jan 1, 2020")
+            )
+
+        assert neighbors["club"] == {"id": "141", "name": "Galatasaray"}
+        assert [n["id"] for n in neighbors["neighbors"]] == ["36"]
+        assert neighbors["graph"]["players"] == 4
+        assert len(path["path"]) == 3
+        assert (flow["moves_in"], flow["moves_out"]) == (1, 1)